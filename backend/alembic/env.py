@@ -1,3 +1,4 @@
+import os
 from logging.config import fileConfig
 
 from sqlalchemy import engine_from_config
@@ -5,8 +6,9 @@ from sqlalchemy import pool
 
 from alembic import context
 
-# Import Base to provide metadata for autogenerate
+# Import Base (and register the models on it) to provide metadata for autogenerate
 from app.db.base import Base
+import app.models  # noqa: F401
 
 # this is the Alembic Config object, which provides
 # access to the values within the .ini file in use.
@@ -14,9 +16,14 @@ config = context.config
 
 # Interpret the config file for Python logging.
 # This line sets up loggers basically.
-if config.config_file_name is not None:
+# Skipped when embedded (a connection was passed in) to leave the caller's logging alone.
+if config.config_file_name is not None and "connection" not in config.attributes:
     fileConfig(config.config_file_name)
 
+# DATABASE_URL from the environment wins over alembic.ini, matching the app
+if os.getenv("DATABASE_URL") and "connection" not in config.attributes:
+    config.set_main_option("sqlalchemy.url", os.environ["DATABASE_URL"])
+
 # add your model's MetaData object here
 # for 'autogenerate' support
 # Alembic will inspect models via this metadata
@@ -59,6 +66,17 @@ def run_migrations_online() -> None:
     and associate a connection with the context.
 
     """
+    # A caller (e.g. the test suite) may hand us an open connection
+    connection = config.attributes.get("connection")
+    if connection is not None:
+        context.configure(
+            connection=connection, target_metadata=target_metadata
+        )
+
+        with context.begin_transaction():
+            context.run_migrations()
+        return
+
     connectable = engine_from_config(
         config.get_section(config.config_ini_section, {}),
         prefix="sqlalchemy.",
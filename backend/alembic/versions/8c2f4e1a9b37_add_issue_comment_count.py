@@ -0,0 +1,37 @@
+"""Add denormalized issues.comment_count
+
+Revision ID: 8c2f4e1a9b37
+Revises: 5d145f61a744
+Create Date: 2026-10-17 09:12:44.518203
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '8c2f4e1a9b37'
+down_revision: Union[str, Sequence[str], None] = '5d145f61a744'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.add_column(
+        'issues',
+        sa.Column('comment_count', sa.Integer(), nullable=False, server_default='0'),
+    )
+    # Backfill from the comments that already exist
+    op.execute(
+        "UPDATE issues SET comment_count = "
+        "(SELECT COUNT(*) FROM comments WHERE comments.issue_id = issues.id)"
+    )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    with op.batch_alter_table('issues') as batch_op:
+        batch_op.drop_column('comment_count')
@@ -0,0 +1,68 @@
+"""Add issue change versions and the deletions log
+
+Revision ID: a7d4e1f0c362
+Revises: f3c8d2b6a915
+Create Date: 2026-10-17 18:05:31.402117
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'a7d4e1f0c362'
+down_revision: Union[str, Sequence[str], None] = 'f3c8d2b6a915'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+CHANGED_VERSION_INDEX = ('ix_issues_project_id_changed_version', 'issues', ['project_id', 'changed_version', 'id'])
+
+
+def _is_postgresql() -> bool:
+    return op.get_bind().dialect.name == 'postgresql'
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.add_column(
+        'issues',
+        sa.Column('changed_version', sa.Integer(), nullable=False, server_default='0'),
+    )
+    op.create_table(
+        'issue_deletions',
+        sa.Column('id', sa.Integer(), nullable=False),
+        sa.Column('project_id', sa.Integer(), nullable=False),
+        sa.Column('issue_id', sa.Integer(), nullable=False),
+        sa.Column('changed_version', sa.Integer(), nullable=False),
+        sa.Column('deleted_at', sa.DateTime(timezone=True), server_default=sa.func.now(), nullable=True),
+        sa.ForeignKeyConstraint(['project_id'], ['projects.id']),
+        sa.PrimaryKeyConstraint('id'),
+    )
+    op.create_index(
+        'ix_issue_deletions_project_id_changed_version', 'issue_deletions',
+        ['project_id', 'changed_version', 'issue_id'], unique=False
+    )
+
+    name, table, columns = CHANGED_VERSION_INDEX
+    if _is_postgresql():
+        # CONCURRENTLY keeps issues writable but can't run inside a transaction
+        with op.get_context().autocommit_block():
+            op.create_index(name, table, columns, postgresql_concurrently=True)
+    else:
+        op.create_index(name, table, columns)
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    name, table, _ = CHANGED_VERSION_INDEX
+    if _is_postgresql():
+        with op.get_context().autocommit_block():
+            op.drop_index(name, table_name=table, postgresql_concurrently=True)
+    else:
+        op.drop_index(name, table_name=table)
+    op.drop_index('ix_issue_deletions_project_id_changed_version', table_name='issue_deletions')
+    op.drop_table('issue_deletions')
+    with op.batch_alter_table('issues') as batch_op:
+        batch_op.drop_column('changed_version')
@@ -0,0 +1,55 @@
+"""Add composite indexes for issue listing, filtering and counting
+
+Revision ID: b41d7c0e5f92
+Revises: 8c2f4e1a9b37
+Create Date: 2026-10-17 11:03:27.940115
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'b41d7c0e5f92'
+down_revision: Union[str, Sequence[str], None] = '8c2f4e1a9b37'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+INDEXES = [
+    ('ix_issues_project_id_created_at', 'issues', ['project_id', 'created_at', 'id']),
+    ('ix_issues_project_id_updated_at', 'issues', ['project_id', 'updated_at', 'id']),
+    ('ix_issues_project_id_status_created_at', 'issues', ['project_id', 'status', 'created_at', 'id']),
+    ('ix_issues_project_id_priority_created_at', 'issues', ['project_id', 'priority', 'created_at', 'id']),
+    ('ix_issues_project_id_assignee_id_created_at', 'issues', ['project_id', 'assignee_id', 'created_at', 'id']),
+    ('ix_issues_project_id_expected_completion_date', 'issues', ['project_id', 'expected_completion_date']),
+    ('ix_comments_issue_id_created_at', 'comments', ['issue_id', 'created_at']),
+    ('ix_project_members_user_id', 'project_members', ['user_id']),
+]
+
+
+def _is_postgresql() -> bool:
+    return op.get_bind().dialect.name == 'postgresql'
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    if _is_postgresql():
+        # CONCURRENTLY keeps the tables writable but can't run inside a transaction
+        with op.get_context().autocommit_block():
+            for name, table, columns in INDEXES:
+                op.create_index(name, table, columns, postgresql_concurrently=True)
+    else:
+        for name, table, columns in INDEXES:
+            op.create_index(name, table, columns)
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    if _is_postgresql():
+        with op.get_context().autocommit_block():
+            for name, table, _ in reversed(INDEXES):
+                op.drop_index(name, table_name=table, postgresql_concurrently=True)
+    else:
+        for name, table, _ in reversed(INDEXES):
+            op.drop_index(name, table_name=table)
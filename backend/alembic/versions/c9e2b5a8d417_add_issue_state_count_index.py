@@ -0,0 +1,45 @@
+"""Add covering index for per-state issue counts
+
+Revision ID: c9e2b5a8d417
+Revises: a7d4e1f0c362
+Create Date: 2026-10-17 19:22:47.815630
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'c9e2b5a8d417'
+down_revision: Union[str, Sequence[str], None] = 'a7d4e1f0c362'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+INDEX = ('ix_issues_project_id_status_expected_completion_date', 'issues',
+         ['project_id', 'status', 'expected_completion_date'])
+
+
+def _is_postgresql() -> bool:
+    return op.get_bind().dialect.name == 'postgresql'
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    name, table, columns = INDEX
+    if _is_postgresql():
+        # CONCURRENTLY keeps the table writable but can't run inside a transaction
+        with op.get_context().autocommit_block():
+            op.create_index(name, table, columns, postgresql_concurrently=True)
+    else:
+        op.create_index(name, table, columns)
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    name, table, _ = INDEX
+    if _is_postgresql():
+        with op.get_context().autocommit_block():
+            op.drop_index(name, table_name=table, postgresql_concurrently=True)
+    else:
+        op.drop_index(name, table_name=table)
@@ -0,0 +1,36 @@
+"""Add full-text search index for issues and comments
+
+Revision ID: d7a3e9c15b28
+Revises: b41d7c0e5f92
+Create Date: 2026-10-17 14:26:51.307462
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+
+from app.db.search import install_search_index, uninstall_search_index
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'd7a3e9c15b28'
+down_revision: Union[str, Sequence[str], None] = 'b41d7c0e5f92'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    bind = op.get_bind()
+    if bind.dialect.name == 'postgresql':
+        # GIN indexes are built CONCURRENTLY, outside the migration transaction
+        with op.get_context().autocommit_block():
+            install_search_index(bind, concurrently=True)
+    else:
+        # SQLite: creates the FTS5 table and triggers and indexes existing rows
+        install_search_index(bind)
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    uninstall_search_index(op.get_bind())
@@ -0,0 +1,38 @@
+"""Add version counters to projects and issues
+
+Revision ID: e5b9c2a7f410
+Revises: d7a3e9c15b28
+Create Date: 2026-10-17 15:12:08.640213
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'e5b9c2a7f410'
+down_revision: Union[str, Sequence[str], None] = 'd7a3e9c15b28'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.add_column(
+        'projects',
+        sa.Column('version', sa.Integer(), nullable=False, server_default='0'),
+    )
+    op.add_column(
+        'issues',
+        sa.Column('version', sa.Integer(), nullable=False, server_default='0'),
+    )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    with op.batch_alter_table('issues') as batch_op:
+        batch_op.drop_column('version')
+    with op.batch_alter_table('projects') as batch_op:
+        batch_op.drop_column('version')
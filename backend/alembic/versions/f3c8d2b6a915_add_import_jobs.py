@@ -0,0 +1,49 @@
+"""Add import jobs
+
+Revision ID: f3c8d2b6a915
+Revises: e5b9c2a7f410
+Create Date: 2026-10-17 16:40:12.118305
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'f3c8d2b6a915'
+down_revision: Union[str, Sequence[str], None] = 'e5b9c2a7f410'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.create_table(
+        'import_jobs',
+        sa.Column('id', sa.Integer(), nullable=False),
+        sa.Column('project_id', sa.Integer(), nullable=False),
+        sa.Column('user_id', sa.Integer(), nullable=False),
+        sa.Column('format', sa.String(length=10), nullable=False),
+        sa.Column('status', sa.Enum('running', 'completed', name='importstatus'), nullable=False),
+        sa.Column('rows_done', sa.Integer(), server_default='0', nullable=False),
+        sa.Column('bytes_done', sa.BigInteger(), server_default='0', nullable=False),
+        sa.Column('imported', sa.Integer(), server_default='0', nullable=False),
+        sa.Column('failed', sa.Integer(), server_default='0', nullable=False),
+        sa.Column('created_at', sa.DateTime(timezone=True), server_default=sa.func.now(), nullable=True),
+        sa.Column('updated_at', sa.DateTime(timezone=True), nullable=True),
+        sa.ForeignKeyConstraint(['project_id'], ['projects.id']),
+        sa.ForeignKeyConstraint(['user_id'], ['users.id']),
+        sa.PrimaryKeyConstraint('id'),
+    )
+    op.create_index(op.f('ix_import_jobs_id'), 'import_jobs', ['id'], unique=False)
+    op.create_index(op.f('ix_import_jobs_project_id'), 'import_jobs', ['project_id'], unique=False)
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index(op.f('ix_import_jobs_project_id'), table_name='import_jobs')
+    op.drop_index(op.f('ix_import_jobs_id'), table_name='import_jobs')
+    op.drop_table('import_jobs')
+    sa.Enum(name='importstatus').drop(op.get_bind(), checkfirst=True)
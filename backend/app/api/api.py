@@ -1,7 +1,9 @@
-from fastapi import APIRouter, Depends
+from fastapi import APIRouter, Depends, HTTPException, Response, status
 
-from app.api.endpoints import auth, projects, issues, comments
+from app.api.endpoints import auth, projects, issues, comments, exports, imports, events
+from app.core.config import settings
 from app.core.deps import get_current_user
+from app.core.metrics import CONTENT_TYPE, registry, runtime_metrics
 from app.models import User
 from app.schemas.user import User as UserSchema
 
@@ -26,7 +28,23 @@ api_router.include_router(issues.router, tags=["issues"])
 # Comment endpoints
 api_router.include_router(comments.router, tags=["comments"])
 
+# Export endpoints
+api_router.include_router(exports.router, tags=["exports"])
+
+# Import endpoints
+api_router.include_router(imports.router, tags=["imports"])
+
+# Project event streams
+api_router.include_router(events.router, tags=["events"])
+
 # Health check
 @api_router.get("/health")
 def health_check():
     return {"status": "healthy"}
+
+# Prometheus scrape endpoint; async so counters are read on the event loop that updates them
+@api_router.get("/metrics", include_in_schema=False)
+async def metrics():
+    if not settings.METRICS_ENABLED:
+        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Not found")
+    return Response(registry.render(runtime_metrics()), media_type=CONTENT_TYPE)
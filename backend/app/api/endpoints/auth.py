@@ -1,21 +1,44 @@
 from fastapi import APIRouter, Depends, HTTPException, status
 from sqlalchemy.orm import Session
 
-from app.core.security import verify_password, get_password_hash, create_access_token
+from app.core.security import (
+    PasswordHasherBusy,
+    create_access_token,
+    get_password_hash,
+    password_hasher,
+    verify_and_update_password,
+)
 from app.core.deps import get_current_user
-from app.db.base import get_db
+from app.db.session import get_session, run_db
 from app.models import User
 from app.schemas.user import UserCreate, UserLogin, User as UserSchema, Token
 
 router = APIRouter()
 
+def _hasher_busy() -> HTTPException:
+    return HTTPException(
+        status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+        detail="Too many sign-in requests in progress, please retry shortly",
+        headers={"Retry-After": "1"},
+    )
+
+def _find_user(db: Session, email: str):
+    return db.query(User).filter(User.email == email).first()
+
+def _save_user(db: Session, user: User):
+    db.add(user)
+    db.commit()
+    db.refresh(user)
+
+# Async so that the slow password hash runs on the dedicated hasher pool instead of
+# holding a request thread; database calls go through run_db (threadpool or async driver).
 @router.post("/signup", response_model=UserSchema)
-def signup(
+async def signup(
     user_data: UserCreate,
-    db: Session = Depends(get_db)
+    db: Session = Depends(get_session)
 ):
     # Check if email already exists
-    existing_user = db.query(User).filter(User.email == user_data.email).first()
+    existing_user = await run_db(db, _find_user, user_data.email)
     if existing_user:
         raise HTTPException(
             status_code=status.HTTP_400_BAD_REQUEST,
@@ -23,36 +46,50 @@ def signup(
         )
     
     # Create new user
-    hashed_password = get_password_hash(user_data.password)
+    try:
+        hashed_password = await password_hasher.run(get_password_hash, user_data.password)
+    except PasswordHasherBusy:
+        raise _hasher_busy()
     user = User(
         name=user_data.name,
         email=user_data.email,
         password_hash=hashed_password
     )
     
-    db.add(user)
-    db.commit()
-    db.refresh(user)
+    await run_db(db, _save_user, user)
     
     return user
 
 @router.post("/login", response_model=Token)
-def login(
+async def login(
     user_data: UserLogin,
-    db: Session = Depends(get_db)
+    db: Session = Depends(get_session)
 ):
     # Find user by email
-    user = db.query(User).filter(User.email == user_data.email).first()
+    user = await run_db(db, _find_user, user_data.email)
     
-    if not user or not verify_password(user_data.password, user.password_hash):
+    valid = False
+    if user:
+        try:
+            valid, new_hash = await password_hasher.run(
+                verify_and_update_password, user_data.password, user.password_hash
+            )
+        except PasswordHasherBusy:
+            raise _hasher_busy()
+    
+    if not valid:
         raise HTTPException(
             status_code=status.HTTP_401_UNAUTHORIZED,
             detail="Incorrect email or password",
             headers={"WWW-Authenticate": "Bearer"},
         )
     
+    # The stored hash uses an outdated cost; replace it now that we know the password
+    if new_hash:
+        user.password_hash = new_hash
+        await run_db(db, _save_user, user)
+    
     # Create access token
-    access_token = create_access_token(data={"sub": str(user.id)})
+    access_token = create_access_token(data={"sub": str(user.id), "name": user.name, "email": user.email})
     
     return {"access_token": access_token, "token_type": "bearer"}
-
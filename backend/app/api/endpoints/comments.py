@@ -1,34 +1,61 @@
 from typing import List
-from fastapi import APIRouter, Depends, HTTPException, status
+from fastapi import APIRouter, Depends, HTTPException, Request, status
 from sqlalchemy.orm import Session, joinedload
 
-from app.core.deps import get_current_user
-from app.db.base import get_db
-from app.models import User, Issue, Comment, ProjectMember
+from app.core.authz import get_membership
+from app.core.deps import Principal, get_current_principal
+from app.core.etag import not_modified, set_etag, weak_etag
+from app.core.events import event_broker
+from app.core.list_cache import invalidate_issue_lists
+from app.core.responses import FastJSONResponse, json_adapter
+from app.db.session import db_endpoint, get_session
+from app.db.versions import bump_issue_version, bump_project_version, issue_version
+from app.models import User, Issue, Comment
 from app.schemas.comment import CommentCreate, Comment as CommentSchema
+from app.schemas.user import User as UserSchema
 
 router = APIRouter()
 
-@router.get("/issues/{issue_id}/comments", response_model=List[CommentSchema])
+COMMENT_LIST_ADAPTER = json_adapter(List[CommentSchema])
+
+def _comment_item(row) -> CommentSchema:
+    author = None
+    if row.author_name is not None:
+        author = UserSchema.model_construct(
+            id=row.author_id,
+            name=row.author_name,
+            email=row.author_email,
+            created_at=row.author_created_at,
+        )
+    return CommentSchema.model_construct(
+        body=row.body,
+        id=row.id,
+        issue_id=row.issue_id,
+        author_id=row.author_id,
+        author=author,
+        created_at=row.created_at,
+    )
+
+@router.get("/issues/{issue_id}/comments", response_model=List[CommentSchema], response_class=FastJSONResponse)
+@db_endpoint
 def list_comments(
+    request: Request,
     issue_id: int,
-    db: Session = Depends(get_db),
-    current_user: User = Depends(get_current_user)
+    db: Session = Depends(get_session),
+    current_user: Principal = Depends(get_current_principal)
 ):
-    # Check if issue exists
-    issue = db.query(Issue).filter(Issue.id == issue_id).first()
+    # Check if issue exists; its version is all the ETag needs
+    issue = issue_version(db, issue_id)
     
     if not issue:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
             detail="Issue not found"
         )
+    project_id, version = issue
     
     # Check if user is a member of the project
-    member = db.query(ProjectMember).filter(
-        ProjectMember.project_id == issue.project_id,
-        ProjectMember.user_id == current_user.id
-    ).first()
+    member = get_membership(db, project_id, current_user.id)
     
     if not member:
         raise HTTPException(
@@ -36,19 +63,39 @@ def list_comments(
             detail="You are not a member of this project"
         )
     
-    # Get comments with author info
-    comments = db.query(Comment).options(
-        joinedload(Comment.author)
-    ).filter(Comment.issue_id == issue_id).order_by(Comment.created_at).all()
+    # New comments bump the issue version
+    etag = weak_etag("comments", issue_id, version)
+    unchanged = not_modified(request, etag)
+    if unchanged:
+        return unchanged
+    
+    # Get comments with author info as plain rows
+    rows = db.query(
+        Comment.id,
+        Comment.issue_id,
+        Comment.author_id,
+        Comment.body,
+        Comment.created_at,
+        User.name.label("author_name"),
+        User.email.label("author_email"),
+        User.created_at.label("author_created_at"),
+    ).outerjoin(User, Comment.author_id == User.id).filter(
+        Comment.issue_id == issue_id
+    ).order_by(Comment.created_at).all()
     
-    return comments
+    # Database rows need no validation; build the models and write the bytes directly
+    comments = [_comment_item(row) for row in rows]
+    response = FastJSONResponse(comments, adapter=COMMENT_LIST_ADAPTER)
+    set_etag(response, etag)
+    return response
 
 @router.post("/issues/{issue_id}/comments", response_model=CommentSchema)
+@db_endpoint
 def create_comment(
     issue_id: int,
     comment_data: CommentCreate,
-    db: Session = Depends(get_db),
-    current_user: User = Depends(get_current_user)
+    db: Session = Depends(get_session),
+    current_user: Principal = Depends(get_current_principal)
 ):
     # Check if issue exists
     issue = db.query(Issue).filter(Issue.id == issue_id).first()
@@ -60,10 +107,7 @@ def create_comment(
         )
     
     # Check if user is a member of the project
-    member = db.query(ProjectMember).filter(
-        ProjectMember.project_id == issue.project_id,
-        ProjectMember.user_id == current_user.id
-    ).first()
+    member = get_membership(db, issue.project_id, current_user.id)
     
     if not member:
         raise HTTPException(
@@ -79,12 +123,18 @@ def create_comment(
     )
     
     db.add(comment)
+    # The comment count shows in the issue and in the project's issue list
+    project_id = issue.project_id
+    version = bump_project_version(db, project_id)
+    bump_issue_version(db, issue_id, version)
     db.commit()
+    invalidate_issue_lists(project_id)
     db.refresh(comment)
     
     # Load with author
     comment = db.query(Comment).options(
         joinedload(Comment.author)
     ).filter(Comment.id == comment.id).first()
+    event_broker.publish(project_id, "comment.created", CommentSchema.model_validate(comment))
     
     return comment
@@ -0,0 +1,31 @@
+from typing import Optional
+from fastapi import APIRouter, Depends, Header
+from fastapi.responses import StreamingResponse
+from sqlalchemy.orm import Session
+
+from app.core.config import settings
+from app.core.deps import get_project_member
+from app.core.events import event_broker
+from app.db.session import get_session, release_session
+from app.models import ProjectMember
+
+router = APIRouter()
+
+@router.get("/projects/{project_id}/events")
+async def project_events(
+    project_id: int,
+    last_event_id: Optional[str] = Header(None, description="Resume after this event; sent by EventSource on reconnect"),
+    db: Session = Depends(get_session),
+    member: ProjectMember = Depends(get_project_member)
+):
+    """Server-Sent Events: issue.created/updated/deleted, issues.created/updated (batches), comment.created."""
+    # The stream may stay open for hours; don't hold the membership check's connection meanwhile
+    await release_session(db)
+    
+    subscription = event_broker.subscribe(project_id, last_event_id)
+    return StreamingResponse(
+        event_broker.stream(subscription, settings.EVENT_HEARTBEAT_SECONDS),
+        media_type="text/event-stream",
+        # Reverse proxies must pass events through as they come
+        headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"}
+    )
@@ -0,0 +1,33 @@
+from fastapi import APIRouter, Depends, Query
+from fastapi.responses import StreamingResponse
+from sqlalchemy.engine import Engine
+from sqlalchemy.orm import Session
+
+from app.core.deps import get_project_member
+from app.core.export import MEDIA_TYPES, stream_export
+from app.db.session import get_session, get_sync_engine, release_session, run_db
+from app.models import Project, ProjectMember
+
+router = APIRouter()
+
+def _project_key(db: Session, project_id: int) -> str:
+    return db.query(Project.key).filter(Project.id == project_id).scalar()
+
+@router.get("/projects/{project_id}/export")
+async def export_project(
+    project_id: int,
+    export_format: str = Query("ndjson", alias="format", pattern="^(ndjson|csv)$"),
+    include_comments: bool = Query(False, alias="comments", description="Nest each issue's comments in its row"),
+    db: Session = Depends(get_session),
+    engine: Engine = Depends(get_sync_engine),
+    member: ProjectMember = Depends(get_project_member)
+):
+    key = await run_db(db, _project_key, project_id)
+    # The rows are streamed from a connection of their own; don't hold this request's meanwhile
+    await release_session(db)
+    
+    return StreamingResponse(
+        stream_export(engine, project_id, export_format, include_comments),
+        media_type=MEDIA_TYPES[export_format],
+        headers={"Content-Disposition": f'attachment; filename="{key}-issues.{export_format}"'}
+    )
@@ -0,0 +1,94 @@
+from typing import List, Optional
+
+import anyio.from_thread
+from fastapi import APIRouter, Depends, HTTPException, Query, Request, status
+from fastapi.concurrency import run_in_threadpool
+from sqlalchemy.engine import Engine
+from sqlalchemy.orm import Session
+
+from app.core.deps import get_project_member, require_project_maintainer
+from app.core.importer import ImportConflict, ImportFileError, run_import
+from app.db.session import db_endpoint, get_session, get_sync_engine, run_db
+from app.models import ImportJob, ImportStatus, ProjectMember
+from app.schemas.import_job import ImportJob as ImportJobSchema, ImportResult
+
+router = APIRouter()
+
+def _body_chunks(request: Request):
+    """The request body as a plain iterator, for the worker thread the import runs in."""
+    stream = request.stream()
+    while True:
+        try:
+            chunk = anyio.from_thread.run(stream.__anext__)
+        except StopAsyncIteration:
+            return
+        if chunk:
+            yield chunk
+
+def _start_job(db: Session, project_id: int, user_id: int, import_format: str, resume: Optional[int]) -> int:
+    if resume is None:
+        job = ImportJob(project_id=project_id, user_id=user_id, format=import_format)
+        db.add(job)
+        db.flush()
+        job_id = job.id
+        db.commit()
+        return job_id
+    
+    job = db.query(ImportJob).filter(ImportJob.id == resume, ImportJob.project_id == project_id).first()
+    if not job:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail="Import job not found"
+        )
+    if job.status == ImportStatus.completed:
+        raise HTTPException(
+            status_code=status.HTTP_409_CONFLICT,
+            detail="Import job already completed"
+        )
+    if job.format != import_format:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=f"Import job reads {job.format}, not {import_format}"
+        )
+    job_id = job.id
+    # Release the connection; the import uses its own
+    db.commit()
+    return job_id
+
+@router.post("/projects/{project_id}/import", response_model=ImportResult)
+async def import_issues(
+    project_id: int,
+    request: Request,
+    import_format: str = Query("ndjson", alias="format", pattern="^(ndjson|csv)$"),
+    resume: Optional[int] = Query(None, description="Continue this import job; send the same file from the start"),
+    db: Session = Depends(get_session),
+    engine: Engine = Depends(get_sync_engine),
+    maintainer: ProjectMember = Depends(require_project_maintainer)
+):
+    job_id = await run_db(db, _start_job, project_id, maintainer.user_id, import_format, resume)
+    
+    # Parsing and writing run on one worker thread, which pulls the body from the event loop as it goes
+    try:
+        return await run_in_threadpool(run_import, engine, job_id, _body_chunks(request))
+    except ImportFileError as exc:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=f"{exc}; the import stopped after its last committed batch (job {job_id})"
+        )
+    except ImportConflict:
+        raise HTTPException(
+            status_code=status.HTTP_409_CONFLICT,
+            detail="Import job is being resumed by another request"
+        )
+
+@router.get("/projects/{project_id}/imports", response_model=List[ImportJobSchema])
+@db_endpoint
+def list_imports(
+    project_id: int,
+    limit: int = Query(20, ge=1, le=100),
+    db: Session = Depends(get_session),
+    member: ProjectMember = Depends(get_project_member)
+):
+    return db.query(ImportJob).filter(
+        ImportJob.project_id == project_id
+    ).order_by(ImportJob.id.desc()).limit(limit).all()
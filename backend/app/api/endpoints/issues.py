@@ -1,37 +1,189 @@
 from typing import List, Optional
-from fastapi import APIRouter, Depends, HTTPException, Query, status
-from sqlalchemy.orm import Session, joinedload
-from sqlalchemy import or_, and_, func
+from fastapi import APIRouter, Depends, HTTPException, Query, Request, Response, status
+from sqlalchemy.orm import Session, aliased, joinedload
+from sqlalchemy import bindparam, update
 
-from app.core.deps import get_current_user, get_project_member, require_project_maintainer
-from app.db.base import get_db
-from app.models import User, Project, Issue, Comment, ProjectMember, MemberRole, IssueStatus, IssuePriority
+from app.core.authz import get_member_role, get_membership
+from app.core.cache import MISSING
+from app.core.deps import Principal, get_current_principal, get_project_member
+from app.core.etag import not_modified, set_etag, weak_etag
+from app.core.events import event_broker
+from app.core.list_cache import invalidate_issue_lists, issue_list_cache, issue_list_key
+from app.core.pagination import cursor_for, keyset_after, keyset_column, keyset_value, read_cursor
+from app.core.responses import FastJSONResponse, json_adapter
+from app.core.singleflight import coalesced
+from app.db.session import db_endpoint, get_session
+from app.db.bulk import insert_returning_ids
+from app.db.search import search_filter, search_issues
+from app.db.versions import bump_issue_version, bump_project_version, issue_version, project_version
+from app.models import User, Issue, IssueDeletion, ProjectMember, MemberRole, IssueStatus, IssuePriority
 from app.schemas.issue import (
     IssueCreate,
     IssueUpdate,
     Issue as IssueSchema,
     IssueList,
-    IssueFilter
+    IssueSearchResult,
+    IssueChanges,
+    IssueBatchCreate,
+    IssueBatchUpdate,
+    IssueBatchItemResult,
+    IssueBatchResult
 )
+from app.schemas.user import User as UserSchema
 
 router = APIRouter()
 
+# Columns list_issues reads from issues, in IssueList field order
+LIST_COLUMNS = (
+    Issue.id,
+    Issue.project_id,
+    Issue.title,
+    Issue.status,
+    Issue.priority,
+    Issue.expected_completion_date,
+    Issue.created_at,
+    Issue.updated_at,
+    Issue.comment_count,
+)
+ISSUE_LIST_ADAPTER = json_adapter(List[IssueList])
+ISSUE_CHANGES_ADAPTER = json_adapter(IssueChanges)
+
+def _user_columns(user, prefix: str):
+    return (
+        user.id.label(f"{prefix}_id"),
+        user.name.label(f"{prefix}_name"),
+        user.email.label(f"{prefix}_email"),
+        user.created_at.label(f"{prefix}_created_at"),
+    )
+
+def _issue_list_item(row) -> IssueList:
+    assignee = None
+    if row.assignee_id is not None:
+        assignee = UserSchema.model_construct(
+            id=row.assignee_id,
+            name=row.assignee_name,
+            email=row.assignee_email,
+            created_at=row.assignee_created_at,
+        )
+    return IssueList.model_construct(
+        id=row.id,
+        project_id=row.project_id,
+        title=row.title,
+        status=row.status,
+        priority=row.priority,
+        reporter=UserSchema.model_construct(
+            id=row.reporter_id,
+            name=row.reporter_name,
+            email=row.reporter_email,
+            created_at=row.reporter_created_at,
+        ),
+        assignee=assignee,
+        expected_completion_date=row.expected_completion_date,
+        created_at=row.created_at,
+        updated_at=row.updated_at,
+        comment_count=row.comment_count,
+    )
+
+def _issue_list_response(body: bytes, next_cursor: Optional[str], etag: str) -> Response:
+    response = Response(body, media_type="application/json")
+    set_etag(response, etag)
+    if next_cursor:
+        response.headers["X-Next-Cursor"] = next_cursor
+    return response
+
+def _issue_page(
+    db: Session,
+    cache_key: tuple,
+    project_id: int,
+    q: Optional[str],
+    status: Optional[IssueStatus],
+    priority: Optional[IssuePriority],
+    assignee_id: Optional[int],
+    sort: str,
+    order: str,
+    page: int,
+    per_page: int,
+    cursor: Optional[str],
+):
+    """Query and render one list_issues page as ``(body, next_cursor)``, and cache it."""
+    dialect_name = db.get_bind().dialect.name
+    
+    # Only the listed columns, with both users joined in; description is never read
+    reporter = aliased(User, name="reporter")
+    assignee = aliased(User, name="assignee")
+    query = db.query(*LIST_COLUMNS, *_user_columns(reporter, "reporter"), *_user_columns(assignee, "assignee")).join(
+        reporter, Issue.reporter_id == reporter.id
+    ).outerjoin(
+        assignee, Issue.assignee_id == assignee.id
+    ).filter(Issue.project_id == project_id)
+    
+    # Apply filters
+    if q:
+        query = query.filter(search_filter(dialect_name, q))
+    if status:
+        query = query.filter(Issue.status == status)
+    if priority:
+        query = query.filter(Issue.priority == priority)
+    if assignee_id:
+        query = query.filter(Issue.assignee_id == assignee_id)
+    
+    # Apply sorting, with id as a tiebreaker so pages are stable
+    sort_column = getattr(Issue, sort)
+    cursor_column = keyset_column(sort_column, dialect_name)
+    if order == "desc":
+        query = query.order_by(sort_column.desc(), Issue.id.desc())
+    else:
+        query = query.order_by(sort_column.asc(), Issue.id.asc())
+    
+    # Keyset pagination when a cursor is given, offset pagination otherwise
+    try:
+        after = read_cursor(cursor, s=sort, o=order)
+    except ValueError as exc:
+        raise HTTPException(
+            status_code=400,
+            detail=str(exc)
+        )
+    if after:
+        query = query.filter(keyset_after(
+            cursor_column,
+            Issue.id,
+            keyset_value(sort_column, after["v"], dialect_name),
+            after["i"],
+            descending=order == "desc",
+            dialect_name=dialect_name
+        ))
+    else:
+        query = query.offset((page - 1) * per_page)
+    
+    rows = query.add_columns(cursor_column.label("cursor_value")).limit(per_page).all()
+    
+    # Rows come straight from the database, so build the models without validating them
+    # and serialize once here instead of letting FastAPI validate the list again
+    body = ISSUE_LIST_ADAPTER.dump_json([_issue_list_item(row) for row in rows])
+    
+    # A full page may have more after it
+    next_cursor = None
+    if len(rows) == per_page:
+        last = rows[-1]
+        next_cursor = cursor_for({"s": sort, "o": order}, last.cursor_value, last.id)
+    
+    issue_list_cache.set(cache_key, body, next_cursor)
+    return body, next_cursor
+
 @router.post("/projects/{project_id}/issues", response_model=IssueSchema)
+@db_endpoint
 def create_issue(
     project_id: int,
     issue_data: IssueCreate,
-    db: Session = Depends(get_db),
-    current_user: User = Depends(get_current_user),
+    db: Session = Depends(get_session),
+    current_user: Principal = Depends(get_current_principal),
     member: ProjectMember = Depends(get_project_member)
 ):
     # Verify assignee is a project member if provided
     if issue_data.assignee_id:
-        assignee_member = db.query(ProjectMember).filter(
-            ProjectMember.project_id == project_id,
-            ProjectMember.user_id == issue_data.assignee_id
-        ).first()
+        assignee_role = get_member_role(db, project_id, issue_data.assignee_id)
         
-        if not assignee_member:
+        if assignee_role is None:
             raise HTTPException(
                 status_code=status.HTTP_400_BAD_REQUEST,
                 detail="Assignee must be a project member"
@@ -49,8 +201,10 @@ def create_issue(
         expected_completion_date=issue_data.expected_completion_date
     )
     
+    issue.changed_version = bump_project_version(db, project_id)
     db.add(issue)
     db.commit()
+    invalidate_issue_lists(project_id)
     db.refresh(issue)
     
     # Load relationships
@@ -58,13 +212,150 @@ def create_issue(
         joinedload(Issue.reporter),
         joinedload(Issue.assignee)
     ).filter(Issue.id == issue.id).first()
+    event_broker.publish(project_id, "issue.created", IssueSchema.model_validate(issue))
     
     return issue
 
-@router.get("/projects/{project_id}/issues", response_model=List[IssueList])
+def _project_member_ids(db: Session, project_id: int, user_ids) -> set:
+    """Which of ``user_ids`` belong to the project, in one query."""
+    if not user_ids:
+        return set()
+    return {user_id for user_id, in db.query(ProjectMember.user_id).filter(
+        ProjectMember.project_id == project_id,
+        ProjectMember.user_id.in_(user_ids)
+    )}
+
+def _batch_result(results: List[IssueBatchItemResult]) -> IssueBatchResult:
+    failed = sum(1 for result in results if result.status_code >= 400)
+    return IssueBatchResult(succeeded=len(results) - failed, failed=failed, results=results)
+
+@router.post("/projects/{project_id}/issues:batch", response_model=IssueBatchResult)
+@db_endpoint
+def create_issues_batch(
+    project_id: int,
+    batch: IssueBatchCreate,
+    db: Session = Depends(get_session),
+    current_user: Principal = Depends(get_current_principal),
+    member: ProjectMember = Depends(get_project_member)
+):
+    # Check every assignee at once
+    members = _project_member_ids(db, project_id, {item.assignee_id for item in batch.issues if item.assignee_id})
+    
+    results = [None] * len(batch.issues)
+    rows = []
+    indexes = []
+    for index, item in enumerate(batch.issues):
+        if item.assignee_id and item.assignee_id not in members:
+            results[index] = IssueBatchItemResult(
+                index=index, status_code=status.HTTP_400_BAD_REQUEST, detail="Assignee must be a project member"
+            )
+            continue
+        rows.append({
+            "project_id": project_id,
+            "title": item.title,
+            "description": item.description,
+            "priority": item.priority,
+            "status": IssueStatus.open,
+            "reporter_id": current_user.id,
+            "assignee_id": item.assignee_id,
+            "expected_completion_date": item.expected_completion_date,
+        })
+        indexes.append(index)
+    
+    # Multi-row INSERT ... RETURNING, one statement per chunk of rows
+    if rows:
+        version = bump_project_version(db, project_id)
+        ids = insert_returning_ids(db, Issue, [{**row, "changed_version": version} for row in rows])
+        for index, issue_id in zip(indexes, ids):
+            results[index] = IssueBatchItemResult(index=index, id=issue_id, status_code=status.HTTP_201_CREATED)
+        db.commit()
+        invalidate_issue_lists(project_id)
+        # One event for the whole batch; a batch can be larger than a subscriber's queue
+        event_broker.publish(project_id, "issues.created", {"ids": ids})
+    
+    return _batch_result(results)
+
+@router.patch("/projects/{project_id}/issues:batch", response_model=IssueBatchResult)
+@db_endpoint
+def update_issues_batch(
+    project_id: int,
+    batch: IssueBatchUpdate,
+    db: Session = Depends(get_session),
+    current_user: Principal = Depends(get_current_principal),
+    member: ProjectMember = Depends(get_project_member)
+):
+    # Load what the permission checks need for every issue in one query
+    requested_ids = {item.id for item in batch.issues}
+    reporters = dict(db.query(Issue.id, Issue.reporter_id).filter(
+        Issue.project_id == project_id,
+        Issue.id.in_(requested_ids)
+    ).all())
+    members = _project_member_ids(db, project_id, {item.assignee_id for item in batch.issues if item.assignee_id})
+    
+    results = [None] * len(batch.issues)
+    # Changed columns -> [(issue id, values)], so each group is one statement
+    groups = {}
+    seen = set()
+    for index, item in enumerate(batch.issues):
+        if item.id not in reporters:
+            error = (status.HTTP_404_NOT_FOUND, "Issue not found in this project")
+        elif item.id in seen:
+            error = (status.HTTP_400_BAD_REQUEST, "Issue appears more than once in the batch")
+        elif (item.status or item.assignee_id is not None) and (
+            member.role != MemberRole.maintainer and reporters[item.id] != current_user.id
+        ):
+            error = (status.HTTP_403_FORBIDDEN, "Only project maintainers or the reporter can change status/assignee")
+        elif item.assignee_id and item.assignee_id not in members:
+            error = (status.HTTP_400_BAD_REQUEST, "Assignee must be a project member")
+        else:
+            error = None
+        if error:
+            results[index] = IssueBatchItemResult(index=index, id=item.id, status_code=error[0], detail=error[1])
+            continue
+        seen.add(item.id)
+        values = item.model_dump(exclude_unset=True, exclude={"id"})
+        groups.setdefault(tuple(sorted(values)), []).append((item.id, values))
+        results[index] = IssueBatchItemResult(index=index, id=item.id, status_code=status.HTTP_200_OK)
+    
+    if seen:
+        issues = Issue.__table__
+        version = bump_project_version(db, project_id)
+        for columns, changes in groups.items():
+            distinct_values = {tuple(values[column] for column in columns) for _, values in changes}
+            if len(distinct_values) == 1:
+                # The common case, e.g. closing every issue of a release: one UPDATE ... WHERE id IN
+                db.execute(
+                    update(issues)
+                    .where(issues.c.id.in_([issue_id for issue_id, _ in changes]))
+                    .values(**changes[0][1], version=issues.c.version + 1, changed_version=version)
+                )
+            else:
+                # executemany; bind names must differ from the column names
+                db.execute(
+                    update(issues)
+                    .where(issues.c.id == bindparam("issue_id"))
+                    .values({
+                        **{column: bindparam(f"new_{column}") for column in columns},
+                        "version": issues.c.version + 1,
+                        "changed_version": version,
+                    }),
+                    [
+                        {"issue_id": issue_id, **{f"new_{column}": value for column, value in values.items()}}
+                        for issue_id, values in changes
+                    ]
+                )
+        db.commit()
+        invalidate_issue_lists(project_id)
+        event_broker.publish(project_id, "issues.updated", {"ids": sorted(seen)})
+    
+    return _batch_result(results)
+
+@router.get("/projects/{project_id}/issues", response_model=List[IssueList], response_class=FastJSONResponse)
+@db_endpoint
 def list_issues(
+    request: Request,
     project_id: int,
-    q: Optional[str] = Query(None, description="Search in title"),
+    q: Optional[str] = Query(None, description="Full-text search in title, description and comments"),
     status: Optional[IssueStatus] = None,
     priority: Optional[IssuePriority] = None,
     assignee_id: Optional[int] = None,
@@ -72,80 +363,163 @@ def list_issues(
     order: str = Query("desc", regex="^(asc|desc)$"),
     page: int = Query(1, ge=1),
     per_page: int = Query(20, ge=1, le=100),
-    db: Session = Depends(get_db),
+    cursor: Optional[str] = Query(None, description="Opaque X-Next-Cursor value from a previous page; takes precedence over page"),
+    db: Session = Depends(get_session),
     member: ProjectMember = Depends(get_project_member)
 ):
-    # Base query
-    query = db.query(Issue).filter(Issue.project_id == project_id)
+    # Every issue or comment write bumps the project version, so a matching ETag
+    # means no page of this list can have changed
+    version = project_version(db, project_id)
+    etag = weak_etag("issues", project_id, version)
+    unchanged = not_modified(request, etag)
+    if unchanged:
+        return unchanged
     
-    # Apply filters
-    if q:
-        query = query.filter(Issue.title.ilike(f"%{q}%"))
-    if status:
-        query = query.filter(Issue.status == status)
-    if priority:
-        query = query.filter(Issue.priority == priority)
-    if assignee_id:
-        query = query.filter(Issue.assignee_id == assignee_id)
+    # Same page at the same project version: reuse the bytes another caller already paid for
+    cache_key = issue_list_key(project_id, version, q, status, priority, assignee_id, sort, order, page, per_page, cursor)
+    cached = issue_list_cache.get(cache_key)
+    if cached is not MISSING:
+        return _issue_list_response(*cached, etag)
     
-    # Apply sorting
-    sort_column = getattr(Issue, sort)
-    if order == "desc":
-        query = query.order_by(sort_column.desc())
-    else:
-        query = query.order_by(sort_column.asc())
+    # Concurrent identical requests share one query; each caller has passed its own membership check
+    body, next_cursor = coalesced(("list_issues",) + cache_key, lambda: _issue_page(
+        db, cache_key, project_id, q, status, priority, assignee_id, sort, order, page, per_page, cursor
+    ))
+    return _issue_list_response(body, next_cursor, etag)
+
+@router.get("/projects/{project_id}/issues/changes", response_model=IssueChanges, response_class=FastJSONResponse)
+@db_endpoint
+def list_issue_changes(
+    project_id: int,
+    since: Optional[str] = Query(None, description="Watermark from a previous response; omit for every issue"),
+    limit: int = Query(500, ge=1, le=1000),
+    db: Session = Depends(get_session),
+    member: ProjectMember = Depends(get_project_member)
+):
+    # The watermark is the (changed_version, id) of the last change the client has
+    try:
+        after = read_cursor(since, p=project_id)
+        version, last_id = (after["v"], after["i"]) if after else (0, 0)
+        # Unlike a sort value, a watermark's version is always an integer
+        if not isinstance(version, int) or isinstance(version, bool):
+            raise ValueError("Malformed watermark")
+    except ValueError:
+        raise HTTPException(
+            status_code=400,
+            detail="Invalid watermark"
+        )
+    dialect_name = db.get_bind().dialect.name
     
-    # Pagination
-    offset = (page - 1) * per_page
-    issues = query.options(
+    # Issues and tombstones after the watermark, each from its (project_id, changed_version, id) index
+    reporter = aliased(User, name="reporter")
+    assignee = aliased(User, name="assignee")
+    rows = db.query(*LIST_COLUMNS, *_user_columns(reporter, "reporter"), *_user_columns(assignee, "assignee")).add_columns(
+        Issue.changed_version
+    ).join(
+        reporter, Issue.reporter_id == reporter.id
+    ).outerjoin(
+        assignee, Issue.assignee_id == assignee.id
+    ).filter(
+        Issue.project_id == project_id,
+        keyset_after(Issue.changed_version, Issue.id, version, last_id, descending=False, dialect_name=dialect_name)
+    ).order_by(Issue.changed_version.asc(), Issue.id.asc()).limit(limit + 1).all()
+    
+    deletions = []
+    if after:
+        deletions = db.query(IssueDeletion.changed_version, IssueDeletion.issue_id).filter(
+            IssueDeletion.project_id == project_id,
+            keyset_after(
+                IssueDeletion.changed_version,
+                IssueDeletion.issue_id,
+                version,
+                last_id,
+                descending=False,
+                dialect_name=dialect_name
+            )
+        ).order_by(IssueDeletion.changed_version.asc(), IssueDeletion.issue_id.asc()).limit(limit + 1).all()
+    
+    # Merge both in watermark order and stop at the limit
+    changes = sorted(
+        [(row.changed_version, row.id, row) for row in rows] + [(v, issue_id, None) for v, issue_id in deletions],
+        key=lambda change: change[:2]
+    )
+    has_more = len(changes) > limit
+    changes = changes[:limit]
+    if changes:
+        version, last_id = changes[-1][:2]
+    
+    return FastJSONResponse(IssueChanges.model_construct(
+        issues=[_issue_list_item(row) for _, _, row in changes if row is not None],
+        deleted=[issue_id for _, issue_id, row in changes if row is None],
+        watermark=cursor_for({"p": project_id}, version, last_id),
+        has_more=has_more,
+    ), adapter=ISSUE_CHANGES_ADAPTER)
+
+@router.get("/projects/{project_id}/issues/search", response_model=List[IssueSearchResult])
+@db_endpoint
+def search_project_issues(
+    project_id: int,
+    q: str = Query(..., min_length=1, description="Words to find in titles, descriptions and comments"),
+    page: int = Query(1, ge=1),
+    per_page: int = Query(20, ge=1, le=100),
+    db: Session = Depends(get_session),
+    member: ProjectMember = Depends(get_project_member)
+):
+    hits = search_issues(db, project_id, q, limit=per_page, offset=(page - 1) * per_page)
+    if not hits:
+        return []
+    
+    issues = db.query(Issue).options(
         joinedload(Issue.reporter),
         joinedload(Issue.assignee)
-    ).offset(offset).limit(per_page).all()
+    ).filter(Issue.id.in_([issue_id for issue_id, _, _ in hits])).all()
+    issues_by_id = {issue.id: issue for issue in issues}
     
-    # Add comment count
+    # Keep the ranking order from the search index
     result = []
-    for issue in issues:
-        comment_count = db.query(Comment).filter(Comment.issue_id == issue.id).count()
-        
-        issue_dict = {
-            "id": issue.id,
-            "project_id": issue.project_id,
-            "title": issue.title,
-            "status": issue.status,
-            "priority": issue.priority,
-            "reporter": issue.reporter,
-            "assignee": issue.assignee,
-            "expected_completion_date": issue.expected_completion_date,
-            "created_at": issue.created_at,
-            "updated_at": issue.updated_at,
-            "comment_count": comment_count
-        }
-        result.append(IssueList(**issue_dict))
+    for issue_id, rank, snippet in hits:
+        issue = issues_by_id.get(issue_id)
+        if issue is None:
+            continue
+        result.append(IssueSearchResult(
+            id=issue.id,
+            project_id=issue.project_id,
+            title=issue.title,
+            status=issue.status,
+            priority=issue.priority,
+            reporter=issue.reporter,
+            assignee=issue.assignee,
+            expected_completion_date=issue.expected_completion_date,
+            created_at=issue.created_at,
+            updated_at=issue.updated_at,
+            comment_count=issue.comment_count,
+            rank=rank,
+            snippet=snippet
+        ))
     
     return result
 
 @router.get("/issues/{issue_id}", response_model=IssueSchema)
+@db_endpoint
 def get_issue(
+    request: Request,
     issue_id: int,
-    db: Session = Depends(get_db),
-    current_user: User = Depends(get_current_user)
+    response: Response,
+    db: Session = Depends(get_session),
+    current_user: Principal = Depends(get_current_principal)
 ):
-    issue = db.query(Issue).options(
-        joinedload(Issue.reporter),
-        joinedload(Issue.assignee)
-    ).filter(Issue.id == issue_id).first()
+    # Check if issue exists; its version is all the ETag needs
+    found = issue_version(db, issue_id)
     
-    if not issue:
+    if not found:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
             detail="Issue not found"
         )
+    project_id, version = found
     
     # Check if user is a member of the project
-    member = db.query(ProjectMember).filter(
-        ProjectMember.project_id == issue.project_id,
-        ProjectMember.user_id == current_user.id
-    ).first()
+    member = get_membership(db, project_id, current_user.id)
     
     if not member:
         raise HTTPException(
@@ -153,19 +527,33 @@ def get_issue(
             detail="You are not a member of this project"
         )
     
-    comment_count = db.query(Comment).filter(Comment.issue_id == issue.id).count()
+    etag = weak_etag("issue", issue_id, version)
+    unchanged = not_modified(request, etag)
+    if unchanged:
+        return unchanged
     
-    issue_dict = issue.__dict__.copy()
-    issue_dict["comment_count"] = comment_count
+    issue = db.query(Issue).options(
+        joinedload(Issue.reporter),
+        joinedload(Issue.assignee)
+    ).filter(Issue.id == issue_id).first()
+    
+    if not issue:
+        # Deleted since the version check
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail="Issue not found"
+        )
+    set_etag(response, weak_etag("issue", issue.id, issue.version))
     
-    return IssueSchema(**issue_dict)
+    return issue
 
 @router.patch("/issues/{issue_id}", response_model=IssueSchema)
+@db_endpoint
 def update_issue(
     issue_id: int,
     issue_update: IssueUpdate,
-    db: Session = Depends(get_db),
-    current_user: User = Depends(get_current_user)
+    db: Session = Depends(get_session),
+    current_user: Principal = Depends(get_current_principal)
 ):
     issue = db.query(Issue).filter(Issue.id == issue_id).first()
     
@@ -176,10 +564,7 @@ def update_issue(
         )
     
     # Check if user is a member
-    member = db.query(ProjectMember).filter(
-        ProjectMember.project_id == issue.project_id,
-        ProjectMember.user_id == current_user.id
-    ).first()
+    member = get_membership(db, issue.project_id, current_user.id)
     
     if not member:
         raise HTTPException(
@@ -198,12 +583,9 @@ def update_issue(
     # Verify new assignee is a project member
     if issue_update.assignee_id is not None:
         if issue_update.assignee_id:  # If not None and not 0
-            assignee_member = db.query(ProjectMember).filter(
-                ProjectMember.project_id == issue.project_id,
-                ProjectMember.user_id == issue_update.assignee_id
-            ).first()
+            assignee_role = get_member_role(db, issue.project_id, issue_update.assignee_id)
             
-            if not assignee_member:
+            if assignee_role is None:
                 raise HTTPException(
                     status_code=status.HTTP_400_BAD_REQUEST,
                     detail="Assignee must be a project member"
@@ -214,7 +596,11 @@ def update_issue(
     for field, value in update_data.items():
         setattr(issue, field, value)
     
+    project_id = issue.project_id
+    version = bump_project_version(db, project_id)
+    bump_issue_version(db, issue.id, version)
     db.commit()
+    invalidate_issue_lists(project_id)
     db.refresh(issue)
     
     # Reload with relationships
@@ -222,14 +608,16 @@ def update_issue(
         joinedload(Issue.reporter),
         joinedload(Issue.assignee)
     ).filter(Issue.id == issue_id).first()
+    event_broker.publish(project_id, "issue.updated", IssueSchema.model_validate(issue))
     
     return issue
 
 @router.delete("/issues/{issue_id}", status_code=status.HTTP_204_NO_CONTENT)
+@db_endpoint
 def delete_issue(
     issue_id: int,
-    db: Session = Depends(get_db),
-    current_user: User = Depends(get_current_user)
+    db: Session = Depends(get_session),
+    current_user: Principal = Depends(get_current_principal)
 ):
     issue = db.query(Issue).filter(Issue.id == issue_id).first()
     
@@ -240,10 +628,7 @@ def delete_issue(
         )
     
     # Check if user is a maintainer or the reporter
-    member = db.query(ProjectMember).filter(
-        ProjectMember.project_id == issue.project_id,
-        ProjectMember.user_id == current_user.id
-    ).first()
+    member = get_membership(db, issue.project_id, current_user.id)
     
     if not member:
         raise HTTPException(
@@ -257,7 +642,16 @@ def delete_issue(
             detail="Only project maintainers or the reporter can delete this issue"
         )
     
+    project_id = issue.project_id
     db.delete(issue)
+    # Tombstone for clients syncing with /issues/changes
+    db.add(IssueDeletion(
+        project_id=project_id,
+        issue_id=issue_id,
+        changed_version=bump_project_version(db, project_id)
+    ))
     db.commit()
+    invalidate_issue_lists(project_id)
+    event_broker.publish(project_id, "issue.deleted", {"id": issue_id})
     
     return None
@@ -1,10 +1,17 @@
+from datetime import datetime, timezone
 from typing import List
-from fastapi import APIRouter, Depends, HTTPException, status
-from sqlalchemy.orm import Session
+from fastapi import APIRouter, Depends, HTTPException, Request, Response, status
+from sqlalchemy import and_, case, func, select
+from sqlalchemy.orm import Session, selectinload
 
-from app.core.deps import get_current_user, get_project_member, require_project_maintainer
-from app.db.base import get_db
-from app.models import User, Project, ProjectMember, MemberRole, Issue
+from app.core.authz import invalidate_membership
+from app.core.deps import Principal, get_current_principal, get_project_member, require_project_maintainer
+from app.core.etag import not_modified, set_etag, weak_etag
+from app.core.list_cache import invalidate_issue_lists
+from app.core.singleflight import coalesced
+from app.db.session import db_endpoint, get_session
+from app.db.versions import bump_project_version, project_version
+from app.models import User, Project, ProjectMember, MemberRole, Issue, IssueStatus
 from app.schemas.project import (
     ProjectCreate, 
     Project as ProjectSchema,
@@ -16,10 +23,11 @@ from app.schemas.project import (
 router = APIRouter()
 
 @router.post("", response_model=ProjectSchema)
+@db_endpoint
 def create_project(
     project_data: ProjectCreate,
-    db: Session = Depends(get_db),
-    current_user: User = Depends(get_current_user)
+    db: Session = Depends(get_session),
+    current_user: Principal = Depends(get_current_principal)
 ):
     # Check if project key already exists
     existing_project = db.query(Project).filter(Project.key == project_data.key).first()
@@ -47,6 +55,7 @@ def create_project(
     db.add(member)
     
     db.commit()
+    invalidate_membership(project.id, current_user.id)
     db.refresh(project)
     
     # Get members with user info
@@ -69,41 +78,58 @@ def create_project(
     return ProjectSchema(**project_dict)
 
 @router.get("", response_model=List[ProjectList])
+@db_endpoint
 def list_projects(
-    db: Session = Depends(get_db),
-    current_user: User = Depends(get_current_user)
+    db: Session = Depends(get_session),
+    current_user: Principal = Depends(get_current_principal)
 ):
-    # Get projects the user is a member of
-    projects = db.query(Project).join(ProjectMember).filter(
+    # The caller's projects, for the subqueries to aggregate over only those
+    my_projects = select(ProjectMember.project_id).where(ProjectMember.user_id == current_user.id)
+    
+    # Issue counts and breakdowns of every project in one grouped pass
+    unfinished = Issue.status.notin_([IssueStatus.resolved, IssueStatus.closed])
+    issue_counts = select(
+        Issue.project_id,
+        func.count().label("issue_count"),
+        func.sum(case((Issue.status == IssueStatus.open, 1), else_=0)).label("open_count"),
+        func.sum(case((Issue.status == IssueStatus.in_progress, 1), else_=0)).label("in_progress_count"),
+        func.sum(case(
+            (and_(unfinished, Issue.expected_completion_date < datetime.now(timezone.utc)), 1), else_=0
+        )).label("overdue_count"),
+    ).where(Issue.project_id.in_(my_projects)).group_by(Issue.project_id).subquery()
+    member_counts = select(
+        ProjectMember.project_id,
+        func.count().label("member_count"),
+    ).where(ProjectMember.project_id.in_(my_projects)).group_by(ProjectMember.project_id).subquery()
+    
+    # Projects without issues have no row in issue_counts
+    rows = db.query(
+        Project.id,
+        Project.name,
+        Project.key,
+        Project.description,
+        Project.created_at,
+        func.coalesce(issue_counts.c.issue_count, 0).label("issue_count"),
+        func.coalesce(issue_counts.c.open_count, 0).label("open_count"),
+        func.coalesce(issue_counts.c.in_progress_count, 0).label("in_progress_count"),
+        func.coalesce(issue_counts.c.overdue_count, 0).label("overdue_count"),
+        func.coalesce(member_counts.c.member_count, 0).label("member_count"),
+    ).join(
+        ProjectMember, ProjectMember.project_id == Project.id
+    ).outerjoin(
+        issue_counts, issue_counts.c.project_id == Project.id
+    ).outerjoin(
+        member_counts, member_counts.c.project_id == Project.id
+    ).filter(
         ProjectMember.user_id == current_user.id
     ).all()
     
-    # Add issue and member counts
-    result = []
-    for project in projects:
-        issue_count = db.query(Issue).filter(Issue.project_id == project.id).count()
-        member_count = db.query(ProjectMember).filter(ProjectMember.project_id == project.id).count()
-        
-        project_dict = {
-            "id": project.id,
-            "name": project.name,
-            "key": project.key,
-            "description": project.description,
-            "created_at": project.created_at,
-            "issue_count": issue_count,
-            "member_count": member_count
-        }
-        result.append(ProjectList(**project_dict))
-    
-    return result
+    return [ProjectList.model_validate(row) for row in rows]
 
-@router.get("/{project_id}", response_model=ProjectSchema)
-def get_project(
-    project_id: int,
-    db: Session = Depends(get_db),
-    member: ProjectMember = Depends(get_project_member)
-):
-    project = db.query(Project).filter(Project.id == project_id).first()
+def _project_detail(db: Session, project_id: int) -> ProjectSchema:
+    project = db.query(Project).options(
+        selectinload(Project.members).joinedload(ProjectMember.user)
+    ).filter(Project.id == project_id).first()
     
     if not project:
         raise HTTPException(
@@ -130,11 +156,39 @@ def get_project(
     
     return ProjectSchema(**project_dict)
 
+@router.get("/{project_id}", response_model=ProjectSchema)
+@db_endpoint
+def get_project(
+    request: Request,
+    response: Response,
+    project_id: int,
+    db: Session = Depends(get_session),
+    member: ProjectMember = Depends(get_project_member)
+):
+    version = project_version(db, project_id)
+    
+    if version is None:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail="Project not found"
+        )
+    
+    # Answer before the project and its members are loaded
+    etag = weak_etag("project", project_id, version)
+    unchanged = not_modified(request, etag)
+    if unchanged:
+        return unchanged
+    set_etag(response, etag)
+    
+    # Concurrent requests for the same version share one load; membership was checked per caller
+    return coalesced(("get_project", project_id, version), lambda: _project_detail(db, project_id))
+
 @router.post("/{project_id}/members", response_model=dict)
+@db_endpoint
 def add_project_member(
     project_id: int,
     member_data: AddProjectMember,
-    db: Session = Depends(get_db),
+    db: Session = Depends(get_session),
     maintainer: ProjectMember = Depends(require_project_maintainer)
 ):
     # Find user by email
@@ -165,6 +219,9 @@ def add_project_member(
         role=member_data.role
     )
     db.add(new_member)
+    bump_project_version(db, project_id)
     db.commit()
+    invalidate_membership(project_id, user.id)
+    invalidate_issue_lists(project_id)
     
     return {"message": "Member added successfully"}
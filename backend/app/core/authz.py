@@ -0,0 +1,39 @@
+from typing import Optional
+
+from sqlalchemy.orm import Session
+
+from app.core.cache import TTLCache
+from app.core.config import settings
+from app.models import ProjectMember, MemberRole
+
+# (user_id, project_id) -> MemberRole, or None for "not a member"
+membership_cache = TTLCache(
+    maxsize=settings.AUTHZ_CACHE_MAX_ENTRIES,
+    ttl=settings.AUTHZ_CACHE_TTL_SECONDS,
+)
+
+
+def get_member_role(db: Session, project_id: int, user_id: int) -> Optional[MemberRole]:
+    def load():
+        return db.query(ProjectMember.role).filter(
+            ProjectMember.project_id == project_id,
+            ProjectMember.user_id == user_id
+        ).scalar()
+
+    return membership_cache.get_or_load((user_id, project_id), load)
+
+
+def get_membership(db: Session, project_id: int, user_id: int) -> Optional[ProjectMember]:
+    """The caller's membership as a detached ``ProjectMember``, or None if not a member."""
+    role = get_member_role(db, project_id, user_id)
+    if role is None:
+        return None
+    return ProjectMember(project_id=project_id, user_id=user_id, role=role)
+
+
+def invalidate_membership(project_id: int, user_id: Optional[int] = None):
+    """Forget cached roles after a membership change; call once the change is committed."""
+    if user_id is not None:
+        membership_cache.pop((user_id, project_id))
+    else:
+        membership_cache.pop_where(lambda key: key[1] == project_id)
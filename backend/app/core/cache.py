@@ -0,0 +1,176 @@
+import threading
+import time
+from collections import OrderedDict
+from typing import Any, Callable, Hashable, Optional
+
+# Returned by TTLCache.get on a miss, so that None can be cached as a value
+MISSING = object()
+
+
+class TTLCache:
+    """Thread-safe LRU mapping whose entries also expire ``ttl`` seconds after being stored.
+
+    ``maxsize <= 0`` or ``ttl <= 0`` turns the cache into a pass-through.
+    """
+
+    def __init__(self, maxsize: int, ttl: float, clock: Callable[[], float] = time.monotonic):
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self.hits = 0
+        self.misses = 0
+        self._clock = clock
+        self._data: "OrderedDict[Hashable, tuple]" = OrderedDict()
+        self._lock = threading.Lock()
+        # Bumped by every invalidation so loads that raced with one are not stored
+        self._generation = 0
+
+    @property
+    def enabled(self) -> bool:
+        return self.maxsize > 0 and self.ttl > 0
+
+    def __len__(self) -> int:
+        return len(self._data)
+
+    def get(self, key: Hashable) -> Any:
+        with self._lock:
+            entry = self._data.get(key)
+            if entry is not None:
+                value, expires_at = entry
+                if expires_at > self._clock():
+                    self._data.move_to_end(key)
+                    self.hits += 1
+                    return value
+                del self._data[key]
+            self.misses += 1
+            return MISSING
+
+    def set(self, key: Hashable, value: Any, expires_at: Optional[float] = None):
+        if not self.enabled:
+            return
+        with self._lock:
+            self._store(key, value, expires_at)
+
+    def _store(self, key, value, expires_at):
+        now = self._clock()
+        if expires_at is None:
+            expires_at = now + self.ttl
+        else:
+            expires_at = min(expires_at, now + self.ttl)
+        self._data[key] = (value, expires_at)
+        self._data.move_to_end(key)
+        while len(self._data) > self.maxsize:
+            self._data.popitem(last=False)
+
+    def get_or_load(self, key: Hashable, loader: Callable[[], Any]) -> Any:
+        """Return the cached value, or call ``loader`` and cache what it returns."""
+        value = self.get(key)
+        if value is not MISSING:
+            return value
+        generation = self._generation
+        value = loader()
+        if self.enabled:
+            with self._lock:
+                if generation == self._generation:
+                    self._store(key, value, None)
+        return value
+
+    def pop(self, key: Hashable):
+        with self._lock:
+            self._generation += 1
+            self._data.pop(key, None)
+
+    def pop_where(self, predicate: Callable[[Hashable], bool]):
+        with self._lock:
+            self._generation += 1
+            for key in [key for key in self._data if predicate(key)]:
+                del self._data[key]
+
+    def clear(self):
+        with self._lock:
+            self._generation += 1
+            self._data.clear()
+            self.hits = 0
+            self.misses = 0
+
+    def stats(self) -> dict:
+        return {
+            "hits": self.hits,
+            "misses": self.misses,
+            "size": len(self._data),
+            "maxsize": self.maxsize,
+        }
+
+
+class BytesLRUCache:
+    """Thread-safe LRU mapping of keys to ``(body, extra)`` pairs, bounded by the bytes held.
+
+    ``body`` is bytes and counts toward ``maxbytes`` (plus ``ENTRY_OVERHEAD`` per
+    entry); ``extra`` is any small value stored alongside it. ``maxbytes <= 0``
+    turns the cache into a pass-through.
+    """
+
+    # Rough cost of the key, tuple and OrderedDict node of one entry
+    ENTRY_OVERHEAD = 256
+
+    def __init__(self, maxbytes: int):
+        self.maxbytes = maxbytes
+        self.hits = 0
+        self.misses = 0
+        self.bytes = 0
+        self._data: "OrderedDict[Hashable, tuple]" = OrderedDict()
+        self._lock = threading.Lock()
+
+    @property
+    def enabled(self) -> bool:
+        return self.maxbytes > 0
+
+    def __len__(self) -> int:
+        return len(self._data)
+
+    def get(self, key: Hashable) -> Any:
+        with self._lock:
+            entry = self._data.get(key)
+            if entry is None:
+                self.misses += 1
+                return MISSING
+            self._data.move_to_end(key)
+            self.hits += 1
+            return entry[0], entry[1]
+
+    def set(self, key: Hashable, body: bytes, extra: Any = None):
+        size = len(body) + self.ENTRY_OVERHEAD
+        # One entry may not crowd out everything else
+        if not self.enabled or size > self.maxbytes // 4:
+            return
+        with self._lock:
+            old = self._data.pop(key, None)
+            if old is not None:
+                self.bytes -= old[2]
+            self._data[key] = (body, extra, size)
+            self.bytes += size
+            while self.bytes > self.maxbytes:
+                _, evicted = self._data.popitem(last=False)
+                self.bytes -= evicted[2]
+
+    def pop_where(self, predicate: Callable[[Hashable], bool]):
+        with self._lock:
+            for key in [key for key in self._data if predicate(key)]:
+                self.bytes -= self._data.pop(key)[2]
+
+    def clear(self):
+        with self._lock:
+            self._data.clear()
+            self.bytes = 0
+            self.hits = 0
+            self.misses = 0
+
+    def stats(self) -> dict:
+        lookups = self.hits + self.misses
+        return {
+            "hits": self.hits,
+            "misses": self.misses,
+            "size": len(self._data),
+            "bytes": self.bytes,
+            "maxbytes": self.maxbytes,
+            "hit_ratio": self.hits / lookups if lookups else 0.0,
+        }
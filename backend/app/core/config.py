@@ -5,12 +5,64 @@ from typing import List, Union
 class Settings(BaseSettings):
     # Database
     DATABASE_URL: str = "sqlite:///./issuehub.db"  # SQLite for local dev
+    # Create missing tables on startup; disable when the schema is managed with `alembic upgrade head`
+    DB_AUTO_CREATE: bool = True
+    # Serve the auth, projects, issues and comments routers from an AsyncEngine (aiosqlite/asyncpg) on the
+    # event loop instead of the threadpool; the async URL is derived from DATABASE_URL unless set
+    DB_ASYNC: bool = False
+    ASYNC_DATABASE_URL: str = ""
+    
+    # Connection pool (one engine per process, see app.db.base.get_engine)
+    DB_POOL_SIZE: int = 5
+    DB_MAX_OVERFLOW: int = 10
+    DB_POOL_RECYCLE: int = 1800  # seconds, -1 disables recycling
+    DB_POOL_PRE_PING: bool = True
+    DB_POOL_TIMEOUT: float = 30.0  # seconds to wait for a free connection
+    
+    # SQLite performance profile (WAL + tuned pragmas), opt-in for file databases
+    SQLITE_PERFORMANCE_PROFILE: bool = False
+    SQLITE_MMAP_SIZE: int = 268435456  # bytes of the file to memory-map, 0 disables
+    SQLITE_CACHE_SIZE: int = -65536  # pages, or KiB when negative (64 MiB)
+    SQLITE_BUSY_TIMEOUT_MS: int = 5000
+    
+    # Per-request SQL statistics (Server-Timing header); statements repeated this often are logged
+    SQL_INSTRUMENTATION: bool = True
+    SQL_REPEATED_STATEMENT_THRESHOLD: int = 5
+    
+    # Prometheus metrics at /api/metrics
+    METRICS_ENABLED: bool = True
     
     # JWT Settings
     SECRET_KEY: str = "your-secret-key-here-change-in-production"
     ALGORITHM: str = "HS256"
     ACCESS_TOKEN_EXPIRE_MINUTES: int = 10080  # 7 days
     
+    # Password hashing (pbkdf2_sha256); stored hashes with a different cost are rehashed on login
+    PASSWORD_HASH_ROUNDS: int = 29000
+    PASSWORD_HASH_WORKERS: int = 4  # dedicated threads, separate from the request threadpool
+    PASSWORD_HASH_QUEUE_DEPTH: int = 64  # waiting hashes beyond the workers before answering 503
+    
+    # Verified access tokens cached by hash (per process), never beyond their exp
+    TOKEN_CACHE_TTL_SECONDS: float = 300.0
+    TOKEN_CACHE_MAX_ENTRIES: int = 10000
+    
+    # Project membership cache (per process); writes invalidate it, the TTL bounds staleness across workers
+    AUTHZ_CACHE_TTL_SECONDS: float = 60.0
+    AUTHZ_CACHE_MAX_ENTRIES: int = 10000
+    
+    # Serialized list_issues pages (per process), keyed by the project version; 0 disables
+    ISSUE_LIST_CACHE_MAX_BYTES: int = 33554432  # 32 MiB
+    
+    # Identical concurrent reads (list_issues, get_project) share one computation; waiters give up after the timeout
+    REQUEST_COALESCING: bool = True
+    REQUEST_COALESCING_TIMEOUT_SECONDS: float = 10.0
+    
+    # Project event streams (per process): events queued per subscriber before it is dropped, events kept
+    # for Last-Event-ID replay across all projects, and idle seconds between keepalive comments
+    EVENT_QUEUE_SIZE: int = 256
+    EVENT_HISTORY_SIZE: int = 1000
+    EVENT_HEARTBEAT_SECONDS: float = 15.0
+    
     # CORS
     CORS_ORIGINS: Union[List[str], str] = ["http://localhost:3000", "http://localhost:8000"]
     
@@ -1,38 +1,86 @@
+import hashlib
+import time
+from dataclasses import dataclass
 from typing import Optional
 
 from fastapi import Depends, HTTPException, status
 from fastapi.security import HTTPBearer, HTTPAuthorizationCredentials
 from sqlalchemy.orm import Session
 
+from app.core.authz import get_membership
+from app.core.cache import MISSING, TTLCache
+from app.core.config import settings
 from app.core.security import verify_token
-from app.db.base import get_db
+from app.db.session import db_endpoint, get_session
 from app.models import User, ProjectMember, MemberRole
 
 security = HTTPBearer()
 
-async def get_current_user(
-    credentials: HTTPAuthorizationCredentials = Depends(security),
-    db: Session = Depends(get_db)
-) -> User:
-    token = credentials.credentials
-    payload = verify_token(token)
+# sha256(token) -> verified payload, held no longer than the token's own exp
+token_cache = TTLCache(
+    maxsize=settings.TOKEN_CACHE_MAX_ENTRIES,
+    ttl=settings.TOKEN_CACHE_TTL_SECONDS,
+)
+
+@dataclass(frozen=True)
+class Principal:
+    """The authenticated caller as described by their access token."""
+    id: int
+    name: Optional[str] = None
+    email: Optional[str] = None
+
+def _credentials_exception() -> HTTPException:
+    return HTTPException(
+        status_code=status.HTTP_401_UNAUTHORIZED,
+        detail="Invalid authentication credentials",
+        headers={"WWW-Authenticate": "Bearer"},
+    )
+
+def verify_token_cached(token: str) -> Optional[dict]:
+    key = hashlib.sha256(token.encode()).digest()
+    payload = token_cache.get(key)
+    if payload is not MISSING:
+        return payload
     
+    payload = verify_token(token)
+    if payload and isinstance(payload.get("exp"), (int, float)):
+        # Translate the wall-clock exp into the cache's monotonic clock
+        remaining = payload["exp"] - time.time()
+        token_cache.set(key, payload, expires_at=time.monotonic() + remaining)
+    return payload
+
+@db_endpoint
+def get_current_principal(
+    credentials: HTTPAuthorizationCredentials = Depends(security),
+    db: Session = Depends(get_session)
+) -> Principal:
+    payload = verify_token_cached(credentials.credentials)
     if not payload:
-        raise HTTPException(
-            status_code=status.HTTP_401_UNAUTHORIZED,
-            detail="Invalid authentication credentials",
-            headers={"WWW-Authenticate": "Bearer"},
-        )
+        raise _credentials_exception()
     
     user_id = payload.get("sub")
     if not user_id:
+        raise _credentials_exception()
+    
+    if "name" in payload and "email" in payload:
+        return Principal(id=int(user_id), name=payload["name"], email=payload["email"])
+    
+    # Tokens issued before identity claims were added: fall back to the database
+    user = db.get(User, int(user_id))
+    if not user:
         raise HTTPException(
-            status_code=status.HTTP_401_UNAUTHORIZED,
-            detail="Invalid authentication credentials",
-            headers={"WWW-Authenticate": "Bearer"},
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail="User not found"
         )
-    
-    user = db.query(User).filter(User.id == int(user_id)).first()
+    return Principal(id=user.id, name=user.name, email=user.email)
+
+@db_endpoint
+def get_current_user(
+    principal: Principal = Depends(get_current_principal),
+    db: Session = Depends(get_session)
+) -> User:
+    """Load the full ``User`` row, for endpoints that need more than the token claims."""
+    user = db.get(User, principal.id)
     if not user:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
@@ -41,15 +89,13 @@ async def get_current_user(
     
     return user
 
+@db_endpoint
 def get_project_member(
     project_id: int,
-    user: User = Depends(get_current_user),
-    db: Session = Depends(get_db)
+    user: Principal = Depends(get_current_principal),
+    db: Session = Depends(get_session)
 ) -> Optional[ProjectMember]:
-    member = db.query(ProjectMember).filter(
-        ProjectMember.project_id == project_id,
-        ProjectMember.user_id == user.id
-    ).first()
+    member = get_membership(db, project_id, user.id)
     
     if not member:
         raise HTTPException(
@@ -59,7 +105,7 @@ def get_project_member(
     
     return member
 
-def require_project_maintainer(
+async def require_project_maintainer(
     member: ProjectMember = Depends(get_project_member)
 ) -> ProjectMember:
     if member.role != MemberRole.maintainer:
@@ -0,0 +1,39 @@
+"""Weak ETags built from the version counters in ``app.db.versions``."""
+from typing import Optional
+
+from fastapi import Request, Response, status
+
+
+def weak_etag(kind: str, resource_id: int, version: int) -> str:
+    return f'W/"{kind}-{resource_id}-v{version}"'
+
+
+def etag_matches(if_none_match: Optional[str], etag: str) -> bool:
+    """Weak comparison of ``If-None-Match`` against ``etag`` (RFC 9110 §13.1.2)."""
+    if not if_none_match:
+        return False
+    if if_none_match.strip() == "*":
+        return True
+    opaque = etag[2:] if etag.startswith("W/") else etag
+    for candidate in if_none_match.split(","):
+        candidate = candidate.strip()
+        if candidate.startswith("W/"):
+            candidate = candidate[2:]
+        if candidate == opaque:
+            return True
+    return False
+
+
+def set_etag(response: Response, etag: str):
+    response.headers["ETag"] = etag
+    # Browsers may keep the body but must revalidate it on every use
+    response.headers["Cache-Control"] = "private, no-cache"
+
+
+def not_modified(request: Request, etag: str) -> Optional[Response]:
+    """A 304 response if the client already holds ``etag``, else None."""
+    if etag_matches(request.headers.get("if-none-match"), etag):
+        response = Response(status_code=status.HTTP_304_NOT_MODIFIED)
+        set_etag(response, etag)
+        return response
+    return None
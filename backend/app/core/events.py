@@ -0,0 +1,189 @@
+"""In-process fan-out of project events to Server-Sent Events streams.
+
+Write endpoints publish once their transaction has committed, and every open
+``/projects/{id}/events`` stream of the project receives the event. Each event
+is encoded to its SSE frame once, at publish time, and the same bytes are
+handed to every subscriber.
+
+Subscriber queues are bounded: a subscriber that falls ``EVENT_QUEUE_SIZE``
+events behind (a stalled client, a connection nobody noticed is dead) is
+dropped instead of buffering without limit. Its stream ends and the client
+reconnects with ``Last-Event-ID``. The last ``EVENT_HISTORY_SIZE`` events of
+all projects are kept in a ring buffer, so a reconnect replays what was
+missed. If the id is older than the ring, comes from another process or is
+not understood, the stream starts with a ``resync`` event and the client
+reloads instead.
+
+Only subscribers in the publishing process see an event. With several
+workers, serve the event streams and the writes from the same process.
+"""
+import asyncio
+import json
+import secrets
+import threading
+from collections import deque
+from typing import Any, AsyncIterator, Deque, Dict, List, Optional, Set, Tuple
+
+from pydantic import BaseModel
+
+from app.core.config import settings
+
+KEEPALIVE = b": keepalive\n\n"
+
+
+def _frame(event_id: str, event_type: str, data: bytes) -> bytes:
+    return b"id: %s\nevent: %s\ndata: %s\n\n" % (event_id.encode(), event_type.encode(), data)
+
+
+class Subscription:
+    """One open stream of a project's events, read on the event loop it subscribed from."""
+
+    __slots__ = ("project_id", "loop", "maxsize", "frames", "ready", "dropped")
+
+    def __init__(self, project_id: int, loop: asyncio.AbstractEventLoop, maxsize: int):
+        self.project_id = project_id
+        self.loop = loop
+        self.maxsize = maxsize
+        self.frames: Deque[bytes] = deque()
+        self.ready = asyncio.Event()
+        self.dropped = False
+
+    async def next_frames(self, timeout: float) -> List[bytes]:
+        """Frames published since the last call; empty if none arrive within ``timeout`` seconds."""
+        if not self.frames and not self.dropped:
+            self.ready.clear()
+            try:
+                await asyncio.wait_for(self.ready.wait(), timeout)
+            except asyncio.TimeoutError:
+                pass
+        frames = list(self.frames)
+        self.frames.clear()
+        return frames
+
+
+class EventBroker:
+    """Publish events of a project to its subscribers, from any thread."""
+
+    def __init__(self, queue_size: int, history_size: int):
+        self.queue_size = queue_size
+        # Part of every event id, so ids from before a restart are recognised as such
+        self.epoch = secrets.token_hex(4)
+        self.published = 0
+        self.dropped = 0
+        self._lock = threading.Lock()
+        # project_id -> sequence number of its latest event
+        self._sequences: Dict[int, int] = {}
+        # (project_id, sequence, frame) of the latest events of all projects
+        self._history: Deque[Tuple[int, int, bytes]] = deque(maxlen=history_size)
+        # project_id -> loop -> subscriptions
+        self._subscribers: Dict[int, Dict[asyncio.AbstractEventLoop, Set[Subscription]]] = {}
+
+    def subscribers(self) -> int:
+        with self._lock:
+            return sum(len(subs) for loops in self._subscribers.values() for subs in loops.values())
+
+    def publish(self, project_id: int, event_type: str, data: Any):
+        """Send ``data`` (a pydantic model or anything ``json.dumps`` takes) to the project's streams."""
+        if isinstance(data, BaseModel):
+            payload = data.model_dump_json().encode()
+        else:
+            payload = json.dumps(data, separators=(",", ":")).encode()
+
+        with self._lock:
+            sequence = self._sequences.get(project_id, 0) + 1
+            self._sequences[project_id] = sequence
+            frame = _frame(f"{self.epoch}-{sequence}", event_type, payload)
+            self._history.append((project_id, sequence, frame))
+            self.published += 1
+            # Scheduled under the lock so every loop gets the events in sequence order
+            loops = self._subscribers.get(project_id, {})
+            for loop, subs in list(loops.items()):
+                try:
+                    loop.call_soon_threadsafe(self._deliver, tuple(subs), frame)
+                except RuntimeError:
+                    # The loop is closed, and its streams with it
+                    del loops[loop]
+
+    def _deliver(self, subscriptions: Tuple[Subscription, ...], frame: bytes):
+        for subscription in subscriptions:
+            if subscription.dropped:
+                continue
+            if len(subscription.frames) >= subscription.maxsize:
+                self._drop(subscription)
+                continue
+            subscription.frames.append(frame)
+            subscription.ready.set()
+
+    def _drop(self, subscription: Subscription):
+        subscription.dropped = True
+        subscription.frames.clear()
+        subscription.ready.set()
+        self.unsubscribe(subscription)
+        with self._lock:
+            self.dropped += 1
+
+    def subscribe(self, project_id: int, last_event_id: Optional[str] = None) -> Subscription:
+        """Start receiving the project's events; call on the event loop that will read them.
+
+        With ``last_event_id``, the events published after it are queued first,
+        or a ``resync`` event when they are no longer all known.
+        """
+        subscription = Subscription(project_id, asyncio.get_running_loop(), self.queue_size)
+        with self._lock:
+            if last_event_id is not None:
+                missed = self._missed(project_id, last_event_id)
+                if missed is None:
+                    current = f"{self.epoch}-{self._sequences.get(project_id, 0)}"
+                    subscription.frames.append(_frame(current, "resync", b"{}"))
+                else:
+                    subscription.frames.extend(missed)
+            loops = self._subscribers.setdefault(project_id, {})
+            loops.setdefault(subscription.loop, set()).add(subscription)
+        return subscription
+
+    def _missed(self, project_id: int, last_event_id: str) -> Optional[List[bytes]]:
+        """Frames after ``last_event_id``, or None if the ring no longer holds all of them."""
+        epoch, _, sequence = last_event_id.partition("-")
+        if epoch != self.epoch or not sequence.isdigit():
+            return None
+        sequence = int(sequence)
+        current = self._sequences.get(project_id, 0)
+        if sequence > current:
+            return None
+        missed = [(seq, frame) for pid, seq, frame in self._history if pid == project_id and seq > sequence]
+        # Sequences of a project have no gaps, so the ring holds everything only if it starts right after
+        if current > sequence and (not missed or missed[0][0] != sequence + 1):
+            return None
+        return [frame for _, frame in missed]
+
+    def unsubscribe(self, subscription: Subscription):
+        with self._lock:
+            loops = self._subscribers.get(subscription.project_id)
+            if not loops:
+                return
+            subs = loops.get(subscription.loop)
+            if subs is None:
+                return
+            subs.discard(subscription)
+            if not subs:
+                del loops[subscription.loop]
+            if not loops:
+                del self._subscribers[subscription.project_id]
+
+    async def stream(self, subscription: Subscription, heartbeat: float) -> AsyncIterator[bytes]:
+        """The SSE body for ``subscription``, with a comment line after ``heartbeat`` idle seconds."""
+        try:
+            yield b"retry: 3000\n\n"
+            while True:
+                frames = await subscription.next_frames(heartbeat)
+                if subscription.dropped:
+                    return
+                yield b"".join(frames) if frames else KEEPALIVE
+        finally:
+            self.unsubscribe(subscription)
+
+
+event_broker = EventBroker(
+    queue_size=settings.EVENT_QUEUE_SIZE,
+    history_size=settings.EVENT_HISTORY_SIZE,
+)
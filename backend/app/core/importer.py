@@ -0,0 +1,343 @@
+"""Streaming import of issues, with their comments, from NDJSON or CSV.
+
+Reads the files ``app.core.export`` writes. The input is an iterable of byte
+chunks split into lines as it arrives, so memory use does not depend on the
+size of the file. Users are given by email and resolved through one
+email -> id map of the project's members, loaded once per run. Valid rows are
+written ``IMPORT_BATCH_ROWS`` at a time (one multi-row INSERT for the issues,
+one executemany for their comments), and each batch commits together with the
+job's checkpoint: the rows and bytes of input consumed so far. An interrupted
+import resumes from its last committed batch.
+"""
+import csv
+import json
+import time
+from datetime import datetime, timezone
+from typing import Callable, Iterable, Iterator, List, Optional, Tuple
+
+from pydantic import ValidationError
+from sqlalchemy import insert, select, update
+from sqlalchemy.engine import Engine
+
+from app.core.events import event_broker
+from app.core.list_cache import invalidate_issue_lists
+from app.db.bulk import insert_returning_ids
+from app.db.versions import bump_project_version
+from app.models import Comment, ImportJob, ImportStatus, Issue, ProjectMember, User
+from app.schemas.import_job import IssueImportRow
+
+try:
+    import orjson
+except ImportError:  # optional speedup
+    orjson = None
+
+IMPORT_FORMATS = ("ndjson", "csv")
+IMPORT_BATCH_ROWS = 1000
+# Rejected rows beyond this are counted but not described
+MAX_REPORTED_ERRORS = 1000
+
+# A CSV row carries all of an issue's comments in one column
+csv.field_size_limit(max(csv.field_size_limit(), 64 * 1024 * 1024))
+
+_loads = orjson.loads if orjson is not None else json.loads
+
+# Yielded by iter_rows for rows an earlier run of the job already handled
+SKIPPED = object()
+
+
+class ImportFileError(ValueError):
+    """The input can't be read any further (not UTF-8, or malformed CSV)."""
+
+
+class ImportConflict(Exception):
+    """Another run of the same job committed a batch first."""
+
+
+def iter_lines(chunks: Iterable[bytes], offset: int = 0) -> Iterator[Tuple[bytes, int]]:
+    """Split byte chunks into lines, each with the byte offset just past it."""
+    buffer = bytearray()
+    for chunk in chunks:
+        # Only the new bytes can hold the next newline
+        scan = len(buffer)
+        buffer += chunk
+        start = 0
+        while True:
+            end = buffer.find(b"\n", scan)
+            if end < 0:
+                break
+            line = bytes(buffer[start:end + 1])
+            offset += len(line)
+            yield line, offset
+            start = scan = end + 1
+        del buffer[:start]
+    if buffer:
+        offset += len(buffer)
+        yield bytes(buffer), offset
+
+
+def read_csv_header(line: bytes) -> List[str]:
+    return next(csv.reader([line.decode("utf-8")]))
+
+
+def _ndjson_rows(chunks, offset: int, skip_rows: int):
+    for line, end in iter_lines(chunks, offset):
+        if not line.strip():
+            continue
+        if skip_rows:
+            skip_rows -= 1
+            yield SKIPPED, None, end
+            continue
+        try:
+            record = _loads(line)
+        except ValueError as exc:
+            yield None, f"Invalid JSON: {exc}", end
+            continue
+        if not isinstance(record, dict):
+            yield None, "Expected a JSON object", end
+            continue
+        yield record, None, end
+
+
+def _csv_rows(chunks, offset: int, skip_rows: int, header: Optional[List[str]]):
+    # csv.reader pulls a quoted value's continuation lines itself, so after each
+    # row the last line handed to it is the row's last line
+    position = offset
+
+    def text_lines():
+        nonlocal position
+        for line, end in iter_lines(chunks, offset):
+            try:
+                text = line.decode("utf-8")
+            except UnicodeDecodeError:
+                raise ImportFileError(f"Input is not valid UTF-8 (byte offset {position})")
+            position = end
+            yield text
+
+    reader = csv.reader(text_lines())
+    try:
+        if header is None:
+            header = next(reader, None)
+            if header is None:
+                return
+        for values in reader:
+            if not values:
+                continue
+            if skip_rows:
+                skip_rows -= 1
+                yield SKIPPED, None, position
+                continue
+            if len(values) != len(header):
+                yield None, f"Expected {len(header)} columns, got {len(values)}", position
+                continue
+            # CSV can't tell an empty string from a missing value
+            record = {name: value if value != "" else None for name, value in zip(header, values)}
+            if record.get("comments") is not None:
+                try:
+                    record["comments"] = _loads(record["comments"])
+                except ValueError as exc:
+                    yield None, f"comments: invalid JSON: {exc}", position
+                    continue
+            yield record, None, position
+    except csv.Error as exc:
+        raise ImportFileError(f"Malformed CSV near byte offset {position}: {exc}")
+
+
+def iter_rows(
+    chunks: Iterable[bytes],
+    import_format: str,
+    offset: int = 0,
+    skip_rows: int = 0,
+    csv_header: Optional[List[str]] = None,
+) -> Iterator[Tuple[object, Optional[str], int]]:
+    """``(record, error, end offset)`` for every input row; blank lines are not rows.
+
+    ``offset`` is where ``chunks`` starts in the file. The first ``skip_rows``
+    rows come back as ``SKIPPED`` without being parsed further. A CSV stream
+    that doesn't start at the header needs ``csv_header``.
+    """
+    if import_format == "csv":
+        return _csv_rows(chunks, offset, skip_rows, csv_header)
+    return _ndjson_rows(chunks, offset, skip_rows)
+
+
+def project_member_emails(conn, project_id: int) -> dict:
+    """email -> user id for every member of the project, in one query."""
+    return dict(conn.execute(
+        select(User.email, User.id)
+        .join(ProjectMember, ProjectMember.user_id == User.id)
+        .where(ProjectMember.project_id == project_id)
+    ).all())
+
+
+def _validation_detail(exc: ValidationError) -> str:
+    return "; ".join(
+        f"{'.'.join(str(part) for part in error['loc'])}: {error['msg']}" for error in exc.errors()
+    )
+
+
+def _member_id(members: dict, email: Optional[str], default: Optional[int], field: str) -> int:
+    if email is None:
+        return default
+    user_id = members.get(email)
+    if user_id is None:
+        raise ValueError(f"{field}: {email} is not a member of this project")
+    return user_id
+
+
+def prepare_row(record: dict, members: dict, project_id: int, importer_id: int, now: datetime):
+    """The issue's insert values and its comments' values; ValueError describes a rejected row."""
+    try:
+        row = IssueImportRow.model_validate(record)
+    except ValidationError as exc:
+        raise ValueError(_validation_detail(exc))
+
+    created_at = row.created_at or now
+    issue = {
+        "project_id": project_id,
+        "title": row.title,
+        "description": row.description,
+        "status": row.status,
+        "priority": row.priority,
+        # Issues without a reporter are attributed to whoever imports them
+        "reporter_id": _member_id(members, row.reporter_email, importer_id, "reporter_email"),
+        "assignee_id": _member_id(members, row.assignee_email, None, "assignee_email"),
+        "expected_completion_date": row.expected_completion_date,
+        "created_at": created_at,
+        "updated_at": row.updated_at or created_at,
+        # Core inserts bypass the hooks in app.models.comment, so the count is set here
+        "comment_count": len(row.comments),
+    }
+    comments = [
+        {
+            "author_id": _member_id(members, comment.author_email, importer_id, f"comments.{index}.author_email"),
+            "body": comment.body,
+            "created_at": comment.created_at or now,
+        }
+        for index, comment in enumerate(row.comments)
+    ]
+    return issue, comments
+
+
+def _commit_batch(engine: Engine, job_id: int, project_id: int, checkpoint: int, issues: List[dict],
+                  comments: List[List[dict]], rows_done: int, bytes_done: int, failed: int, finished: bool):
+    """Write one batch and move the job's checkpoint from ``checkpoint`` rows in the same transaction."""
+    jobs = ImportJob.__table__
+    values = {
+        "rows_done": rows_done,
+        "bytes_done": bytes_done,
+        "imported": jobs.c.imported + len(issues),
+        "failed": jobs.c.failed + failed,
+        "updated_at": datetime.now(timezone.utc),
+    }
+    if finished:
+        values["status"] = ImportStatus.completed
+
+    with engine.begin() as conn:
+        # Guarded by the previous checkpoint, so two runs of one job can't both commit a batch
+        claimed = conn.execute(
+            update(jobs).where(jobs.c.id == job_id, jobs.c.rows_done == checkpoint).values(**values)
+        ).rowcount
+        if not claimed:
+            raise ImportConflict("The import job was advanced by another run")
+        
+        if issues:
+            version = bump_project_version(conn, project_id)
+            ids = insert_returning_ids(conn, Issue, [{**issue, "changed_version": version} for issue in issues])
+            comment_rows = [
+                {**comment, "issue_id": issue_id}
+                for issue_id, issue_comments in zip(ids, comments)
+                for comment in issue_comments
+            ]
+            if comment_rows:
+                conn.execute(insert(Comment), comment_rows)
+    if issues:
+        invalidate_issue_lists(project_id)
+        event_broker.publish(project_id, "issues.created", {"ids": ids})
+
+
+def run_import(
+    engine: Engine,
+    job_id: int,
+    chunks: Iterable[bytes],
+    offset: int = 0,
+    csv_header: Optional[List[str]] = None,
+    batch_rows: int = IMPORT_BATCH_ROWS,
+    progress: Optional[Callable[[int], None]] = None,
+) -> dict:
+    """Run (or resume) an import job over ``chunks``, reading and writing through its own connections.
+
+    ``chunks`` either holds the whole file (``offset`` 0; rows the job already
+    handled are skipped) or continues it from the job's ``bytes_done``.
+    ``progress`` is called with the number of rows after every batch.
+    """
+    start = time.perf_counter()
+    with engine.connect() as conn:
+        job = conn.execute(select(ImportJob.__table__).where(ImportJob.id == job_id)).one()._mapping
+        members = project_member_emails(conn, job["project_id"])
+    project_id = job["project_id"]
+    checkpoint = job["rows_done"]
+    if offset not in (0, job["bytes_done"]):
+        raise ValueError(f"An import can only restart at byte 0 or at its checkpoint ({job['bytes_done']})")
+
+    if offset:
+        row_number, skip_rows = checkpoint, 0
+    else:
+        row_number, skip_rows = 0, checkpoint
+
+    rows = skipped = imported = failed = 0
+    errors = []
+    issues, comments = [], []
+    batch_failed = 0
+    bytes_done = offset
+    now = datetime.now(timezone.utc)
+
+    def flush(finished: bool = False):
+        nonlocal issues, comments, batch_failed, imported, failed, checkpoint, now
+        _commit_batch(engine, job_id, project_id, checkpoint, issues, comments,
+                      row_number, bytes_done, batch_failed, finished)
+        checkpoint = row_number
+        if progress is not None:
+            progress(len(issues) + batch_failed)
+        imported += len(issues)
+        failed += batch_failed
+        issues, comments, batch_failed = [], [], 0
+        now = datetime.now(timezone.utc)
+
+    for record, error, end in iter_rows(chunks, job["format"], offset, skip_rows, csv_header):
+        row_number += 1
+        bytes_done = end
+        if record is SKIPPED:
+            skipped += 1
+            continue
+        rows += 1
+        if error is None:
+            try:
+                issue, issue_comments = prepare_row(record, members, project_id, job["user_id"], now)
+            except ValueError as exc:
+                error = str(exc)
+            else:
+                issues.append(issue)
+                comments.append(issue_comments)
+        if error is not None:
+            batch_failed += 1
+            if len(errors) < MAX_REPORTED_ERRORS:
+                errors.append({"row": row_number, "detail": error})
+        if len(issues) + batch_failed >= batch_rows:
+            flush()
+    if skipped < skip_rows:
+        raise ImportFileError(f"The input ends before the job's checkpoint at row {skip_rows}")
+    flush(finished=True)
+
+    elapsed = time.perf_counter() - start
+    return {
+        "job_id": job_id,
+        "status": ImportStatus.completed,
+        "rows": rows,
+        "imported": imported,
+        "failed": failed,
+        "skipped": skipped,
+        "elapsed_seconds": round(elapsed, 3),
+        "rows_per_second": round(rows / elapsed, 1) if elapsed else 0.0,
+        "errors": errors,
+        "errors_truncated": failed > len(errors),
+    }
@@ -0,0 +1,49 @@
+"""Serialized ``list_issues`` pages shared by every caller allowed to see the project.
+
+Keys start with ``(project_id, project_version)``: any write that could change a
+page bumps the version, so an entry can never be served after the data behind it
+changed, and the same holds across worker processes. ``invalidate_issue_lists``
+only frees the entries that can no longer be hit. Membership is checked before
+the cache is consulted, so it never decides who sees a page.
+"""
+from typing import Optional
+
+from app.core.cache import BytesLRUCache
+from app.core.config import settings
+
+# key -> (JSON body, X-Next-Cursor value or None)
+issue_list_cache = BytesLRUCache(maxbytes=settings.ISSUE_LIST_CACHE_MAX_BYTES)
+
+
+def issue_list_key(
+    project_id: int,
+    version: int,
+    q: Optional[str],
+    status,
+    priority,
+    assignee_id: Optional[int],
+    sort: str,
+    order: str,
+    page: int,
+    per_page: int,
+    cursor: Optional[str],
+) -> tuple:
+    """The query as list_issues reads it: falsy filters and an unused page number drop out."""
+    return (
+        project_id,
+        version,
+        q or None,
+        status.value if status else None,
+        priority.value if priority else None,
+        assignee_id or None,
+        sort,
+        order,
+        per_page,
+        # A cursor takes precedence over the page number
+        ("cursor", cursor) if cursor else ("page", page),
+    )
+
+
+def invalidate_issue_lists(project_id: int):
+    """Drop a project's cached pages; call once a write to it is committed."""
+    issue_list_cache.pop_where(lambda key: key[0] == project_id)
@@ -0,0 +1,224 @@
+"""Request metrics in the Prometheus text exposition format.
+
+Every API route gets its counters allocated once, when the routes are
+registered, so recording a request is a dict lookup plus a few integer
+increments. ``MetricsMiddleware`` runs on the event loop thread only, which is
+why the counters need no locking.
+"""
+import time
+from bisect import bisect_left
+from typing import Dict, List, Optional
+
+from app.db.instrumentation import current_stats
+
+# Seconds; the Prometheus client defaults
+LATENCY_BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0)
+STATUS_CLASSES = ("2xx", "3xx", "4xx", "5xx")
+
+CONTENT_TYPE = "text/plain; version=0.0.4; charset=utf-8"
+
+
+def _escape(value: str) -> str:
+    return value.replace("\\", "\\\\").replace("\n", "\\n").replace('"', '\\"')
+
+
+def _number(value) -> str:
+    if isinstance(value, float):
+        return repr(value)
+    return str(value)
+
+
+class RouteMetrics:
+    __slots__ = ("labels", "buckets", "duration_sum", "count", "statuses", "db_statements", "db_seconds")
+
+    def __init__(self, method: str, route: str):
+        self.labels = f'method="{_escape(method)}",route="{_escape(route)}"'
+        # One slot per bucket plus +Inf; made cumulative when rendered
+        self.buckets = [0] * (len(LATENCY_BUCKETS) + 1)
+        self.duration_sum = 0.0
+        self.count = 0
+        self.statuses = [0] * len(STATUS_CLASSES)
+        self.db_statements = 0
+        self.db_seconds = 0.0
+
+    def observe(self, duration: float, status_code: int, db_statements: int, db_seconds: float):
+        self.buckets[bisect_left(LATENCY_BUCKETS, duration)] += 1
+        self.duration_sum += duration
+        self.count += 1
+        index = status_code // 100 - 2
+        if 0 <= index < len(STATUS_CLASSES):
+            self.statuses[index] += 1
+        self.db_statements += db_statements
+        self.db_seconds += db_seconds
+
+
+class MetricsRegistry:
+    def __init__(self):
+        # Keyed by id(route): routes define __eq__ without __hash__, and live as long as the app
+        self.routes: Dict[int, Dict[str, RouteMetrics]] = {}
+        self.unmatched = RouteMetrics("", "unmatched")
+        self.in_flight = 0
+
+    def register_routes(self, routes):
+        """Allocate counters for every method of every route with a path template."""
+        for route in routes:
+            path = getattr(route, "path_format", None) or getattr(route, "path", None)
+            if path is None or id(route) in self.routes:
+                continue
+            methods = sorted(getattr(route, "methods", None) or ["GET"])
+            self.routes[id(route)] = {method: RouteMetrics(method, path) for method in methods}
+
+    def for_route(self, route, method: str) -> RouteMetrics:
+        by_method = self.routes.get(id(route))
+        if by_method is None:
+            return self.unmatched
+        return by_method.get(method) or self.unmatched
+
+    def all_routes(self) -> List[RouteMetrics]:
+        return [metrics for by_method in self.routes.values() for metrics in by_method.values()] + [self.unmatched]
+
+    def render(self, extra: Optional[Dict[str, tuple]] = None) -> str:
+        """The exposition text; ``extra`` maps metric names to ``(help, type, value)``."""
+        lines = []
+        routes = [metrics for metrics in self.all_routes() if metrics.count]
+
+        lines.append("# HELP http_request_duration_seconds Request latency by route.")
+        lines.append("# TYPE http_request_duration_seconds histogram")
+        for metrics in routes:
+            cumulative = 0
+            for bound, n in zip(LATENCY_BUCKETS + ("+Inf",), metrics.buckets):
+                cumulative += n
+                lines.append(f'http_request_duration_seconds_bucket{{{metrics.labels},le="{bound}"}} {cumulative}')
+            lines.append(f"http_request_duration_seconds_sum{{{metrics.labels}}} {_number(metrics.duration_sum)}")
+            lines.append(f"http_request_duration_seconds_count{{{metrics.labels}}} {metrics.count}")
+
+        lines.append("# HELP http_requests_total Responses by route and status class.")
+        lines.append("# TYPE http_requests_total counter")
+        for metrics in routes:
+            for status_class, n in zip(STATUS_CLASSES, metrics.statuses):
+                lines.append(f'http_requests_total{{{metrics.labels},status="{status_class}"}} {n}')
+
+        lines.append("# HELP http_request_db_statements_total SQL statements run by requests to a route.")
+        lines.append("# TYPE http_request_db_statements_total counter")
+        for metrics in routes:
+            lines.append(f"http_request_db_statements_total{{{metrics.labels}}} {metrics.db_statements}")
+
+        lines.append("# HELP http_request_db_seconds_total Time requests to a route spent in SQL statements.")
+        lines.append("# TYPE http_request_db_seconds_total counter")
+        for metrics in routes:
+            lines.append(f"http_request_db_seconds_total{{{metrics.labels}}} {_number(metrics.db_seconds)}")
+
+        lines.append("# HELP http_requests_in_flight Requests currently being served.")
+        lines.append("# TYPE http_requests_in_flight gauge")
+        lines.append(f"http_requests_in_flight {self.in_flight}")
+
+        for name, (help_text, kind, value) in (extra or {}).items():
+            lines.append(f"# HELP {name} {help_text}")
+            lines.append(f"# TYPE {name} {kind}")
+            lines.append(f"{name} {_number(value)}")
+
+        lines.append("")
+        return "\n".join(lines)
+
+
+registry = MetricsRegistry()
+
+
+def runtime_metrics() -> Dict[str, tuple]:
+    """Connection pool, cache, event stream and password hasher state, read at scrape time."""
+    from app.core.authz import membership_cache
+    from app.core.deps import token_cache
+    from app.core.events import event_broker
+    from app.core.list_cache import issue_list_cache
+    from app.core.security import password_hasher
+    from app.core.singleflight import read_coalescer
+    from app.core.config import settings
+    from app.db.base import get_async_engine, get_engine
+
+    values = {}
+    # The pool the API's requests draw from
+    pool = get_async_engine().pool if settings.DB_ASYNC else get_engine().pool
+    for name, attribute, help_text in (
+        ("db_pool_size", "size", "Configured connection pool size."),
+        ("db_pool_checked_out", "checkedout", "Connections currently checked out of the pool."),
+        ("db_pool_overflow", "overflow", "Connections open beyond the pool size."),
+    ):
+        method = getattr(pool, attribute, None)
+        if method is not None:
+            values[name] = (help_text, "gauge", method())
+
+    for prefix, cache in (("authz_cache", membership_cache), ("token_cache", token_cache)):
+        stats = cache.stats()
+        values[f"{prefix}_hits_total"] = ("Cache hits since the cache was last cleared.", "counter", stats["hits"])
+        values[f"{prefix}_misses_total"] = ("Cache misses since the cache was last cleared.", "counter", stats["misses"])
+        values[f"{prefix}_entries"] = ("Entries currently cached.", "gauge", stats["size"])
+
+    stats = issue_list_cache.stats()
+    values["issue_list_cache_hits_total"] = ("Issue list pages served from the cache.", "counter", stats["hits"])
+    values["issue_list_cache_misses_total"] = ("Issue list pages rendered from the database.", "counter", stats["misses"])
+    values["issue_list_cache_hit_ratio"] = ("Share of issue list lookups served from the cache.", "gauge", stats["hit_ratio"])
+    values["issue_list_cache_entries"] = ("Issue list pages currently cached.", "gauge", stats["size"])
+    values["issue_list_cache_bytes"] = ("Bytes held by cached issue list pages.", "gauge", stats["bytes"])
+    
+    values["coalesced_executions_total"] = (
+        "Read computations run on behalf of one or more identical requests.", "counter", read_coalescer.executions
+    )
+    values["coalesced_requests_total"] = (
+        "Requests that waited for an identical in-flight computation instead of running their own.",
+        "counter", read_coalescer.shared,
+    )
+    values["coalesced_timeouts_total"] = (
+        "Requests that gave up waiting for an in-flight computation.", "counter", read_coalescer.timeouts
+    )
+    
+    values["event_subscribers"] = ("Open project event streams.", "gauge", event_broker.subscribers())
+    values["events_published_total"] = ("Project events published.", "counter", event_broker.published)
+    values["event_subscribers_dropped_total"] = (
+        "Event streams closed because the subscriber fell too far behind.", "counter", event_broker.dropped
+    )
+    
+    values["password_hash_in_flight"] = ("Password hashes running or queued.", "gauge", password_hasher.in_flight)
+    values["password_hash_rejected_total"] = (
+        "Password hashes refused because the hasher was full.", "counter", password_hasher.rejected
+    )
+    return values
+
+
+class MetricsMiddleware:
+    """Record latency, status, and SQL statement counts for each HTTP request.
+
+    Must sit inside ``QueryStatsMiddleware`` to see the request's statements.
+    """
+
+    def __init__(self, app, registry: MetricsRegistry = registry):
+        self.app = app
+        self.registry = registry
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        status_code = 500
+
+        async def send_with_status(message):
+            nonlocal status_code
+            if message["type"] == "http.response.start":
+                status_code = message["status"]
+            await send(message)
+
+        registry = self.registry
+        registry.in_flight += 1
+        start = time.perf_counter()
+        try:
+            await self.app(scope, receive, send_with_status)
+        finally:
+            duration = time.perf_counter() - start
+            registry.in_flight -= 1
+            stats = current_stats()
+            registry.for_route(scope.get("route"), scope["method"]).observe(
+                duration,
+                status_code,
+                stats.count if stats is not None else 0,
+                stats.duration if stats is not None else 0.0,
+            )
@@ -0,0 +1,80 @@
+import base64
+import json
+from datetime import date, datetime
+from typing import Any, Optional
+
+from sqlalchemy import DateTime, String, and_, or_, tuple_, type_coerce
+
+
+def encode_cursor(payload: dict) -> str:
+    def default(value):
+        if isinstance(value, (datetime, date)):
+            return value.isoformat()
+        raise TypeError(f"Cannot encode {type(value).__name__} in a cursor")
+
+    raw = json.dumps(payload, separators=(",", ":"), default=default).encode()
+    return base64.urlsafe_b64encode(raw).rstrip(b"=").decode()
+
+
+def decode_cursor(cursor: str) -> dict:
+    """Inverse of ``encode_cursor``; raises ``ValueError`` for anything malformed."""
+    try:
+        padded = cursor + "=" * (-len(cursor) % 4)
+        payload = json.loads(base64.urlsafe_b64decode(padded.encode()))
+    except Exception as exc:
+        raise ValueError("Malformed cursor") from exc
+    if not isinstance(payload, dict):
+        raise ValueError("Malformed cursor")
+    return payload
+
+
+def keyset_column(column, dialect_name: str):
+    """Column expression whose values go into, and are compared against, cursors.
+
+    SQLite keeps timestamps as text and ``CURRENT_TIMESTAMP`` defaults have no
+    fractional seconds, while SQLAlchemy binds datetimes with microseconds. Using
+    the stored text on both sides keeps ties comparing equal.
+    """
+    if dialect_name == "sqlite":
+        return type_coerce(column, String)
+    return column
+
+
+def keyset_value(column, value: Any, dialect_name: str):
+    if dialect_name != "sqlite" and isinstance(column.type, DateTime) and isinstance(value, str):
+        return datetime.fromisoformat(value)
+    return value
+
+
+def keyset_after(column, id_column, value: Any, last_id: int, descending: bool, dialect_name: str = ""):
+    """Rows strictly after ``(value, last_id)`` in ``ORDER BY column, id`` order."""
+    # Row-value comparisons let SQLite and PostgreSQL seek straight into the index
+    if dialect_name in ("sqlite", "postgresql"):
+        key, bound = tuple_(column, id_column), tuple_(value, last_id)
+        return key < bound if descending else key > bound
+    if descending:
+        return or_(column < value, and_(column == value, id_column < last_id))
+    return or_(column > value, and_(column == value, id_column > last_id))
+
+
+def cursor_for(values: dict, value: Any, last_id: int) -> str:
+    return encode_cursor({**values, "v": value, "i": last_id})
+
+
+def read_cursor(cursor: Optional[str], **expected) -> Optional[dict]:
+    """Decode ``cursor`` and check it was issued for the same ``expected`` settings."""
+    if not cursor:
+        return None
+    payload = decode_cursor(cursor)
+    if "i" not in payload or "v" not in payload:
+        raise ValueError("Malformed cursor")
+    # Both are bound into SQL as they are; a hand-edited cursor must not reach the query
+    last_id, value = payload["i"], payload["v"]
+    if not isinstance(last_id, int) or isinstance(last_id, bool):
+        raise ValueError("Malformed cursor")
+    if value is not None and not isinstance(value, (str, int, float)):
+        raise ValueError("Malformed cursor")
+    for key, value in expected.items():
+        if payload.get(key) != value:
+            raise ValueError("Cursor does not match the requested sort order")
+    return payload
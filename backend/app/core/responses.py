@@ -0,0 +1,52 @@
+import json
+from functools import lru_cache
+from typing import Any, Optional
+
+from pydantic import TypeAdapter
+from starlette.background import BackgroundTask
+from starlette.responses import JSONResponse
+
+try:
+    import orjson
+except ImportError:  # optional speedup
+    orjson = None
+
+
+@lru_cache(maxsize=None)
+def json_adapter(tp) -> TypeAdapter:
+    """One ``TypeAdapter`` per response type, built on first use and reused."""
+    return TypeAdapter(tp)
+
+
+class FastJSONResponse(JSONResponse):
+    """JSON response that skips FastAPI's response-model pass when given an ``adapter``.
+
+    ``FastJSONResponse(models, adapter=json_adapter(List[Schema]))`` writes the
+    bytes straight from pydantic-core's serializer, producing the same JSON as the
+    ``response_model`` pipeline (datetimes, enums, compact separators, raw UTF-8)
+    without validating the models a second time. As a ``response_class`` it renders
+    already-serialized content with orjson when installed; orjson writes floats in
+    shortest form (``1e-05`` becomes ``0.00001``), so keep float-bearing routes on
+    the adapter or the default class if byte-for-byte output matters.
+    """
+
+    def __init__(
+        self,
+        content: Any,
+        status_code: int = 200,
+        headers: Optional[dict] = None,
+        media_type: Optional[str] = None,
+        background: Optional[BackgroundTask] = None,
+        adapter: Optional[TypeAdapter] = None,
+    ):
+        self.adapter = adapter
+        super().__init__(content, status_code, headers, media_type, background)
+
+    def render(self, content: Any) -> bytes:
+        if self.adapter is not None:
+            return self.adapter.dump_json(content)
+        if orjson is not None:
+            return orjson.dumps(content)
+        return json.dumps(
+            content, ensure_ascii=False, allow_nan=False, indent=None, separators=(",", ":")
+        ).encode("utf-8")
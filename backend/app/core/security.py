@@ -1,16 +1,25 @@
+import asyncio
+import threading
+from concurrent.futures import Future, ThreadPoolExecutor
 from datetime import datetime, timedelta
-from typing import Optional
+from typing import Callable, Optional, Tuple
 
 from jose import JWTError, jwt
 from passlib.context import CryptContext
 
+from app.core.config import settings
+
+# min/max pin every stored hash to the configured cost, so changing
+# PASSWORD_HASH_ROUNDS makes old hashes "need update" and they are rehashed on login
 pwd_context = CryptContext(
     schemes=["pbkdf2_sha256"],
     deprecated="auto",
+    pbkdf2_sha256__default_rounds=settings.PASSWORD_HASH_ROUNDS,
+    pbkdf2_sha256__min_rounds=settings.PASSWORD_HASH_ROUNDS,
+    pbkdf2_sha256__max_rounds=settings.PASSWORD_HASH_ROUNDS,
 )
 
 def create_access_token(data: dict, expires_delta: Optional[timedelta] = None):
-    from app.core.config import settings
     to_encode = data.copy()
     if expires_delta:
         expire = datetime.utcnow() + expires_delta
@@ -23,7 +32,6 @@ def create_access_token(data: dict, expires_delta: Optional[timedelta] = None):
 
 def verify_token(token: str) -> Optional[dict]:
     try:
-        from app.core.config import settings
         payload = jwt.decode(token, settings.SECRET_KEY, algorithms=[settings.ALGORITHM])
         return payload
     except JWTError:
@@ -32,5 +40,75 @@ def verify_token(token: str) -> Optional[dict]:
 def verify_password(plain_password: str, hashed_password: str) -> bool:
     return pwd_context.verify(plain_password, hashed_password)
 
+def verify_and_update_password(plain_password: str, hashed_password: str) -> Tuple[bool, Optional[str]]:
+    """``(valid, new_hash)``; ``new_hash`` is set when the stored hash predates the current policy."""
+    return pwd_context.verify_and_update(plain_password, hashed_password)
+
 def get_password_hash(password: str) -> str:
     return pwd_context.hash(password)
+
+
+class PasswordHasherBusy(Exception):
+    """Raised instead of queueing when the password hasher is saturated."""
+
+
+class PasswordHasher:
+    """Runs password hashing on its own small thread pool with a bounded queue.
+
+    Hashing is deliberately slow; keeping it off the shared request threadpool stops
+    a burst of logins from starving every other endpoint. Once ``workers + queue_depth``
+    jobs are in flight new ones fail fast with ``PasswordHasherBusy``.
+    """
+
+    def __init__(self, workers: int, queue_depth: int):
+        self.workers = workers
+        self.capacity = workers + queue_depth
+        self._slots = threading.BoundedSemaphore(self.capacity)
+        self._executor: Optional[ThreadPoolExecutor] = None
+        self._lock = threading.Lock()
+        self.in_flight = 0
+        self.rejected = 0
+
+    def _get_executor(self) -> ThreadPoolExecutor:
+        with self._lock:
+            if self._executor is None:
+                self._executor = ThreadPoolExecutor(
+                    max_workers=self.workers, thread_name_prefix="password-hash"
+                )
+            return self._executor
+
+    def submit(self, fn: Callable, *args) -> Future:
+        if not self._slots.acquire(blocking=False):
+            with self._lock:
+                self.rejected += 1
+            raise PasswordHasherBusy()
+        with self._lock:
+            self.in_flight += 1
+        try:
+            future = self._get_executor().submit(fn, *args)
+        except BaseException:
+            self._release()
+            raise
+        future.add_done_callback(lambda _: self._release())
+        return future
+
+    def _release(self):
+        with self._lock:
+            self.in_flight -= 1
+        self._slots.release()
+
+    async def run(self, fn: Callable, *args):
+        return await asyncio.wrap_future(self.submit(fn, *args))
+
+    def shutdown(self):
+        """Stop the worker threads; a later ``submit`` starts a fresh pool."""
+        with self._lock:
+            executor, self._executor = self._executor, None
+        if executor is not None:
+            executor.shutdown(wait=True)
+
+
+password_hasher = PasswordHasher(
+    workers=settings.PASSWORD_HASH_WORKERS,
+    queue_depth=settings.PASSWORD_HASH_QUEUE_DEPTH,
+)
@@ -0,0 +1,133 @@
+"""Coalescing of identical concurrent reads.
+
+When many callers ask for the same thing at once (a big project's board opened
+by the whole team after a deploy), only the first runs the queries; the others
+wait for its result, or its exception, instead of repeating them. Callers
+check their own authorization before joining, and keys include everything the
+result depends on, including the version counter it was read at.
+
+Callers may be threadpool threads or, with ``DB_ASYNC``, SQLAlchemy greenlets
+on the event loop; the latter wait on an asyncio future so that the loop
+keeps serving the leader and everyone else.
+"""
+import asyncio
+import threading
+from typing import Any, Callable, Dict, Hashable
+
+from fastapi import HTTPException, status
+from sqlalchemy.util import await_only
+from sqlalchemy.util.concurrency import in_greenlet
+
+from app.core.config import settings
+
+
+class CoalescingTimeout(Exception):
+    """The in-flight computation a caller joined did not finish within the timeout."""
+
+
+class _Call:
+    __slots__ = ("done", "result", "error", "futures")
+
+    def __init__(self):
+        self.done = threading.Event()
+        self.result = None
+        self.error = None
+        # (loop, future) of every waiter on an event loop
+        self.futures = []
+
+
+def _resolve(future: asyncio.Future):
+    if not future.done():
+        future.set_result(None)
+
+
+class SingleFlight:
+    """Run ``fn`` once per key at a time and hand its outcome to every caller waiting on that key.
+
+    Results are not kept once the computation finishes; this only merges calls that overlap.
+    """
+
+    def __init__(self, timeout: float, enabled: bool = True):
+        self.timeout = timeout
+        self.enabled = enabled
+        self.executions = 0
+        self.shared = 0
+        self.timeouts = 0
+        self._calls: Dict[Hashable, _Call] = {}
+        self._lock = threading.Lock()
+
+    def in_flight(self) -> int:
+        return len(self._calls)
+
+    def do(self, key: Hashable, fn: Callable[[], Any]) -> Any:
+        if not self.enabled:
+            return fn()
+        with self._lock:
+            call = self._calls.get(key)
+            leader = call is None
+            if leader:
+                call = self._calls[key] = _Call()
+                self.executions += 1
+            else:
+                self.shared += 1
+
+        if not leader:
+            if not self._wait(call):
+                with self._lock:
+                    self.timeouts += 1
+                raise CoalescingTimeout(key)
+            if call.error is not None:
+                raise call.error
+            return call.result
+
+        try:
+            call.result = fn()
+        except BaseException as exc:
+            call.error = exc
+            raise
+        finally:
+            # Later callers start a fresh computation rather than reuse this one
+            with self._lock:
+                del self._calls[key]
+                call.done.set()
+                futures, call.futures = call.futures, []
+            for loop, future in futures:
+                loop.call_soon_threadsafe(_resolve, future)
+        return call.result
+
+    def _wait(self, call: _Call) -> bool:
+        if in_greenlet():
+            # Blocking here would block the event loop the leader may be running on
+            return await_only(self._wait_async(call))
+        return call.done.wait(self.timeout)
+
+    async def _wait_async(self, call: _Call) -> bool:
+        loop = asyncio.get_running_loop()
+        future = loop.create_future()
+        with self._lock:
+            if call.done.is_set():
+                return True
+            call.futures.append((loop, future))
+        try:
+            await asyncio.wait_for(future, self.timeout)
+        except asyncio.TimeoutError:
+            return False
+        return True
+
+
+read_coalescer = SingleFlight(
+    timeout=settings.REQUEST_COALESCING_TIMEOUT_SECONDS,
+    enabled=settings.REQUEST_COALESCING,
+)
+
+
+def coalesced(key: Hashable, fn: Callable[[], Any]) -> Any:
+    """``read_coalescer.do`` for endpoints: a follower that times out gets a 503."""
+    try:
+        return read_coalescer.do(key, fn)
+    except CoalescingTimeout:
+        raise HTTPException(
+            status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+            detail="The server is busy, please retry shortly",
+            headers={"Retry-After": "1"},
+        )
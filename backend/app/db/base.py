@@ -1,27 +1,192 @@
-from sqlalchemy import create_engine
+import os
+import threading
+
+from sqlalchemy import create_engine, event
 from sqlalchemy.ext.declarative import declarative_base
 from sqlalchemy.orm import sessionmaker
 
 # Define Base without importing settings to avoid side effects during Alembic
 Base = declarative_base()
 
+# One engine (and connection pool) per process, created on first use
+_engine = None
+_session_local = None
+_async_engine = None
+_async_session_local = None
+_engine_lock = threading.Lock()
 
-def get_engine():
-    import os
 
-    database_url = os.getenv("DATABASE_URL", "sqlite:///./issuehub.db")
+def _is_memory_sqlite(database_url: str) -> bool:
+    return database_url.startswith("sqlite") and (
+        ":memory:" in database_url or database_url.rstrip("/") in ("sqlite:", "sqlite://")
+    )
 
-    if database_url.startswith("sqlite"):
-        return create_engine(
-            database_url,
-            connect_args={"check_same_thread": False},
+
+def apply_sqlite_pragmas(dbapi_connection, memory: bool = False):
+    from app.core.config import settings
+
+    cursor = dbapi_connection.cursor()
+    try:
+        # WAL lets readers run alongside the single writer; it is meaningless in memory
+        if not memory:
+            cursor.execute("PRAGMA journal_mode=WAL")
+            cursor.execute("PRAGMA synchronous=NORMAL")
+            cursor.execute(f"PRAGMA mmap_size={int(settings.SQLITE_MMAP_SIZE)}")
+        cursor.execute(f"PRAGMA cache_size={int(settings.SQLITE_CACHE_SIZE)}")
+        cursor.execute(f"PRAGMA busy_timeout={int(settings.SQLITE_BUSY_TIMEOUT_MS)}")
+        cursor.execute("PRAGMA foreign_keys=ON")
+        cursor.execute("PRAGMA temp_store=MEMORY")
+    finally:
+        cursor.close()
+
+
+def _engine_options(database_url: str) -> dict:
+    from app.core.config import settings
+
+    options = {"pool_pre_ping": settings.DB_POOL_PRE_PING}
+    # In-memory SQLite uses a single-connection pool that takes no sizing options
+    if not _is_memory_sqlite(database_url):
+        options.update(
+            pool_size=settings.DB_POOL_SIZE,
+            max_overflow=settings.DB_MAX_OVERFLOW,
+            pool_recycle=settings.DB_POOL_RECYCLE,
+            pool_timeout=settings.DB_POOL_TIMEOUT,
         )
-    return create_engine(database_url)
+    return options
+
+
+def _install_hooks(engine, database_url: str):
+    """SQLite pragmas and statement instrumentation, on a sync engine or an async engine's ``sync_engine``."""
+    from app.core.config import settings
+
+    if database_url.startswith("sqlite") and settings.SQLITE_PERFORMANCE_PROFILE:
+        memory = _is_memory_sqlite(database_url)
+
+        @event.listens_for(engine, "connect")
+        def _on_connect(dbapi_connection, connection_record):
+            apply_sqlite_pragmas(dbapi_connection, memory=memory)
+
+    if settings.SQL_INSTRUMENTATION:
+        from app.db import instrumentation
+
+        instrumentation.install(engine)
+
+
+def create_db_engine(database_url: str = None):
+    from app.core.config import settings
+
+    database_url = database_url or settings.DATABASE_URL
+
+    engine_kwargs = _engine_options(database_url)
+    if database_url.startswith("sqlite"):
+        engine_kwargs["connect_args"] = {"check_same_thread": False}
+
+    engine = create_engine(database_url, **engine_kwargs)
+    _install_hooks(engine, database_url)
+    return engine
+
+
+# Sync URL scheme -> the async driver used for it when DB_ASYNC is on
+ASYNC_DRIVERS = {"sqlite": "sqlite+aiosqlite", "postgresql": "postgresql+asyncpg"}
+
+
+def async_database_url(database_url: str) -> str:
+    """``database_url`` with its driver swapped for the async one (aiosqlite or asyncpg)."""
+    scheme, separator, rest = database_url.partition("://")
+    if scheme in ASYNC_DRIVERS.values():
+        return database_url
+    driver = ASYNC_DRIVERS.get(scheme.split("+")[0])
+    if driver is None or not separator:
+        raise ValueError(f"No async driver for {scheme}; set ASYNC_DATABASE_URL")
+    return f"{driver}://{rest}"
+
+
+def create_async_db_engine(database_url: str = None):
+    from sqlalchemy.ext.asyncio import create_async_engine
+
+    from app.core.config import settings
+
+    database_url = database_url or settings.ASYNC_DATABASE_URL or async_database_url(settings.DATABASE_URL)
+    engine = create_async_engine(database_url, **_engine_options(database_url))
+    _install_hooks(engine.sync_engine, database_url)
+    return engine
+
+
+def get_engine():
+    global _engine
+    if _engine is None:
+        with _engine_lock:
+            if _engine is None:
+                _engine = create_db_engine()
+    return _engine
 
 
 def get_session_local():
-    engine = get_engine()
-    return sessionmaker(autocommit=False, autoflush=False, bind=engine)
+    global _session_local
+    if _session_local is None:
+        engine = get_engine()
+        with _engine_lock:
+            if _session_local is None:
+                _session_local = sessionmaker(autocommit=False, autoflush=False, bind=engine)
+    return _session_local
+
+
+def get_async_engine():
+    """The process's ``AsyncEngine``, used by the API when ``DB_ASYNC`` is on."""
+    global _async_engine
+    if _async_engine is None:
+        with _engine_lock:
+            if _async_engine is None:
+                _async_engine = create_async_db_engine()
+    return _async_engine
+
+
+def get_async_session_local():
+    global _async_session_local
+    if _async_session_local is None:
+        from sqlalchemy.ext.asyncio import async_sessionmaker
+
+        engine = get_async_engine()
+        with _engine_lock:
+            if _async_session_local is None:
+                _async_session_local = async_sessionmaker(bind=engine, autoflush=False)
+    return _async_session_local
+
+
+def dispose_engine():
+    """Close every pooled connection and forget the engine.
+
+    The next call to ``get_engine`` builds a fresh one.
+    """
+    global _engine, _session_local
+    with _engine_lock:
+        if _engine is not None:
+            _engine.dispose()
+        _engine = None
+        _session_local = None
+
+
+async def dispose_async_engine():
+    """``dispose_engine`` for the async engine; its connections close on the event loop."""
+    global _async_engine, _async_session_local
+    engine, _async_engine, _async_session_local = _async_engine, None, None
+    if engine is not None:
+        await engine.dispose()
+
+
+def _reset_engine_after_fork():
+    # Connections inherited from the parent must not be used (or closed) by the
+    # child, so drop them without touching the sockets and start a new pool.
+    global _engine_lock
+    _engine_lock = threading.Lock()
+    if _engine is not None:
+        _engine.dispose(close=False)
+    if _async_engine is not None:
+        _async_engine.sync_engine.dispose(close=False)
+
+
+if hasattr(os, "register_at_fork"):
+    os.register_at_fork(after_in_child=_reset_engine_after_fork)
 
 
 def get_db():
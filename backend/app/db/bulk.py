@@ -0,0 +1,17 @@
+from typing import List, Union
+
+from sqlalchemy import insert
+from sqlalchemy.engine import Connection
+from sqlalchemy.orm import Session
+
+
+def insert_returning_ids(connection: Union[Connection, Session], model, rows: List[dict]) -> List[int]:
+    """Insert ``rows`` with multi-row INSERT ... RETURNING statements; ids come back in input order."""
+    dialect = connection.get_bind().dialect if isinstance(connection, Session) else connection.dialect
+    if dialect.name == "sqlite":
+        # SQLite can't batch an ordered RETURNING, but under its single write lock
+        # the rows of each statement get ascending rowids in VALUES order
+        return sorted(connection.execute(insert(model).returning(model.id), rows).scalars())
+    return list(connection.execute(
+        insert(model).returning(model.id, sort_by_parameter_order=True), rows
+    ).scalars())
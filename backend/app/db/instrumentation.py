@@ -0,0 +1,157 @@
+"""Per-request SQL statistics: statement count, time spent in the database and
+repeated queries (the usual sign of an N+1 query).
+
+``install(engine)`` adds cursor-level event hooks to an engine. Statements are
+attributed to whatever ``QueryStats`` is active in the current context, which
+``QueryStatsMiddleware`` sets up for every HTTP request and reports back as a
+``Server-Timing`` header.
+"""
+import logging
+import re
+import time
+from collections import Counter
+from contextlib import contextmanager
+from contextvars import ContextVar
+from typing import List, Optional, Tuple
+
+from sqlalchemy import event
+
+logger = logging.getLogger(__name__)
+
+_current_stats: ContextVar[Optional["QueryStats"]] = ContextVar("query_stats", default=None)
+
+# Expanded IN lists and VALUES rows differ only in their number of placeholders
+_PLACEHOLDER_LIST = re.compile(r"\((?:\s*(?:\?|%\(\w+\)s|:\w+|\$\d+)\s*,)+\s*(?:\?|%\(\w+\)s|:\w+|\$\d+)\s*\)")
+_WHITESPACE = re.compile(r"\s+")
+_READ = re.compile(r"(?:SELECT|WITH)\b", re.IGNORECASE)
+
+
+def fingerprint(statement: str) -> str:
+    """Normalize a statement so executions that differ only in parameters compare equal."""
+    statement = _WHITESPACE.sub(" ", statement).strip()
+    return _PLACEHOLDER_LIST.sub("(?)", statement)
+
+
+class QueryStats:
+    __slots__ = ("count", "duration", "statements")
+
+    def __init__(self):
+        self.count = 0
+        self.duration = 0.0
+        self.statements = Counter()
+
+    def record(self, statement: str, duration: float):
+        self.count += 1
+        self.duration += duration
+        self.statements[statement] += 1
+
+    def repeated(self, threshold: int = 2) -> List[Tuple[str, int]]:
+        """SELECT fingerprints executed at least ``threshold`` times, most frequent first.
+
+        Writes are left out: a batch INSERT or UPDATE is sent as several pages of
+        the same statement (executemany, insertmanyvalues), which is no N+1.
+        """
+        if self.count < threshold:
+            return []
+        counts = Counter()
+        for statement, n in self.statements.items():
+            sql = fingerprint(statement)
+            if _READ.match(sql):
+                counts[sql] += n
+        return [(sql, n) for sql, n in counts.most_common() if n >= threshold]
+
+
+def _before_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+    context._query_start = time.perf_counter()
+
+
+def _after_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+    stats = _current_stats.get()
+    if stats is not None:
+        stats.record(statement, time.perf_counter() - context._query_start)
+
+
+def install(engine):
+    """Attribute the engine's statements to the active ``QueryStats``; safe to call twice."""
+    if not event.contains(engine, "after_cursor_execute", _after_cursor_execute):
+        event.listen(engine, "before_cursor_execute", _before_cursor_execute)
+        event.listen(engine, "after_cursor_execute", _after_cursor_execute)
+
+
+def current_stats() -> Optional[QueryStats]:
+    return _current_stats.get()
+
+
+@contextmanager
+def track_queries():
+    """Collect the statements run in this context (and threads it hands work to)."""
+    stats = QueryStats()
+    token = _current_stats.set(stats)
+    try:
+        yield stats
+    finally:
+        _current_stats.reset(token)
+
+
+@contextmanager
+def capture_queries(engine):
+    """Collect every statement the engine runs, from any thread, while the block is active."""
+    stats = QueryStats()
+    started = {}
+
+    def before(conn, cursor, statement, parameters, context, executemany):
+        started[id(context)] = time.perf_counter()
+
+    def after(conn, cursor, statement, parameters, context, executemany):
+        stats.record(statement, time.perf_counter() - started.pop(id(context), time.perf_counter()))
+
+    event.listen(engine, "before_cursor_execute", before)
+    event.listen(engine, "after_cursor_execute", after)
+    try:
+        yield stats
+    finally:
+        event.remove(engine, "before_cursor_execute", before)
+        event.remove(engine, "after_cursor_execute", after)
+
+
+def server_timing(stats: QueryStats, repeated_threshold: int) -> str:
+    repeated = stats.repeated(repeated_threshold) if repeated_threshold > 0 else []
+    value = f'db;dur={stats.duration * 1000:.2f};desc="{stats.count} queries"'
+    if repeated:
+        value += f', db-repeated;desc="{sum(n for _, n in repeated)} repeated in {len(repeated)} statements"'
+    return value
+
+
+class QueryStatsMiddleware:
+    """Track the statements of each HTTP request and add a ``Server-Timing`` header.
+
+    Queries that repeat ``repeated_threshold`` times or more within one request
+    are also logged as a warning, since they usually mean a query inside a loop.
+    """
+
+    def __init__(self, app, repeated_threshold: int = 5):
+        self.app = app
+        self.repeated_threshold = repeated_threshold
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        with track_queries() as stats:
+            async def send_with_timing(message):
+                if message["type"] == "http.response.start":
+                    headers = list(message.get("headers", []))
+                    headers.append((b"server-timing", server_timing(stats, self.repeated_threshold).encode("latin-1")))
+                    message = {**message, "headers": headers}
+                await send(message)
+
+            try:
+                await self.app(scope, receive, send_with_timing)
+            finally:
+                if self.repeated_threshold > 0:
+                    for sql, n in stats.repeated(self.repeated_threshold):
+                        logger.warning(
+                            "%s %s ran %d times in one request: %s",
+                            scope.get("method"), scope.get("path"), n, sql,
+                        )
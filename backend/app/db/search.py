@@ -0,0 +1,252 @@
+"""Full-text search over issue titles, descriptions and comment bodies.
+
+SQLite keeps an FTS5 table (``issue_search``, one row per issue) in sync with
+triggers. PostgreSQL gets generated ``tsvector`` columns with GIN indexes on
+``issues`` and ``comments``. Other databases fall back to ``ILIKE``.
+"""
+import re
+from typing import List, Optional, Tuple
+
+from sqlalchemy import event, literal, or_, text
+
+from app.db.base import Base
+from app.models.issue import Issue
+
+# Marks matched terms in snippets; plain text so clients never need to render HTML
+HIGHLIGHT_START = "**"
+HIGHLIGHT_END = "**"
+
+SQLITE_INSTALL = [
+    """
+    CREATE VIRTUAL TABLE IF NOT EXISTS issue_search USING fts5(
+        title, description, comments,
+        tokenize = 'porter unicode61 remove_diacritics 2'
+    )
+    """,
+    """
+    CREATE TRIGGER IF NOT EXISTS issues_search_insert AFTER INSERT ON issues BEGIN
+        INSERT INTO issue_search (rowid, title, description, comments)
+        VALUES (new.id, new.title, coalesce(new.description, ''), '');
+    END
+    """,
+    """
+    CREATE TRIGGER IF NOT EXISTS issues_search_update AFTER UPDATE OF title, description ON issues BEGIN
+        UPDATE issue_search SET title = new.title, description = coalesce(new.description, '')
+        WHERE rowid = new.id;
+    END
+    """,
+    """
+    CREATE TRIGGER IF NOT EXISTS issues_search_delete AFTER DELETE ON issues BEGIN
+        DELETE FROM issue_search WHERE rowid = old.id;
+    END
+    """,
+    """
+    CREATE TRIGGER IF NOT EXISTS comments_search_insert AFTER INSERT ON comments BEGIN
+        UPDATE issue_search SET comments = comments || ' ' || new.body WHERE rowid = new.issue_id;
+    END
+    """,
+    """
+    CREATE TRIGGER IF NOT EXISTS comments_search_update AFTER UPDATE OF body ON comments BEGIN
+        UPDATE issue_search SET comments = coalesce(
+            (SELECT group_concat(body, ' ') FROM comments WHERE issue_id = new.issue_id), ''
+        ) WHERE rowid = new.issue_id;
+    END
+    """,
+    """
+    CREATE TRIGGER IF NOT EXISTS comments_search_delete AFTER DELETE ON comments BEGIN
+        UPDATE issue_search SET comments = coalesce(
+            (SELECT group_concat(body, ' ') FROM comments WHERE issue_id = old.issue_id), ''
+        ) WHERE rowid = old.issue_id;
+    END
+    """,
+]
+
+SQLITE_UNINSTALL = [
+    "DROP TRIGGER IF EXISTS comments_search_delete",
+    "DROP TRIGGER IF EXISTS comments_search_update",
+    "DROP TRIGGER IF EXISTS comments_search_insert",
+    "DROP TRIGGER IF EXISTS issues_search_delete",
+    "DROP TRIGGER IF EXISTS issues_search_update",
+    "DROP TRIGGER IF EXISTS issues_search_insert",
+    "DROP TABLE IF EXISTS issue_search",
+]
+
+SQLITE_REBUILD = [
+    "DELETE FROM issue_search",
+    """
+    INSERT INTO issue_search (rowid, title, description, comments)
+    SELECT issues.id, issues.title, coalesce(issues.description, ''),
+           coalesce((SELECT group_concat(body, ' ') FROM comments WHERE comments.issue_id = issues.id), '')
+    FROM issues
+    """,
+    "INSERT INTO issue_search (issue_search) VALUES ('optimize')",
+]
+
+POSTGRESQL_COLUMNS = [
+    """
+    ALTER TABLE issues ADD COLUMN IF NOT EXISTS search_vector tsvector GENERATED ALWAYS AS (
+        setweight(to_tsvector('english', coalesce(title, '')), 'A') ||
+        setweight(to_tsvector('english', coalesce(description, '')), 'B')
+    ) STORED
+    """,
+    """
+    ALTER TABLE comments ADD COLUMN IF NOT EXISTS search_vector tsvector GENERATED ALWAYS AS (
+        to_tsvector('english', body)
+    ) STORED
+    """,
+]
+
+POSTGRESQL_INDEXES = [
+    ("ix_issues_search_vector", "issues"),
+    ("ix_comments_search_vector", "comments"),
+]
+
+
+def _sqlite_has_index(connection) -> bool:
+    return connection.exec_driver_sql(
+        "SELECT 1 FROM sqlite_master WHERE type = 'table' AND name = 'issue_search'"
+    ).first() is not None
+
+
+def install_search_index(connection, concurrently: bool = False):
+    """Create the dialect's search index objects; populates a newly created SQLite index."""
+    dialect_name = connection.dialect.name
+    if dialect_name == "sqlite":
+        existed = _sqlite_has_index(connection)
+        for statement in SQLITE_INSTALL:
+            connection.exec_driver_sql(statement)
+        if not existed:
+            rebuild_search_index(connection)
+    elif dialect_name == "postgresql":
+        for statement in POSTGRESQL_COLUMNS:
+            connection.exec_driver_sql(statement)
+        keyword = " CONCURRENTLY" if concurrently else ""
+        for name, table in POSTGRESQL_INDEXES:
+            connection.exec_driver_sql(
+                f"CREATE INDEX{keyword} IF NOT EXISTS {name} ON {table} USING GIN (search_vector)"
+            )
+
+
+def uninstall_search_index(connection):
+    dialect_name = connection.dialect.name
+    if dialect_name == "sqlite":
+        for statement in SQLITE_UNINSTALL:
+            connection.exec_driver_sql(statement)
+    elif dialect_name == "postgresql":
+        for name, _ in POSTGRESQL_INDEXES:
+            connection.exec_driver_sql(f"DROP INDEX IF EXISTS {name}")
+        connection.exec_driver_sql("ALTER TABLE comments DROP COLUMN IF EXISTS search_vector")
+        connection.exec_driver_sql("ALTER TABLE issues DROP COLUMN IF EXISTS search_vector")
+
+
+def rebuild_search_index(connection):
+    """Rebuild the SQLite index from scratch, or the PostgreSQL GIN indexes.
+
+    On PostgreSQL this uses ``REINDEX ... CONCURRENTLY`` and therefore needs a
+    connection in autocommit mode.
+    """
+    dialect_name = connection.dialect.name
+    if dialect_name == "sqlite":
+        for statement in SQLITE_REBUILD:
+            connection.exec_driver_sql(statement)
+    elif dialect_name == "postgresql":
+        for name, _ in POSTGRESQL_INDEXES:
+            connection.exec_driver_sql(f"REINDEX INDEX CONCURRENTLY {name}")
+
+
+@event.listens_for(Base.metadata, "after_create")
+def _install_after_create(target, connection, **kw):
+    install_search_index(connection)
+
+
+@event.listens_for(Base.metadata, "before_drop")
+def _uninstall_before_drop(target, connection, **kw):
+    uninstall_search_index(connection)
+
+
+def fts5_query(q: str) -> Optional[str]:
+    """Turn free text into an FTS5 query: every word must match, as a prefix."""
+    terms = re.findall(r"\w+", q)
+    if not terms:
+        return None
+    return " ".join(f'"{term}"*' for term in terms)
+
+
+def search_filter(dialect_name: str, q: str):
+    """WHERE clause restricting ``Issue`` rows to those matching ``q``."""
+    if dialect_name == "sqlite":
+        match = fts5_query(q)
+        if match is None:
+            return Issue.id.is_(None)
+        return Issue.id.in_(
+            text("SELECT rowid FROM issue_search WHERE issue_search MATCH :search_q")
+            .bindparams(search_q=match)
+            .columns(Issue.id)
+        )
+    if dialect_name == "postgresql":
+        return or_(
+            text("issues.search_vector @@ websearch_to_tsquery('english', :search_q)").bindparams(search_q=q),
+            Issue.id.in_(
+                text(
+                    "SELECT comments.issue_id FROM comments "
+                    "WHERE comments.search_vector @@ websearch_to_tsquery('english', :search_q)"
+                ).bindparams(search_q=q).columns(Issue.id)
+            ),
+        )
+    pattern = f"%{q}%"
+    return or_(Issue.title.ilike(pattern), Issue.description.ilike(pattern))
+
+
+SQLITE_SEARCH = f"""
+    SELECT issue_search.rowid AS issue_id,
+           -bm25(issue_search, 10.0, 4.0, 1.0) AS rank,
+           snippet(issue_search, -1, '{HIGHLIGHT_START}', '{HIGHLIGHT_END}', '…', 16) AS snippet
+    FROM issue_search JOIN issues ON issues.id = issue_search.rowid
+    WHERE issue_search MATCH :q AND issues.project_id = :project_id
+    ORDER BY bm25(issue_search, 10.0, 4.0, 1.0), issue_search.rowid DESC
+    LIMIT :limit OFFSET :offset
+"""
+
+POSTGRESQL_SEARCH = f"""
+    WITH query AS (SELECT websearch_to_tsquery('english', :q) AS tsq),
+    hits AS (
+        SELECT issues.id FROM issues, query
+        WHERE issues.project_id = :project_id AND issues.search_vector @@ query.tsq
+        UNION
+        SELECT comments.issue_id FROM comments JOIN issues ON issues.id = comments.issue_id, query
+        WHERE issues.project_id = :project_id AND comments.search_vector @@ query.tsq
+    )
+    SELECT issues.id AS issue_id,
+           ts_rank(issues.search_vector, query.tsq) + coalesce(comment_hits.rank, 0) AS rank,
+           ts_headline(
+               'english', issues.title || ' ' || coalesce(issues.description, ''), query.tsq,
+               'StartSel={HIGHLIGHT_START}, StopSel={HIGHLIGHT_END}, MaxWords=24, MinWords=8, MaxFragments=1'
+           ) AS snippet
+    FROM hits JOIN issues ON issues.id = hits.id
+    CROSS JOIN query
+    LEFT JOIN LATERAL (
+        SELECT max(ts_rank(comments.search_vector, query.tsq)) * 0.5 AS rank
+        FROM comments
+        WHERE comments.issue_id = issues.id AND comments.search_vector @@ query.tsq
+    ) AS comment_hits ON true
+    ORDER BY rank DESC, issues.id DESC
+    LIMIT :limit OFFSET :offset
+"""
+
+
+def search_issues(db, project_id: int, q: str, limit: int, offset: int = 0) -> List[Tuple[int, float, Optional[str]]]:
+    """Ranked ``(issue_id, rank, snippet)`` rows for ``q`` within a project, best first."""
+    dialect_name = db.get_bind().dialect.name
+    params = {"project_id": project_id, "limit": limit, "offset": offset}
+    if dialect_name == "sqlite":
+        match = fts5_query(q)
+        if match is None:
+            return []
+        rows = db.execute(text(SQLITE_SEARCH), {**params, "q": match})
+    elif dialect_name == "postgresql":
+        rows = db.execute(text(POSTGRESQL_SEARCH), {**params, "q": q})
+    else:
+        rows = db.query(Issue.id, literal(0.0), Issue.title).filter(
+            Issue.project_id == project_id, search_filter(dialect_name, q)
+        ).order_by(Issue.id.desc()).limit(limit).offset(offset)
+    return [(issue_id, float(rank or 0.0), snippet) for issue_id, rank, snippet in rows]
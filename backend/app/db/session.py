@@ -0,0 +1,72 @@
+"""One data-access code path for both database stacks.
+
+Endpoints and dependencies are written against a sync ``Session``. With
+``DB_ASYNC`` off, ``get_session`` yields one and ``db_endpoint`` runs the code
+on the threadpool, exactly as FastAPI runs sync endpoints. With it on,
+``get_session`` yields an ``AsyncSession`` and the same code runs through
+``AsyncSession.run_sync``: on the event loop, with every statement awaiting
+the async driver (aiosqlite or asyncpg) instead of blocking a thread.
+
+Whatever an endpoint returns is serialized after the session work ends, so it
+must not depend on lazy loads; in async mode those raise ``MissingGreenlet``.
+
+Exports and imports read or write through a connection of their own on a
+worker thread, outliving the request's session; they take the sync engine
+from ``get_sync_engine`` on either stack.
+"""
+import functools
+from typing import Any, Callable, Union
+
+from fastapi.concurrency import run_in_threadpool
+from sqlalchemy.engine import Engine
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import Session
+
+from app.core.config import settings
+from app.db.base import get_async_session_local, get_engine, get_session_local
+
+
+async def get_session():
+    if settings.DB_ASYNC:
+        async with get_async_session_local()() as session:
+            yield session
+        return
+
+    db = get_session_local()()
+    try:
+        yield db
+    finally:
+        await run_in_threadpool(db.close)
+
+
+async def get_sync_engine() -> Engine:
+    return get_engine()
+
+
+async def run_db(db: Union[Session, AsyncSession], fn: Callable[..., Any], *args, **kwargs) -> Any:
+    """``fn(session, *args, **kwargs)`` with a sync session, without blocking the event loop."""
+    if isinstance(db, AsyncSession):
+        return await db.run_sync(fn, *args, **kwargs)
+    return await run_in_threadpool(fn, db, *args, **kwargs)
+
+
+async def release_session(db: Union[Session, AsyncSession]):
+    """End the session's transaction and return its connection to the pool, e.g. before a long response."""
+    if isinstance(db, AsyncSession):
+        await db.close()
+    else:
+        await run_in_threadpool(db.close)
+
+
+def db_endpoint(fn: Callable[..., Any]) -> Callable[..., Any]:
+    """Make a sync endpoint or dependency with a ``db`` parameter run on either stack.
+
+    FastAPI reads the signature of ``fn`` (through ``__wrapped__``), so
+    parameters and dependencies are declared as usual, with
+    ``db: Session = Depends(get_session)``.
+    """
+    @functools.wraps(fn)
+    async def endpoint(**kwargs):
+        return await run_db(kwargs.pop("db"), lambda session: fn(db=session, **kwargs))
+
+    return endpoint
@@ -0,0 +1,49 @@
+"""Version counters behind ETags.
+
+``projects.version`` changes whenever anything shown in the project or its
+issue list changes; ``issues.version`` whenever the issue or its comments do.
+Bump them in the same transaction as the write, before committing.
+
+The new project version also stamps the issues a write changes
+(``issues.changed_version``) and the tombstones of those it deletes. The
+bump locks the project row until commit, so a project's writes commit in
+version order, and "everything after version N" is a complete delta.
+"""
+from typing import Optional, Tuple
+
+from sqlalchemy import select, update
+from sqlalchemy.orm import Session
+
+from app.models import Issue, Project
+
+
+def bump_project_version(db: Session, project_id: int) -> int:
+    """Increment the project's version and return the new value."""
+    projects = Project.__table__
+    return db.execute(
+        update(projects)
+        .where(projects.c.id == project_id)
+        .values(version=projects.c.version + 1)
+        .returning(projects.c.version)
+    ).scalar()
+
+
+def bump_issue_version(db: Session, issue_id: int, changed_version: int):
+    """Increment the issue's version and stamp it with ``changed_version``, the bumped project version."""
+    issues = Issue.__table__
+    db.execute(
+        update(issues)
+        .where(issues.c.id == issue_id)
+        # Pin updated_at so the bump doesn't trigger its onupdate
+        .values(version=issues.c.version + 1, changed_version=changed_version, updated_at=issues.c.updated_at)
+    )
+
+
+def project_version(db: Session, project_id: int) -> Optional[int]:
+    return db.execute(select(Project.version).where(Project.id == project_id)).scalar()
+
+
+def issue_version(db: Session, issue_id: int) -> Optional[Tuple[int, int]]:
+    """``(project_id, version)`` of an issue, or None if it doesn't exist."""
+    row = db.execute(select(Issue.project_id, Issue.version).where(Issue.id == issue_id)).first()
+    return tuple(row) if row else None
@@ -1,16 +1,30 @@
+from contextlib import asynccontextmanager
+
 from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
 
 from app.core.config import settings
 from app.api.api import api_router
-from app.db.base import Base, get_engine
+from app.core.metrics import MetricsMiddleware, registry as metrics_registry
+from app.core.security import password_hasher
+from app.db.base import Base, get_engine, dispose_async_engine, dispose_engine
+from app.db.instrumentation import QueryStatsMiddleware
+
+# Create database tables (local development; production runs the Alembic migrations)
+if settings.DB_AUTO_CREATE:
+    Base.metadata.create_all(bind=get_engine())
 
-# Create database tables
-engine = get_engine()
-Base.metadata.create_all(bind=engine)
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    yield
+    # Release pooled connections and hashing threads on shutdown
+    dispose_engine()
+    await dispose_async_engine()
+    password_hasher.shutdown()
 
 app = FastAPI(
     title=settings.PROJECT_NAME,
+    lifespan=lifespan,
     openapi_url=f"{settings.API_V1_STR}/openapi.json",
     docs_url="/docs",
     redoc_url="/redoc"
@@ -23,11 +37,23 @@ app.add_middleware(
     allow_credentials=True,
     allow_methods=["*"],
     allow_headers=["*"],
+    expose_headers=["X-Next-Cursor", "Server-Timing", "ETag"],
 )
 
+# Route latency, status and statement counters; inside QueryStatsMiddleware so it sees the statements
+if settings.METRICS_ENABLED:
+    app.add_middleware(MetricsMiddleware)
+
+# Statement count and database time per request, as a Server-Timing header
+if settings.SQL_INSTRUMENTATION:
+    app.add_middleware(QueryStatsMiddleware, repeated_threshold=settings.SQL_REPEATED_STATEMENT_THRESHOLD)
+
 # Include API router
 app.include_router(api_router, prefix=settings.API_V1_STR)
 
 @app.get("/")
 def root():
     return {"message": "Issue Hub API", "docs": "/docs"}
+
+# Allocate metric counters for every route up front
+metrics_registry.register_routes(app.routes)
@@ -2,7 +2,12 @@ from app.models.user import User
 from app.models.project import Project
 from app.models.project_member import ProjectMember, MemberRole
 from app.models.issue import Issue, IssueStatus, IssuePriority
+from app.models.issue_deletion import IssueDeletion
 from app.models.comment import Comment
+from app.models.import_job import ImportJob, ImportStatus
+
+# Registers the full-text index DDL with the metadata
+import app.db.search  # noqa: E402,F401
 
 __all__ = [
     "User",
@@ -12,5 +17,8 @@ __all__ = [
     "Issue",
     "IssueStatus", 
     "IssuePriority",
-    "Comment"
+    "IssueDeletion",
+    "Comment",
+    "ImportJob",
+    "ImportStatus"
 ]
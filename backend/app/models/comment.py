@@ -1,11 +1,15 @@
-from sqlalchemy import Column, Integer, Text, ForeignKey, DateTime
+from sqlalchemy import Column, Integer, Text, ForeignKey, DateTime, Index, event, update
 from sqlalchemy.sql import func
-from sqlalchemy.orm import relationship
+from sqlalchemy.orm import relationship, object_session, Session
 
 from app.db.base import Base
+from app.models.issue import Issue
 
 class Comment(Base):
     __tablename__ = "comments"
+    __table_args__ = (
+        Index("ix_comments_issue_id_created_at", "issue_id", "created_at"),
+    )
     
     id = Column(Integer, primary_key=True, index=True)
     issue_id = Column(Integer, ForeignKey("issues.id", ondelete="CASCADE"), nullable=False)
@@ -16,3 +20,35 @@ class Comment(Base):
     # Relationships
     issue = relationship("Issue", back_populates="comments")
     author = relationship("User", back_populates="comments")
+
+
+def _adjust_comment_count(connection, issue_id, delta):
+    issues = Issue.__table__
+    connection.execute(
+        update(issues)
+        .where(issues.c.id == issue_id)
+        # Pin updated_at so the counter doesn't trigger its onupdate
+        .values(comment_count=issues.c.comment_count + delta, updated_at=issues.c.updated_at)
+    )
+
+
+# Keep Issue.comment_count in step with ORM inserts/deletes, inside the flush's transaction
+@event.listens_for(Comment, "after_insert")
+def _comment_inserted(mapper, connection, target):
+    _adjust_comment_count(connection, target.issue_id, 1)
+
+
+@event.listens_for(Session, "before_flush")
+def _collect_deleted_issues(session, flush_context, instances):
+    session.info["deleted_issue_ids"] = {
+        obj.id for obj in session.deleted if isinstance(obj, Issue)
+    }
+
+
+@event.listens_for(Comment, "after_delete")
+def _comment_deleted(mapper, connection, target):
+    # Comments removed by deleting their issue take the counter with them
+    session = object_session(target)
+    if session is not None and target.issue_id in session.info.get("deleted_issue_ids", ()):
+        return
+    _adjust_comment_count(connection, target.issue_id, -1)
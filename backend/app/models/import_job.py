@@ -0,0 +1,26 @@
+from sqlalchemy import Column, Integer, BigInteger, String, ForeignKey, DateTime, Enum
+from sqlalchemy.sql import func
+import enum
+
+from app.db.base import Base
+
+class ImportStatus(str, enum.Enum):
+    running = "running"
+    completed = "completed"
+
+class ImportJob(Base):
+    """Progress of one bulk import, committed with every batch so an interrupted import can resume."""
+    __tablename__ = "import_jobs"
+    
+    id = Column(Integer, primary_key=True, index=True)
+    project_id = Column(Integer, ForeignKey("projects.id"), nullable=False, index=True)
+    user_id = Column(Integer, ForeignKey("users.id"), nullable=False)
+    format = Column(String(10), nullable=False)
+    status = Column(Enum(ImportStatus), nullable=False, default=ImportStatus.running)
+    # Input rows consumed (imported or rejected) and the byte offset just past the last of them
+    rows_done = Column(Integer, nullable=False, default=0, server_default="0")
+    bytes_done = Column(BigInteger, nullable=False, default=0, server_default="0")
+    imported = Column(Integer, nullable=False, default=0, server_default="0")
+    failed = Column(Integer, nullable=False, default=0, server_default="0")
+    created_at = Column(DateTime(timezone=True), server_default=func.now())
+    updated_at = Column(DateTime(timezone=True), onupdate=func.now(), default=func.now())
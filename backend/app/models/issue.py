@@ -1,4 +1,4 @@
-from sqlalchemy import Column, Integer, String, Text, ForeignKey, Enum, DateTime
+from sqlalchemy import Column, Integer, String, Text, ForeignKey, Enum, DateTime, Index
 from sqlalchemy.sql import func
 from sqlalchemy.orm import relationship
 import enum
@@ -19,6 +19,19 @@ class IssuePriority(str, enum.Enum):
 
 class Issue(Base):
     __tablename__ = "issues"
+    # Composite indexes backing list_issues filters/sorts (id is the keyset tiebreaker)
+    __table_args__ = (
+        Index("ix_issues_project_id_created_at", "project_id", "created_at", "id"),
+        Index("ix_issues_project_id_updated_at", "project_id", "updated_at", "id"),
+        Index("ix_issues_project_id_status_created_at", "project_id", "status", "created_at", "id"),
+        Index("ix_issues_project_id_priority_created_at", "project_id", "priority", "created_at", "id"),
+        Index("ix_issues_project_id_assignee_id_created_at", "project_id", "assignee_id", "created_at", "id"),
+        Index("ix_issues_project_id_expected_completion_date", "project_id", "expected_completion_date"),
+        # Covers the per-state counts of list_projects, so they never read the table
+        Index("ix_issues_project_id_status_expected_completion_date", "project_id", "status", "expected_completion_date"),
+        # Delta sync: changes after a (changed_version, id) watermark
+        Index("ix_issues_project_id_changed_version", "project_id", "changed_version", "id"),
+    )
     
     id = Column(Integer, primary_key=True, index=True)
     project_id = Column(Integer, ForeignKey("projects.id"), nullable=False)
@@ -31,6 +44,12 @@ class Issue(Base):
     expected_completion_date = Column(DateTime(timezone=True), nullable=True)
     created_at = Column(DateTime(timezone=True), server_default=func.now())
     updated_at = Column(DateTime(timezone=True), onupdate=func.now(), default=func.now())
+    # Denormalized, kept in step with comments by the hooks in app.models.comment
+    comment_count = Column(Integer, nullable=False, default=0, server_default="0")
+    # Bumped by every write to the issue or its comments (see app.db.versions)
+    version = Column(Integer, nullable=False, default=0, server_default="0")
+    # projects.version of the last write to the issue or its comments (see app.db.versions)
+    changed_version = Column(Integer, nullable=False, default=0, server_default="0")
     project = relationship("Project", back_populates="issues")
     reporter = relationship("User", foreign_keys=[reporter_id], back_populates="reported_issues")
     assignee = relationship("User", foreign_keys=[assignee_id], back_populates="assigned_issues")
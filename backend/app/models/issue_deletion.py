@@ -0,0 +1,20 @@
+from sqlalchemy import Column, Integer, ForeignKey, DateTime, Index
+from sqlalchemy.sql import func
+
+from app.db.base import Base
+
+class IssueDeletion(Base):
+    """Tombstone of a deleted issue, for clients syncing a project's issues incrementally."""
+    __tablename__ = "issue_deletions"
+    # Read in (changed_version, issue_id) order after a watermark, like the issues themselves
+    __table_args__ = (
+        Index("ix_issue_deletions_project_id_changed_version", "project_id", "changed_version", "issue_id"),
+    )
+    
+    id = Column(Integer, primary_key=True)
+    project_id = Column(Integer, ForeignKey("projects.id"), nullable=False)
+    # The issue row is gone, so no foreign key
+    issue_id = Column(Integer, nullable=False)
+    # Project version of the deleting transaction
+    changed_version = Column(Integer, nullable=False)
+    deleted_at = Column(DateTime(timezone=True), server_default=func.now())
@@ -12,6 +12,8 @@ class Project(Base):
     key = Column(String(10), unique=True, index=True, nullable=False)
     description = Column(Text, nullable=True)
     created_at = Column(DateTime(timezone=True), server_default=func.now())
+    # Bumped by every write that changes the project or its issues (see app.db.versions)
+    version = Column(Integer, nullable=False, default=0, server_default="0")
     
     # Relationships
     members = relationship("ProjectMember", back_populates="project", cascade="all, delete-orphan")
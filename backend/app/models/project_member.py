@@ -1,4 +1,4 @@
-from sqlalchemy import Column, Integer, ForeignKey, Enum
+from sqlalchemy import Column, Integer, ForeignKey, Enum, Index
 from sqlalchemy.orm import relationship
 import enum
 
@@ -10,6 +10,10 @@ class MemberRole(str, enum.Enum):
 
 class ProjectMember(Base):
     __tablename__ = "project_members"
+    # The primary key leads with project_id; list_projects looks members up by user
+    __table_args__ = (
+        Index("ix_project_members_user_id", "user_id"),
+    )
     
     project_id = Column(Integer, ForeignKey("projects.id"), primary_key=True)
     user_id = Column(Integer, ForeignKey("users.id"), primary_key=True)
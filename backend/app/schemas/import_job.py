@@ -0,0 +1,57 @@
+from pydantic import BaseModel, Field
+from typing import Optional, List
+from datetime import datetime
+
+from app.models.issue import IssueStatus, IssuePriority
+from app.models.import_job import ImportStatus
+
+# One input row, in the shape app.core.export writes; id and comment_count are ignored
+class CommentImportRow(BaseModel):
+    author_email: Optional[str] = None
+    body: str = Field(..., min_length=1)
+    created_at: Optional[datetime] = None
+
+class IssueImportRow(BaseModel):
+    title: str = Field(..., min_length=1, max_length=200)
+    description: Optional[str] = None
+    status: IssueStatus = IssueStatus.open
+    priority: IssuePriority = IssuePriority.medium
+    reporter_email: Optional[str] = None
+    assignee_email: Optional[str] = None
+    expected_completion_date: Optional[datetime] = None
+    created_at: Optional[datetime] = None
+    updated_at: Optional[datetime] = None
+    comments: List[CommentImportRow] = []
+
+class ImportJob(BaseModel):
+    id: int
+    project_id: int
+    user_id: int
+    format: str
+    status: ImportStatus
+    rows_done: int
+    bytes_done: int
+    imported: int
+    failed: int
+    created_at: datetime
+    updated_at: datetime
+    
+    class Config:
+        from_attributes = True
+
+class ImportRowError(BaseModel):
+    row: int
+    detail: str
+
+class ImportResult(BaseModel):
+    job_id: int
+    status: ImportStatus
+    rows: int
+    imported: int
+    failed: int
+    # Rows passed over because an earlier run of the job already handled them
+    skipped: int
+    elapsed_seconds: float
+    rows_per_second: float
+    errors: List[ImportRowError]
+    errors_truncated: bool
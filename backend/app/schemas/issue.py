@@ -53,6 +53,41 @@ class IssueList(BaseModel):
     class Config:
         from_attributes = True
 
+class IssueSearchResult(IssueList):
+    rank: float
+    snippet: Optional[str] = None
+
+class IssueChanges(BaseModel):
+    issues: List[IssueList]
+    # Ids of issues deleted since the watermark
+    deleted: List[int]
+    # Pass back as ?since= to get what changed after this response
+    watermark: str
+    has_more: bool
+
+# Items accepted by one batch request
+BATCH_MAX_ISSUES = 10000
+
+class IssueBatchCreate(BaseModel):
+    issues: List[IssueCreate] = Field(..., min_length=1, max_length=BATCH_MAX_ISSUES)
+
+class IssueBatchUpdateItem(IssueUpdate):
+    id: int
+
+class IssueBatchUpdate(BaseModel):
+    issues: List[IssueBatchUpdateItem] = Field(..., min_length=1, max_length=BATCH_MAX_ISSUES)
+
+class IssueBatchItemResult(BaseModel):
+    index: int
+    id: Optional[int] = None
+    status_code: int
+    detail: Optional[str] = None
+
+class IssueBatchResult(BaseModel):
+    succeeded: int
+    failed: int
+    results: List[IssueBatchItemResult]
+
 class IssueFilter(BaseModel):
     q: Optional[str] = None
     status: Optional[IssueStatus] = None
@@ -37,6 +37,10 @@ class ProjectList(ProjectBase):
     created_at: datetime
     issue_count: Optional[int] = 0
     member_count: Optional[int] = 0
+    # Issues by state; overdue ones are past their expected completion date and not resolved or closed
+    open_count: int = 0
+    in_progress_count: int = 0
+    overdue_count: int = 0
     
     class Config:
         from_attributes = True
@@ -0,0 +1,123 @@
+"""500 concurrent connections against uvicorn, with the sync and the async database stack (DB_ASYNC).
+
+    python -m benchmarks.bench_async [--connections 500] [--duration 10] [--database-url URL]
+
+Every connection loops over the read endpoints of one project (issue, its
+comments, the project, a page of its issues) as a different member. The
+issue-list page cache is off so each request reaches the database. Both runs
+get the same pool (``DB_POOL_SIZE`` 40 + 10 overflow): in sync mode a pool
+smaller than the 40-thread request threadpool lets requests that hold a
+connection wait on threads blocked waiting for one, until the pool times out.
+With hundreds of connections the sync stack can stall that way even with a
+bigger pool, so each run stops at its deadline plus ``GRACE_SECONDS`` and
+requests still in flight are reported as unfinished rather than waited for.
+
+Without ``--database-url`` a temporary SQLite file is used (aiosqlite in
+async mode); pass a PostgreSQL URL to compare psycopg2 with asyncpg.
+"""
+import argparse
+import asyncio
+import os
+import random
+import time
+
+from benchmarks.common import use_temp_database, seed_project, auth_headers, summarize
+
+SERVER_ENV = {
+    "DB_POOL_SIZE": "40",
+    "DB_MAX_OVERFLOW": "10",
+    "ISSUE_LIST_CACHE_MAX_BYTES": "0",
+    "SQL_INSTRUMENTATION": "false",
+}
+GRACE_SECONDS = 5.0
+
+
+async def drive(base_url: str, paths, all_headers, connections: int, duration: float, seed: int = 42):
+    import httpx
+
+    latencies = []
+    errors = 0
+    limits = httpx.Limits(max_connections=connections, max_keepalive_connections=connections)
+    async with httpx.AsyncClient(base_url=base_url, timeout=60, limits=limits) as client:
+        # Warm the token and membership caches before timing
+        for headers in all_headers:
+            await client.get(paths[0], headers=headers)
+        deadline = time.perf_counter() + duration
+
+        async def connection(index: int):
+            nonlocal errors
+            rng = random.Random(seed * 1000 + index)
+            headers = all_headers[index % len(all_headers)]
+            while time.perf_counter() < deadline:
+                t0 = time.perf_counter()
+                try:
+                    response = await client.get(rng.choice(paths), headers=headers)
+                    ok = response.status_code < 400
+                except httpx.TransportError:
+                    ok = False
+                if ok:
+                    latencies.append(time.perf_counter() - t0)
+                else:
+                    errors += 1
+
+        start = time.perf_counter()
+        tasks = [asyncio.create_task(connection(i)) for i in range(connections)]
+        _, pending = await asyncio.wait(tasks, timeout=duration + GRACE_SECONDS)
+        for task in pending:
+            task.cancel()
+        await asyncio.gather(*pending, return_exceptions=True)
+        elapsed = time.perf_counter() - start
+    stats = summarize(latencies, elapsed)
+    stats["errors"] = errors
+    stats["unfinished"] = len(pending)
+    return stats
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--connections", type=int, default=500)
+    parser.add_argument("--duration", type=float, default=10.0)
+    parser.add_argument("--issues", type=int, default=2000)
+    parser.add_argument("--members", type=int, default=50)
+    parser.add_argument("--database-url", help="empty database to seed (default: a temporary SQLite file)")
+    args = parser.parse_args()
+
+    if args.database_url:
+        os.environ["DATABASE_URL"] = database_url = args.database_url
+    else:
+        database_url = use_temp_database("async")
+
+    from sqlalchemy import select
+
+    from app.db.base import Base, get_engine
+    from app.models import Issue
+    from benchmarks.suite import start_uvicorn
+
+    engine = get_engine()
+    Base.metadata.create_all(bind=engine)
+    project_id, user_ids = seed_project(engine, issues=args.issues, comments_per_issue=2, members=args.members)
+    with engine.connect() as conn:
+        issue_ids = list(conn.execute(select(Issue.id).where(Issue.project_id == project_id).limit(200)).scalars())
+    all_headers = [auth_headers(user_id) for user_id in user_ids]
+    paths = [f"/api/projects/{project_id}", f"/api/projects/{project_id}/issues?per_page=20"]
+    for issue_id in issue_ids[:20]:
+        paths += [f"/api/issues/{issue_id}", f"/api/issues/{issue_id}/comments"]
+
+    print(f"{args.connections} connections, {args.duration:g} s per stack, {len(paths)} read URLs")
+    for label, db_async in (("sync (threadpool)", "false"), ("async (event loop)", "true")):
+        process, base_url = start_uvicorn(database_url, env={**SERVER_ENV, "DB_ASYNC": db_async})
+        try:
+            stats = asyncio.run(drive(base_url, paths, all_headers, args.connections, args.duration))
+        finally:
+            process.terminate()
+            process.wait()
+        print(
+            f"{label:<20} {stats['requests']:>7} req  {stats['rps']:>8.1f} req/s  p50 {stats['p50_ms']:8.2f} ms  "
+            f"p95 {stats['p95_ms']:8.2f} ms  p99 {stats['p99_ms']:8.2f} ms  errors {stats['errors']}  "
+            f"unfinished {stats['unfinished']}",
+            flush=True,
+        )
+
+
+if __name__ == "__main__":
+    main()
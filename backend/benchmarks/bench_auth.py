@@ -0,0 +1,57 @@
+"""Per-request authentication overhead: JWT decode + users SELECT vs cached token principal.
+
+    python -m benchmarks.bench_auth [--iterations 20000]
+"""
+import argparse
+import time
+
+from benchmarks.common import use_temp_database, seed_project
+
+use_temp_database("auth")
+
+from fastapi.security import HTTPAuthorizationCredentials
+
+from app.core.deps import get_current_principal, token_cache
+from app.core.security import create_access_token, verify_token
+from app.db.base import Base, get_engine, get_session_local
+from app.models import User
+
+
+def old_get_current_user(token, db):
+    payload = verify_token(token)
+    return db.query(User).filter(User.id == int(payload["sub"])).first()
+
+
+def measure(label, iterations, fn):
+    start = time.perf_counter()
+    for _ in range(iterations):
+        fn()
+    per_call = (time.perf_counter() - start) / iterations
+    print(f"{label:<40} {per_call * 1e6:9.1f} µs/request")
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--iterations", type=int, default=20000)
+    args = parser.parse_args()
+
+    engine = get_engine()
+    Base.metadata.create_all(bind=engine)
+    _, user_ids = seed_project(engine, issues=0, members=1)
+    db = get_session_local()()
+    user = db.get(User, user_ids[0])
+    token = create_access_token(data={"sub": str(user.id), "name": user.name, "email": user.email})
+    credentials = HTTPAuthorizationCredentials(scheme="Bearer", credentials=token)
+
+    def cold_principal():
+        token_cache.clear()
+        get_current_principal(credentials, db)
+
+    measure("before: decode + SELECT users", args.iterations, lambda: (old_get_current_user(token, db), db.expire_all()))
+    measure("principal, token cache cold", args.iterations, cold_principal)
+    measure("principal, token cache warm", args.iterations, lambda: get_current_principal(credentials, db))
+    db.close()
+
+
+if __name__ == "__main__":
+    main()
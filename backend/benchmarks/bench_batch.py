@@ -0,0 +1,79 @@
+"""Importing and closing 10k issues: one request per issue vs the ``issues:batch`` endpoints.
+
+    python -m benchmarks.bench_batch [--issues 10000] [--sample 500]
+
+The per-issue numbers time ``--sample`` requests and scale them up to
+``--issues``; the batch numbers are one request for all of them.
+"""
+import argparse
+import logging
+import time
+
+from benchmarks.common import use_temp_database, seed_project, auth_headers
+
+use_temp_database("batch")
+
+from fastapi.testclient import TestClient
+
+from app.db.base import get_engine
+from app.main import app
+
+
+def timed(fn):
+    start = time.perf_counter()
+    result = fn()
+    return result, time.perf_counter() - start
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--issues", type=int, default=10000)
+    parser.add_argument("--sample", type=int, default=500)
+    args = parser.parse_args()
+    # The batch INSERT runs once per chunk of rows, which the repeated-statement check would report
+    logging.getLogger("app.db.instrumentation").setLevel(logging.ERROR)
+
+    project_id, user_ids = seed_project(get_engine(), issues=0, members=10)
+    headers = auth_headers(user_ids[0])
+    client = TestClient(app)
+    items = [
+        {"title": f"Imported issue {i}", "description": "From the old tracker", "assignee_id": user_ids[i % len(user_ids)]}
+        for i in range(args.issues)
+    ]
+
+    def one_by_one():
+        return [
+            client.post(f"/api/projects/{project_id}/issues", headers=headers, json=item).json()["id"]
+            for item in items[:args.sample]
+        ]
+
+    sample_ids, elapsed = timed(one_by_one)
+    single_create = elapsed * args.issues / args.sample
+    _, elapsed = timed(lambda: [
+        client.patch(f"/api/issues/{issue_id}", headers=headers, json={"status": "closed"}) for issue_id in sample_ids
+    ])
+    single_close = elapsed * args.issues / args.sample
+
+    response, batch_create = timed(lambda: client.post(
+        f"/api/projects/{project_id}/issues:batch", headers=headers, json={"issues": items}
+    ))
+    created = [result["id"] for result in response.json()["results"] if result["status_code"] == 201]
+    assert len(created) == args.issues
+    response, batch_close = timed(lambda: client.patch(
+        f"/api/projects/{project_id}/issues:batch", headers=headers,
+        json={"issues": [{"id": issue_id, "status": "closed"} for issue_id in created]},
+    ))
+    assert response.json()["succeeded"] == args.issues
+    response, batch_retitle = timed(lambda: client.patch(
+        f"/api/projects/{project_id}/issues:batch", headers=headers,
+        json={"issues": [{"id": issue_id, "title": f"Renamed {issue_id}"} for issue_id in created]},
+    ))
+    assert response.json()["succeeded"] == args.issues
+
+    print(f"create {args.issues} issues: one request each ~{single_create:7.2f} s (from {args.sample}), batch {batch_create:6.2f} s")
+    print(f"close  {args.issues} issues: one request each ~{single_close:7.2f} s (from {args.sample}), batch {batch_close:6.2f} s")
+    print(f"rename {args.issues} issues (distinct titles, executemany): batch {batch_retitle:6.2f} s")
+
+
+if __name__ == "__main__":
+    main()
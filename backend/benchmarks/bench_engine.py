@@ -0,0 +1,61 @@
+"""Requests/sec for ``GET /api/projects/{id}/issues`` with a per-request engine vs the shared pool.
+
+    python -m benchmarks.bench_engine [--duration 5] [--issues 200]
+
+"before" reproduces the old session dependency that built a new engine (and pool) for
+every request; "after" is the process-wide engine from ``app.db.base``. The page
+cache is disabled so every request opens a session.
+"""
+import argparse
+
+from benchmarks.common import use_temp_database, seed_project, auth_headers, run_for, report
+
+DATABASE_URL = use_temp_database("engine")
+
+from fastapi.testclient import TestClient
+from sqlalchemy import create_engine
+from sqlalchemy.orm import sessionmaker
+
+from app.core.list_cache import issue_list_cache
+from app.main import app
+from app.db.base import get_engine
+from app.db.session import get_session
+
+
+def per_request_engine_db():
+    engine = create_engine(DATABASE_URL, connect_args={"check_same_thread": False})
+    db = sessionmaker(autocommit=False, autoflush=False, bind=engine)()
+    try:
+        yield db
+    finally:
+        db.close()
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--duration", type=float, default=5.0)
+    parser.add_argument("--issues", type=int, default=200)
+    args = parser.parse_args()
+
+    project_id, user_ids = seed_project(get_engine(), issues=args.issues, comments_per_issue=2)
+    headers = auth_headers(user_ids[0])
+    url = f"/api/projects/{project_id}/issues?per_page=20"
+    issue_list_cache.maxbytes = 0
+
+    with TestClient(app) as client:
+        def request():
+            response = client.get(url, headers=headers)
+            assert response.status_code == 200, response.text
+
+        for label, override in (("before (engine per request)", per_request_engine_db), ("after (shared pool)", None)):
+            if override:
+                app.dependency_overrides[get_session] = override
+            else:
+                app.dependency_overrides.pop(get_session, None)
+            run_for(0.5, request)  # warm up
+            latencies, elapsed = run_for(args.duration, request)
+            report(label, latencies, elapsed)
+
+
+if __name__ == "__main__":
+    main()
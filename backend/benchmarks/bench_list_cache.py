@@ -0,0 +1,58 @@
+"""Team members polling the same ``GET /api/projects/{id}/issues`` page, with and without the page cache.
+
+    python -m benchmarks.bench_list_cache [--issues 5000] [--members 10] [--duration 3]
+
+Each request comes from the next member in turn, so every one still passes its
+own membership check. "with writes" creates an issue every 20 requests, which
+invalidates the project's pages.
+"""
+import argparse
+import itertools
+
+from benchmarks.common import use_temp_database, seed_project, auth_headers, run_for, report
+
+use_temp_database("list_cache")
+
+from fastapi.testclient import TestClient
+
+from app.core.list_cache import issue_list_cache
+from app.db.base import get_engine
+from app.main import app
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--issues", type=int, default=5000)
+    parser.add_argument("--members", type=int, default=10)
+    parser.add_argument("--duration", type=float, default=3.0)
+    args = parser.parse_args()
+
+    project_id, user_ids = seed_project(get_engine(), issues=args.issues, members=args.members)
+    all_headers = [auth_headers(user_id) for user_id in user_ids]
+    client = TestClient(app)
+    url = f"/api/projects/{project_id}/issues?per_page=50&sort=updated_at"
+    maxbytes = issue_list_cache.maxbytes
+
+    for label, cache_bytes, write_every in (
+        ("uncached", 0, 0),
+        ("cached", maxbytes, 0),
+        ("cached, with writes", maxbytes, 20),
+    ):
+        issue_list_cache.clear()
+        issue_list_cache.maxbytes = cache_bytes
+        headers = itertools.cycle(all_headers)
+        counter = itertools.count()
+
+        def request():
+            if write_every and next(counter) % write_every == 0:
+                client.post(f"/api/projects/{project_id}/issues", headers=all_headers[0], json={"title": "New"})
+            client.get(url, headers=next(headers))
+
+        latencies, elapsed = run_for(args.duration, request)
+        report(label, latencies, elapsed)
+        stats = issue_list_cache.stats()
+        print(f"{'':<32} hit ratio {stats['hit_ratio']:.2f}, {stats['bytes'] / 1024:.1f} KiB held")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,92 @@
+"""100-row pages of ``GET /api/projects/{id}/issues``: ORM entities vs the projected query.
+
+    python -m benchmarks.bench_list_issues [--issues 5000] [--duration 3]
+
+"before" is the previous implementation, mounted on a side route: full
+``Issue`` entities with joinedloaded users, ``IssueList(**dict)`` per row and
+FastAPI's response-model validation. "after" is the projected query with
+``model_construct`` and a single ``dump_json``. The memory figure is
+tracemalloc's peak over one request. The page cache is disabled so "after"
+runs the query on every request.
+"""
+import argparse
+import tracemalloc
+from typing import List
+
+from benchmarks.common import use_temp_database, seed_project, auth_headers, run_for, report
+
+use_temp_database("list_issues")
+
+from fastapi import Depends
+from fastapi.testclient import TestClient
+from sqlalchemy.orm import Session, joinedload
+
+from app.core.deps import get_project_member
+from app.core.list_cache import issue_list_cache
+from app.db.base import get_db, get_engine
+from app.main import app
+from app.models import Issue
+from app.schemas.issue import IssueList
+
+PER_PAGE = 100
+
+
+@app.get("/bench/projects/{project_id}/issues", response_model=List[IssueList])
+def legacy_list_issues(project_id: int, db: Session = Depends(get_db), member=Depends(get_project_member)):
+    issues = db.query(Issue).filter(Issue.project_id == project_id).order_by(
+        Issue.created_at.desc(), Issue.id.desc()
+    ).options(joinedload(Issue.reporter), joinedload(Issue.assignee)).limit(PER_PAGE).all()
+    return [
+        IssueList(
+            id=issue.id,
+            project_id=issue.project_id,
+            title=issue.title,
+            status=issue.status,
+            priority=issue.priority,
+            reporter=issue.reporter,
+            assignee=issue.assignee,
+            expected_completion_date=issue.expected_completion_date,
+            created_at=issue.created_at,
+            updated_at=issue.updated_at,
+            comment_count=issue.comment_count,
+        )
+        for issue in issues
+    ]
+
+
+def allocations(client, url, headers):
+    client.get(url, headers=headers)
+    tracemalloc.start()
+    client.get(url, headers=headers)
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return peak
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--issues", type=int, default=5000)
+    parser.add_argument("--duration", type=float, default=3.0)
+    args = parser.parse_args()
+
+    project_id, user_ids = seed_project(get_engine(), issues=args.issues, members=10)
+    headers = auth_headers(user_ids[0])
+    issue_list_cache.maxbytes = 0
+    client = TestClient(app)
+    cases = [
+        ("before", f"/bench/projects/{project_id}/issues"),
+        ("after", f"/api/projects/{project_id}/issues?per_page={PER_PAGE}"),
+    ]
+
+    bodies = [client.get(url, headers=headers).content for _, url in cases]
+    print(f"identical JSON: {bodies[0] == bodies[1]} ({len(bodies[1])} bytes)")
+
+    for label, url in cases:
+        latencies, elapsed = run_for(args.duration, lambda: client.get(url, headers=headers))
+        report(f"{label}: {PER_PAGE}-row page", latencies, elapsed)
+    for label, url in cases:
+        print(f"{label}: peak memory allocated during one request {allocations(client, url, headers) / 1024:8.1f} KiB")
+
+
+if __name__ == "__main__":
+    main()
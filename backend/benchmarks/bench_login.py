@@ -0,0 +1,88 @@
+"""Login latency under concurrent load, and what it does to other endpoints.
+
+    python -m benchmarks.bench_login [--duration 5] [--concurrency 64]
+
+"before" is the old synchronous login that hashed on the shared request
+threadpool; "after" is ``POST /api/auth/login`` using the dedicated password
+hasher. Each run also probes ``GET /api/health`` to show whether logins starve
+unrelated requests. Requests rejected with 503 are counted, not timed.
+"""
+import argparse
+import asyncio
+import time
+
+from benchmarks.common import use_temp_database, seed_project, report
+
+use_temp_database("login")
+
+import httpx
+from fastapi import Depends, HTTPException
+from sqlalchemy.orm import Session
+
+from app.main import app
+from app.core.security import verify_password
+from app.db.base import get_db, get_engine
+from app.models import User
+from app.schemas.user import UserLogin
+
+
+@app.post("/bench/legacy-login")
+def legacy_login(user_data: UserLogin, db: Session = Depends(get_db)):
+    user = db.query(User).filter(User.email == user_data.email).first()
+    if not user or not verify_password(user_data.password, user.password_hash):
+        raise HTTPException(status_code=401)
+    return {"ok": True}
+
+
+async def run(url: str, email: str, duration: float, concurrency: int):
+    transport = httpx.ASGITransport(app=app)
+    login_latencies, health_latencies = [], []
+    rejected = 0
+    async with httpx.AsyncClient(transport=transport, base_url="http://bench") as client:
+        deadline = time.perf_counter() + duration
+
+        async def login_loop():
+            nonlocal rejected
+            while time.perf_counter() < deadline:
+                t0 = time.perf_counter()
+                response = await client.post(url, json={"email": email, "password": "password123"})
+                if response.status_code == 503:
+                    rejected += 1
+                    await asyncio.sleep(0.01)
+                    continue
+                assert response.status_code == 200, response.text
+                login_latencies.append(time.perf_counter() - t0)
+
+        async def health_loop():
+            while time.perf_counter() < deadline:
+                t0 = time.perf_counter()
+                await client.get("/api/health")
+                health_latencies.append(time.perf_counter() - t0)
+                await asyncio.sleep(0.005)
+
+        start = time.perf_counter()
+        await asyncio.gather(health_loop(), *(login_loop() for _ in range(concurrency)))
+        elapsed = time.perf_counter() - start
+    return login_latencies, health_latencies, elapsed, rejected
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--duration", type=float, default=5.0)
+    parser.add_argument("--concurrency", type=int, default=64)
+    args = parser.parse_args()
+
+    engine = get_engine()
+    _, user_ids = seed_project(engine, issues=0, members=1)
+    with Session(engine) as db:
+        email = db.get(User, user_ids[0]).email
+
+    for label, url in (("before", "/bench/legacy-login"), ("after", "/api/auth/login")):
+        logins, health, elapsed, rejected = asyncio.run(run(url, email, args.duration, args.concurrency))
+        report(f"{label}: login", logins, elapsed)
+        report(f"{label}: health during logins", health, elapsed)
+        print(f"{label}: rejected with 503: {rejected}")
+
+
+if __name__ == "__main__":
+    main()
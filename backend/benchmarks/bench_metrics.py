@@ -0,0 +1,77 @@
+"""Per-request cost of the metrics middleware, and the cost of a scrape.
+
+    python -m benchmarks.bench_metrics [--requests 200000]
+
+Requests go straight to a trivial ASGI app so the middleware is the only work
+being measured; "metrics + sql stats" adds QueryStatsMiddleware as in app.main.
+"""
+import argparse
+import asyncio
+import time
+
+from benchmarks.common import use_temp_database
+
+use_temp_database("metrics")
+
+from app.core.metrics import MetricsMiddleware, MetricsRegistry, runtime_metrics
+from app.db.instrumentation import QueryStatsMiddleware
+from app.main import app as fastapi_app
+
+
+async def trivial_app(scope, receive, send):
+    await send({"type": "http.response.start", "status": 200, "headers": []})
+    await send({"type": "http.response.body", "body": b"ok"})
+
+
+async def receive():
+    return {"type": "http.request", "body": b"", "more_body": False}
+
+
+async def send(message):
+    pass
+
+
+def measure(label, app, scope, requests):
+    async def run():
+        start = time.perf_counter()
+        for _ in range(requests):
+            await app(dict(scope), receive, send)
+        return time.perf_counter() - start
+
+    elapsed = asyncio.run(run())
+    print(f"{label:<28} {elapsed / requests * 1e6:8.2f} µs/request")
+    return elapsed / requests
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--requests", type=int, default=200000)
+    args = parser.parse_args()
+
+    registry = MetricsRegistry()
+    registry.register_routes(fastapi_app.routes)
+    route = next(r for r in fastapi_app.routes if getattr(r, "path", "") == "/api/projects/{project_id}/issues")
+    scope = {"type": "http", "method": "GET", "path": "/api/projects/1/issues", "headers": [], "route": route}
+
+    bare = measure("no middleware", trivial_app, scope, args.requests)
+    metrics = measure("metrics", MetricsMiddleware(trivial_app, registry), scope, args.requests)
+    both = measure(
+        "metrics + sql stats",
+        QueryStatsMiddleware(MetricsMiddleware(trivial_app, registry), repeated_threshold=5),
+        scope,
+        args.requests,
+    )
+    print(f"metrics overhead: {(metrics - bare) * 1e6:.2f} µs/request, with sql stats {(both - bare) * 1e6:.2f} µs/request")
+
+    # Every route with traffic, as after a while in production
+    for by_method in registry.routes.values():
+        for route_metrics in by_method.values():
+            route_metrics.observe(0.01, 200, 2, 0.001)
+    start = time.perf_counter()
+    for _ in range(100):
+        text = registry.render(runtime_metrics())
+    print(f"scrape: {(time.perf_counter() - start) * 10:.2f} ms for {len(text.splitlines())} lines")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,73 @@
+"""Page 1 vs page 5000 of ``GET /api/projects/{id}/issues`` with offset and cursor paging.
+
+    python -m benchmarks.bench_pagination [--issues 100000] [--deep-page 5000]
+
+The deep cursor is built from the row that ends page ``deep-page - 1``, which
+is exactly what a client following ``X-Next-Cursor`` would hold at that point. The page
+cache is disabled so every request pays for its query.
+"""
+import argparse
+
+from benchmarks.common import use_temp_database, seed_project, auth_headers, run_for, report
+
+use_temp_database("pagination")
+
+from fastapi.testclient import TestClient
+from sqlalchemy import select
+
+from app.core.list_cache import issue_list_cache
+from app.core.pagination import cursor_for, keyset_column
+from app.db.base import get_engine
+from app.main import app
+from app.models import Issue
+
+PER_PAGE = 20
+
+
+def deep_cursor(engine, project_id, page):
+    column = keyset_column(Issue.created_at, engine.dialect.name)
+    with engine.connect() as conn:
+        value, issue_id = conn.execute(
+            select(column, Issue.id)
+            .where(Issue.project_id == project_id)
+            .order_by(Issue.created_at.desc(), Issue.id.desc())
+            .offset((page - 1) * PER_PAGE - 1)
+            .limit(1)
+        ).one()
+    return cursor_for({"s": "created_at", "o": "desc"}, value, issue_id)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--issues", type=int, default=100000)
+    parser.add_argument("--deep-page", type=int, default=5000)
+    parser.add_argument("--duration", type=float, default=3.0)
+    args = parser.parse_args()
+
+    engine = get_engine()
+    project_id, user_ids = seed_project(engine, issues=args.issues)
+    headers = auth_headers(user_ids[0])
+    url = f"/api/projects/{project_id}/issues"
+    issue_list_cache.maxbytes = 0
+    cases = [
+        ("offset page 1", {"page": 1}),
+        (f"offset page {args.deep_page}", {"page": args.deep_page}),
+        ("cursor page 1", {}),
+        (f"cursor page {args.deep_page}", {"cursor": deep_cursor(engine, project_id, args.deep_page)}),
+    ]
+
+    with TestClient(app) as client:
+        for label, params in cases:
+            params = {**params, "per_page": PER_PAGE}
+
+            def request():
+                response = client.get(url, headers=headers, params=params)
+                assert response.status_code == 200 and len(response.json()) == PER_PAGE, response.text
+
+            run_for(0.3, request)
+            latencies, elapsed = run_for(args.duration, request)
+            report(label, latencies, elapsed)
+
+
+if __name__ == "__main__":
+    main()
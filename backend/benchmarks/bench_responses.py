@@ -0,0 +1,106 @@
+"""Serializing 100-item ``list_issues`` and ``list_comments`` payloads.
+
+    python -m benchmarks.bench_responses [--iterations 500] [--duration 3]
+
+"response_model" reproduces FastAPI's default path: validate the returned
+models against the response model, dump them to JSON-compatible Python, then
+``json.dumps``. "FastJSONResponse" writes bytes with the prebuilt TypeAdapter.
+The end-to-end rows compare ``GET .../comments`` through a side route with the
+old ``response_model`` handling against the real endpoint.
+"""
+import argparse
+import json
+import time
+from typing import List
+
+from benchmarks.common import use_temp_database, seed_project, auth_headers, run_for, report
+
+use_temp_database("responses")
+
+from fastapi import Depends
+from fastapi.testclient import TestClient
+from sqlalchemy import select
+from sqlalchemy.orm import Session, joinedload
+
+from app.api.endpoints.issues import ISSUE_LIST_ADAPTER
+from app.api.endpoints.comments import COMMENT_LIST_ADAPTER
+from app.core.deps import get_current_principal
+from app.core.responses import FastJSONResponse, orjson
+from app.db.base import get_db, get_engine, get_session_local
+from app.main import app
+from app.models import Comment, Issue
+from app.schemas.comment import Comment as CommentSchema
+
+ITEMS = 100
+
+
+@app.get("/bench/issues/{issue_id}/comments", response_model=List[CommentSchema])
+def legacy_list_comments(issue_id: int, db: Session = Depends(get_db), user=Depends(get_current_principal)):
+    return db.query(Comment).options(joinedload(Comment.author)).filter(
+        Comment.issue_id == issue_id
+    ).order_by(Comment.created_at).all()
+
+
+def response_model_path(adapter, items):
+    validated = adapter.validate_python(items, from_attributes=True)
+    content = adapter.dump_python(validated, mode="json")
+    return json.dumps(content, ensure_ascii=False, allow_nan=False, indent=None, separators=(",", ":")).encode()
+
+
+def measure(label, iterations, fn):
+    start = time.perf_counter()
+    for _ in range(iterations):
+        body = fn()
+    per_call = (time.perf_counter() - start) / iterations
+    print(f"{label:<44} {per_call * 1e6:9.1f} µs  ({len(body)} bytes)")
+    return body
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--iterations", type=int, default=500)
+    parser.add_argument("--duration", type=float, default=3.0)
+    args = parser.parse_args()
+
+    engine = get_engine()
+    project_id, user_ids = seed_project(engine, issues=ITEMS, comments_per_issue=0, members=5)
+    with engine.connect() as conn:
+        issue_id = conn.execute(select(Issue.id).where(Issue.project_id == project_id).limit(1)).scalar()
+    with engine.begin() as conn:
+        conn.execute(Comment.__table__.insert(), [
+            {"issue_id": issue_id, "author_id": user_ids[i % len(user_ids)], "body": f"Comment {i} with some text"}
+            for i in range(ITEMS)
+        ])
+
+    db = get_session_local()()
+    issues = ISSUE_LIST_ADAPTER.validate_python(
+        db.query(Issue).options(joinedload(Issue.reporter), joinedload(Issue.assignee))
+        .filter(Issue.project_id == project_id).all(),
+        from_attributes=True,
+    )
+    comments = db.query(Comment).options(joinedload(Comment.author)).filter(Comment.issue_id == issue_id).all()
+    comment_models = COMMENT_LIST_ADAPTER.validate_python(comments, from_attributes=True)
+
+    print(f"Serializing {ITEMS} items (orjson {'installed' if orjson else 'not installed'})")
+    for label, adapter, items, models in (
+        ("list_issues", ISSUE_LIST_ADAPTER, issues, issues),
+        ("list_comments", COMMENT_LIST_ADAPTER, comments, comment_models),
+    ):
+        before = measure(f"{label}: response_model", args.iterations, lambda: response_model_path(adapter, items))
+        after = measure(f"{label}: FastJSONResponse", args.iterations,
+                        lambda: FastJSONResponse(models, adapter=adapter).body)
+        print(f"{label}: identical bytes {before == after}")
+    db.close()
+
+    client = TestClient(app)
+    headers = auth_headers(user_ids[0])
+    for label, url in (
+        ("before: GET comments (100)", f"/bench/issues/{issue_id}/comments"),
+        ("after: GET comments (100)", f"/api/issues/{issue_id}/comments"),
+    ):
+        latencies, elapsed = run_for(args.duration, lambda: client.get(url, headers=headers))
+        report(label, latencies, elapsed)
+
+
+if __name__ == "__main__":
+    main()
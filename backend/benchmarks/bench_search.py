@@ -0,0 +1,93 @@
+"""Search latency on a large seeded project: old title ILIKE scan vs the full-text index.
+
+    python -m benchmarks.bench_search [--issues 1000000]
+
+Issue text is drawn from a Zipf-like vocabulary so common words match many
+rows and rare words match few, like a real backlog.
+"""
+import argparse
+import random
+import time
+
+from benchmarks.common import use_temp_database, seed_project, auth_headers, run_for, report
+
+use_temp_database("search")
+
+from fastapi.testclient import TestClient
+from sqlalchemy import insert
+
+from app.db.base import get_engine, get_session_local
+from app.main import app
+from app.models import Issue, IssueStatus, IssuePriority
+
+VOCABULARY = [f"w{i}" for i in range(5000)]
+WEIGHTS = [1.0 / (rank + 1) for rank in range(len(VOCABULARY))]
+
+
+def seed_issues(engine, project_id, user_id, count, rng):
+    start = time.perf_counter()
+    batch = []
+    with engine.begin() as conn:
+        for i in range(count):
+            batch.append({
+                "project_id": project_id,
+                "title": " ".join(rng.choices(VOCABULARY, WEIGHTS, k=6)),
+                "description": " ".join(rng.choices(VOCABULARY, WEIGHTS, k=40)),
+                "status": IssueStatus.open,
+                "priority": IssuePriority.medium,
+                "reporter_id": user_id,
+            })
+            if len(batch) == 10000:
+                conn.execute(insert(Issue), batch)
+                batch = []
+        if batch:
+            conn.execute(insert(Issue), batch)
+    elapsed = time.perf_counter() - start
+    print(f"seeded {count} issues in {elapsed:.1f}s ({count / elapsed:.0f} rows/s, FTS triggers included)")
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--issues", type=int, default=1000000)
+    parser.add_argument("--duration", type=float, default=3.0)
+    args = parser.parse_args()
+
+    rng = random.Random(7)
+    engine = get_engine()
+    project_id, user_ids = seed_project(engine, issues=0)
+    seed_issues(engine, project_id, user_ids[0], args.issues, rng)
+    headers = auth_headers(user_ids[0])
+    db = get_session_local()()
+
+    for word in ("w3", "w400", "w4900"):
+        def ilike_scan():
+            db.query(Issue.id).filter(
+                Issue.project_id == project_id, Issue.title.ilike(f"%{word}%")
+            ).order_by(Issue.created_at.desc()).limit(20).all()
+
+        latencies, elapsed = run_for(args.duration, ilike_scan)
+        report(f"ILIKE title '{word}'", latencies, elapsed)
+
+    with TestClient(app) as client:
+        for word in ("w3", "w400", "w4900", "w400 w900"):
+            def fts_search():
+                response = client.get(
+                    f"/api/projects/{project_id}/issues/search", headers=headers, params={"q": word}
+                )
+                assert response.status_code == 200
+
+            def filtered_list():
+                response = client.get(
+                    f"/api/projects/{project_id}/issues", headers=headers, params={"q": word}
+                )
+                assert response.status_code == 200
+
+            latencies, elapsed = run_for(args.duration, fts_search)
+            report(f"ranked search '{word}'", latencies, elapsed)
+            latencies, elapsed = run_for(args.duration, filtered_list)
+            report(f"list_issues q='{word}'", latencies, elapsed)
+    db.close()
+
+
+if __name__ == "__main__":
+    main()
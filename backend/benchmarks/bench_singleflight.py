@@ -0,0 +1,73 @@
+"""50 members opening the same board at once: ``list_issues`` and ``get_project``, coalescing off/on.
+
+    python -m benchmarks.bench_singleflight [--issues 20000] [--clients 50] [--rounds 10]
+
+The page cache is disabled so every round has to reach the database. Reports
+the wall time of each burst and the SQL statements it ran. The connection pool
+is sized to the burst: when more requests hold a connection than the 40-thread
+request threadpool can run, they wait on each other until the pool times out,
+whether or not requests are coalesced.
+"""
+import argparse
+import asyncio
+import os
+import time
+
+from benchmarks.common import use_temp_database, seed_project, auth_headers, percentile
+
+use_temp_database("singleflight")
+os.environ.setdefault("DB_POOL_SIZE", "100")
+
+import httpx
+
+from app.core.list_cache import issue_list_cache
+from app.core.singleflight import read_coalescer
+from app.db.base import get_engine
+from app.db.instrumentation import capture_queries
+from app.main import app
+
+
+async def burst(client, urls, all_headers):
+    await asyncio.gather(*(
+        client.get(url, headers=all_headers[i % len(all_headers)])
+        for i in range(len(all_headers))
+        for url in urls
+    ))
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--issues", type=int, default=20000)
+    parser.add_argument("--clients", type=int, default=50)
+    parser.add_argument("--rounds", type=int, default=10)
+    args = parser.parse_args()
+
+    engine = get_engine()
+    project_id, user_ids = seed_project(engine, issues=args.issues, members=args.clients)
+    all_headers = [auth_headers(user_id) for user_id in user_ids]
+    urls = [f"/api/projects/{project_id}", f"/api/projects/{project_id}/issues?per_page=100&sort=priority"]
+    issue_list_cache.maxbytes = 0
+
+    async def run():
+        transport = httpx.ASGITransport(app=app)
+        async with httpx.AsyncClient(transport=transport, base_url="http://bench", timeout=60) as client:
+            await burst(client, urls, all_headers)  # warm up membership and token caches
+            for label, enabled in (("coalescing off", False), ("coalescing on", True)):
+                read_coalescer.enabled = enabled
+                durations = []
+                with capture_queries(engine) as stats:
+                    for _ in range(args.rounds):
+                        start = time.perf_counter()
+                        await burst(client, urls, all_headers)
+                        durations.append(time.perf_counter() - start)
+                print(
+                    f"{label:<16} burst of {len(urls) * args.clients} requests: "
+                    f"p50 {percentile(durations, 50) * 1000:8.1f} ms  max {max(durations) * 1000:8.1f} ms  "
+                    f"{stats.count / args.rounds:7.1f} statements per burst"
+                )
+
+    asyncio.run(run())
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,94 @@
+"""Mixed read/write load on SQLite with and without the performance profile.
+
+    python -m benchmarks.bench_sqlite [--duration 5] [--readers 8] [--writers 4]
+
+Reader threads page through ``GET /api/projects/{id}/issues`` while writer
+threads post comments with ``POST /api/issues/{id}/comments``. Each mode gets
+its own database file because WAL mode persists in the file.
+"""
+import argparse
+import random
+import threading
+import time
+
+from benchmarks.common import use_temp_database, seed_project, auth_headers, report
+
+use_temp_database("sqlite-import")
+
+from fastapi.testclient import TestClient
+
+from app.core.config import settings
+from app.db.base import Base, dispose_engine, get_engine
+from app.main import app
+
+
+def run_mode(client, profile: bool, args):
+    settings.SQLITE_PERFORMANCE_PROFILE = profile
+    settings.DATABASE_URL = use_temp_database("wal" if profile else "default")
+    dispose_engine()
+    engine = get_engine()
+    Base.metadata.create_all(bind=engine)
+    project_id, user_ids = seed_project(engine, issues=args.issues, comments_per_issue=1)
+    headers = auth_headers(user_ids[0])
+    with engine.connect() as conn:
+        issue_ids = [row[0] for row in conn.exec_driver_sql("SELECT id FROM issues")]
+
+    reads, writes, errors = [], [], []
+    deadline = time.perf_counter() + args.duration
+
+    def reader(seed):
+        rng = random.Random(seed)
+        while time.perf_counter() < deadline:
+            page = rng.randint(1, max(1, args.issues // 20))
+            t0 = time.perf_counter()
+            response = client.get(f"/api/projects/{project_id}/issues?page={page}", headers=headers)
+            reads.append(time.perf_counter() - t0)
+            if response.status_code != 200:
+                errors.append(response.status_code)
+
+    def writer(seed):
+        rng = random.Random(seed)
+        while time.perf_counter() < deadline:
+            t0 = time.perf_counter()
+            try:
+                response = client.post(
+                    f"/api/issues/{rng.choice(issue_ids)}/comments",
+                    headers=headers,
+                    json={"body": "benchmark comment"},
+                )
+                if response.status_code != 200:
+                    errors.append(response.status_code)
+            except Exception as exc:  # "database is locked" surfaces as a server error
+                errors.append(type(exc).__name__)
+            writes.append(time.perf_counter() - t0)
+
+    threads = [threading.Thread(target=reader, args=(i,)) for i in range(args.readers)]
+    threads += [threading.Thread(target=writer, args=(100 + i,)) for i in range(args.writers)]
+    start = time.perf_counter()
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    elapsed = time.perf_counter() - start
+
+    label = "profile" if profile else "default"
+    report(f"{label}: list_issues", reads, elapsed)
+    report(f"{label}: create_comment", writes, elapsed)
+    print(f"{label}: errors {len(errors)}")
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--duration", type=float, default=5.0)
+    parser.add_argument("--readers", type=int, default=8)
+    parser.add_argument("--writers", type=int, default=4)
+    parser.add_argument("--issues", type=int, default=2000)
+    args = parser.parse_args()
+
+    with TestClient(app, raise_server_exceptions=False) as client:
+        for profile in (False, True):
+            run_mode(client, profile, args)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,147 @@
+"""Shared helpers for the benchmark scripts.
+
+Benchmarks are plain scripts run from the backend directory, for example
+``python -m benchmarks.bench_engine``. Each one works on its own throwaway
+SQLite database so it never touches ``issuehub.db``.
+"""
+import os
+import random
+import tempfile
+import time
+from datetime import datetime, timedelta
+
+
+def use_temp_database(name: str = "bench") -> str:
+    """Point the app at a fresh SQLite file. Call before importing ``app``."""
+    path = os.path.join(tempfile.mkdtemp(prefix="issuehub-"), f"{name}.db")
+    url = f"sqlite:///{path}"
+    os.environ["DATABASE_URL"] = url
+    return url
+
+
+def percentile(samples, pct: float) -> float:
+    if not samples:
+        return 0.0
+    ordered = sorted(samples)
+    index = min(len(ordered) - 1, max(0, int(round(pct / 100.0 * len(ordered))) - 1))
+    return ordered[index]
+
+
+def summarize(latencies, elapsed: float) -> dict:
+    return {
+        "requests": len(latencies),
+        "rps": len(latencies) / elapsed if elapsed else 0.0,
+        "p50_ms": percentile(latencies, 50) * 1000,
+        "p95_ms": percentile(latencies, 95) * 1000,
+        "p99_ms": percentile(latencies, 99) * 1000,
+    }
+
+
+def report(label: str, latencies, elapsed: float) -> dict:
+    stats = summarize(latencies, elapsed)
+    print(
+        f"{label:<32} {stats['requests']:>7} req  {stats['rps']:>9.1f} req/s  "
+        f"p50 {stats['p50_ms']:7.2f} ms  p95 {stats['p95_ms']:7.2f} ms  p99 {stats['p99_ms']:7.2f} ms"
+    )
+    return stats
+
+
+def run_for(duration: float, fn):
+    """Call ``fn`` repeatedly for ``duration`` seconds, returning latencies and elapsed time."""
+    latencies = []
+    start = time.perf_counter()
+    deadline = start + duration
+    while True:
+        t0 = time.perf_counter()
+        if t0 >= deadline:
+            break
+        fn()
+        latencies.append(time.perf_counter() - t0)
+    return latencies, time.perf_counter() - start
+
+
+def seed_project(engine, issues: int = 100, comments_per_issue: int = 0, members: int = 3, seed: int = 42):
+    """Insert one project with ``members`` users and ``issues`` issues using Core bulk inserts.
+
+    Returns ``(project_id, user_ids)``; the first user is the project maintainer.
+    """
+    from sqlalchemy import insert
+
+    from app.core.security import get_password_hash
+    from app.models import User, Project, ProjectMember, Issue, Comment, MemberRole, IssueStatus, IssuePriority
+
+    rng = random.Random(seed)
+    password_hash = get_password_hash("password123")
+    now = datetime.utcnow()
+    statuses = list(IssueStatus)
+    priorities = list(IssuePriority)
+
+    with engine.begin() as conn:
+        suffix = rng.randrange(10 ** 9)
+        user_ids = []
+        for i in range(members):
+            result = conn.execute(insert(User).values(
+                name=f"Bench User {i}",
+                email=f"bench{i}-{suffix}@example.com",
+                password_hash=password_hash,
+            ))
+            user_ids.append(result.inserted_primary_key[0])
+
+        project_id = conn.execute(insert(Project).values(
+            name="Bench Project", key=f"B{suffix % 10 ** 8}",
+        )).inserted_primary_key[0]
+
+        conn.execute(insert(ProjectMember), [
+            {
+                "project_id": project_id,
+                "user_id": user_id,
+                "role": MemberRole.maintainer if i == 0 else MemberRole.member,
+            }
+            for i, user_id in enumerate(user_ids)
+        ])
+
+        batch = []
+        for i in range(issues):
+            created = now - timedelta(minutes=issues - i)
+            batch.append({
+                "project_id": project_id,
+                "title": f"Issue {i}: something is broken",
+                "description": "Steps to reproduce: " + " ".join(rng.choice(["click", "wait", "scroll", "reload"]) for _ in range(20)),
+                "status": rng.choice(statuses),
+                "priority": rng.choice(priorities),
+                "reporter_id": rng.choice(user_ids),
+                "assignee_id": rng.choice(user_ids + [None]),
+                "created_at": created,
+                "updated_at": created,
+            })
+            if len(batch) >= 5000:
+                conn.execute(insert(Issue), batch)
+                batch = []
+        if batch:
+            conn.execute(insert(Issue), batch)
+
+        if comments_per_issue:
+            issue_ids = [row[0] for row in conn.execute(
+                Issue.__table__.select().with_only_columns(Issue.id).where(Issue.project_id == project_id)
+            )]
+            batch = []
+            for issue_id in issue_ids:
+                for j in range(comments_per_issue):
+                    batch.append({
+                        "issue_id": issue_id,
+                        "author_id": rng.choice(user_ids),
+                        "body": f"Comment {j} on issue {issue_id}",
+                    })
+                if len(batch) >= 5000:
+                    conn.execute(insert(Comment), batch)
+                    batch = []
+            if batch:
+                conn.execute(insert(Comment), batch)
+
+    return project_id, user_ids
+
+
+def auth_headers(user_id: int) -> dict:
+    from app.core.security import create_access_token
+
+    return {"Authorization": f"Bearer {create_access_token(data={'sub': str(user_id)})}"}
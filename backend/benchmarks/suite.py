@@ -0,0 +1,293 @@
+"""Endpoint load test with JSON baselines and a regression check.
+
+    python -m benchmarks.suite [--target inprocess|uvicorn] [--duration 5] [--concurrency 16]
+                               [--database-url URL] [--save results.json]
+                               [--baseline baseline.json --threshold 0.2]
+
+Without ``--database-url`` a temporary SQLite database is filled by the seed
+script's scale mode (sized with ``--users/--projects/--issues/--comments``).
+To use production-sized data, seed a database once with ``scripts/seed.py``
+and pass its URL; the write scenarios add rows to it.
+
+``inprocess`` drives the ASGI app through httpx without a server;
+``uvicorn`` starts a local ``uvicorn app.main:app`` and goes over TCP.
+With ``--baseline`` the run fails (exit status 1) when a scenario's throughput
+drops, or its p95 latency grows, by more than ``--threshold``.
+"""
+import argparse
+import asyncio
+import json
+import logging
+import os
+import random
+import socket
+import subprocess
+import sys
+import time
+from datetime import datetime
+
+from benchmarks.common import summarize
+
+SCENARIOS = (
+    "login",
+    "list_projects",
+    "list_issues",
+    "get_issue",
+    "create_issue",
+    "update_issue",
+    "list_comments",
+    "create_comment",
+)
+
+
+def parse_args(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--target", choices=("inprocess", "uvicorn"), default="inprocess")
+    parser.add_argument("--duration", type=float, default=5.0, help="seconds per scenario")
+    parser.add_argument("--concurrency", type=int, default=16)
+    parser.add_argument("--scenarios", default=",".join(SCENARIOS), help="comma-separated subset to run")
+    parser.add_argument("--database-url", help="already seeded database (default: a temporary one)")
+    parser.add_argument("--users", default="2k")
+    parser.add_argument("--projects", default="50")
+    parser.add_argument("--issues", default="50k")
+    parser.add_argument("--comments", default="150k")
+    parser.add_argument("--save", help="write the results to this JSON file")
+    parser.add_argument("--baseline", help="compare against results saved earlier with --save")
+    parser.add_argument("--threshold", type=float, default=0.2, help="allowed relative regression (0.2 = 20%%)")
+    parser.add_argument("--seed", type=int, default=42)
+    args = parser.parse_args(argv)
+    args.scenarios = [name.strip() for name in args.scenarios.split(",") if name.strip()]
+    unknown = set(args.scenarios) - set(SCENARIOS)
+    if unknown:
+        parser.error(f"unknown scenarios: {', '.join(sorted(unknown))}")
+    return args
+
+
+class Fixture:
+    """Ids the scenarios pick from: the hottest project and one of its maintainers."""
+
+    def __init__(self, engine):
+        from sqlalchemy import func, select
+
+        from app.models import Issue, MemberRole, ProjectMember, User
+
+        with engine.connect() as conn:
+            self.project_id = conn.execute(
+                select(Issue.project_id).group_by(Issue.project_id).order_by(func.count().desc()).limit(1)
+            ).scalar()
+            if self.project_id is None:
+                raise SystemExit("The database has no issues; seed it with scripts/seed.py first")
+            self.user_id, self.email = conn.execute(
+                select(User.id, User.email).join(ProjectMember, ProjectMember.user_id == User.id).where(
+                    ProjectMember.project_id == self.project_id,
+                    ProjectMember.role == MemberRole.maintainer,
+                ).limit(1)
+            ).one()
+            self.issue_ids = list(conn.execute(
+                select(Issue.id).where(Issue.project_id == self.project_id).order_by(Issue.id.desc()).limit(1000)
+            ).scalars())
+            self.commented_issue_ids = list(conn.execute(
+                select(Issue.id).where(Issue.project_id == self.project_id, Issue.comment_count > 0)
+                .order_by(Issue.id.desc()).limit(1000)
+            ).scalars()) or self.issue_ids
+        self.password = "password123"
+
+
+def make_request(name, fixture, rng):
+    """``(method, url, json)`` for one request of a scenario."""
+    project = fixture.project_id
+    if name == "login":
+        return "POST", "/api/auth/login", {"email": fixture.email, "password": fixture.password}
+    if name == "list_projects":
+        return "GET", "/api/projects", None
+    if name == "list_issues":
+        status = rng.choice([None, None, "open", "in_progress"])
+        query = "per_page=20" + (f"&status={status}" if status else "")
+        return "GET", f"/api/projects/{project}/issues?{query}", None
+    if name == "get_issue":
+        return "GET", f"/api/issues/{rng.choice(fixture.issue_ids)}", None
+    if name == "create_issue":
+        return "POST", f"/api/projects/{project}/issues", {
+            "title": f"Benchmark issue {rng.randrange(10 ** 9)}",
+            "description": "Created by benchmarks.suite",
+            "priority": rng.choice(["low", "medium", "high"]),
+        }
+    if name == "update_issue":
+        return "PATCH", f"/api/issues/{rng.choice(fixture.issue_ids)}", {
+            "status": rng.choice(["open", "in_progress", "resolved"]),
+        }
+    if name == "list_comments":
+        return "GET", f"/api/issues/{rng.choice(fixture.commented_issue_ids)}/comments", None
+    if name == "create_comment":
+        return "POST", f"/api/issues/{rng.choice(fixture.issue_ids)}/comments", {"body": "Benchmark comment"}
+    raise ValueError(name)
+
+
+async def run_scenario(client, name, fixture, headers, duration, concurrency, seed):
+    latencies = []
+    errors = 0
+    deadline = time.perf_counter() + duration
+
+    async def worker(worker_seed):
+        nonlocal errors
+        rng = random.Random(worker_seed)
+        while time.perf_counter() < deadline:
+            method, url, body = make_request(name, fixture, rng)
+            t0 = time.perf_counter()
+            response = await client.request(method, url, json=body, headers=headers)
+            elapsed = time.perf_counter() - t0
+            if response.status_code >= 400:
+                errors += 1
+            else:
+                latencies.append(elapsed)
+
+    start = time.perf_counter()
+    await asyncio.gather(*(worker(seed * 1000 + i) for i in range(concurrency)))
+    stats = summarize(latencies, time.perf_counter() - start)
+    stats["errors"] = errors
+    return stats
+
+
+async def run_all(client, fixture, args):
+    response = await client.post("/api/auth/login", json={"email": fixture.email, "password": fixture.password})
+    response.raise_for_status()
+    headers = {"Authorization": f"Bearer {response.json()['access_token']}"}
+
+    results = {}
+    for name in args.scenarios:
+        stats = await run_scenario(client, name, fixture, headers, args.duration, args.concurrency, args.seed)
+        results[name] = stats
+        print(
+            f"{name:<16} {stats['requests']:>7} req  {stats['rps']:>9.1f} req/s  p50 {stats['p50_ms']:7.2f} ms  "
+            f"p95 {stats['p95_ms']:7.2f} ms  p99 {stats['p99_ms']:7.2f} ms  errors {stats['errors']}",
+            flush=True,
+        )
+    return results
+
+
+def _free_port() -> int:
+    with socket.socket() as sock:
+        sock.bind(("127.0.0.1", 0))
+        return sock.getsockname()[1]
+
+
+def start_uvicorn(database_url: str, env: dict = None):
+    import httpx
+
+    port = _free_port()
+    # Repeated-statement warnings would interleave with the report
+    env = {**os.environ, "DATABASE_URL": database_url, "SQL_REPEATED_STATEMENT_THRESHOLD": "0", **(env or {})}
+    process = subprocess.Popen(
+        [sys.executable, "-m", "uvicorn", "app.main:app", "--port", str(port), "--log-level", "warning"],
+        env=env,
+    )
+    base_url = f"http://127.0.0.1:{port}"
+    deadline = time.time() + 30
+    while time.time() < deadline:
+        try:
+            if httpx.get(f"{base_url}/api/health").status_code == 200:
+                return process, base_url
+        except httpx.TransportError:
+            time.sleep(0.2)
+    process.terminate()
+    raise SystemExit("uvicorn did not start within 30 seconds")
+
+
+def compare(results: dict, baseline: dict, threshold: float):
+    """Regression messages for scenarios that got slower than ``baseline`` allows."""
+    regressions = []
+    for name, stats in results.items():
+        before = baseline.get("results", {}).get(name)
+        if not before:
+            continue
+        if before["rps"] and stats["rps"] < before["rps"] * (1 - threshold):
+            regressions.append(f"{name}: throughput {stats['rps']:.1f} req/s vs baseline {before['rps']:.1f}")
+        if before["p95_ms"] and stats["p95_ms"] > before["p95_ms"] * (1 + threshold):
+            regressions.append(f"{name}: p95 {stats['p95_ms']:.2f} ms vs baseline {before['p95_ms']:.2f}")
+    return regressions
+
+
+def main(argv=None):
+    args = parse_args(argv)
+    # list_projects still trips the N+1 warning on every request; keep the report readable
+    logging.getLogger("app.db.instrumentation").setLevel(logging.ERROR)
+
+    if args.database_url:
+        database_url = args.database_url
+        os.environ["DATABASE_URL"] = database_url
+        seeded = False
+    else:
+        from benchmarks.common import use_temp_database
+
+        database_url = use_temp_database("suite")
+        seeded = True
+
+    import httpx
+
+    from app.db.base import get_engine
+
+    engine = get_engine()
+    if seeded:
+        from scripts.seed import parse_count, seed_scale
+
+        print(f"Seeding {args.users} users, {args.projects} projects, {args.issues} issues, {args.comments} comments")
+        seed_scale(engine, parse_count(args.users), parse_count(args.projects), parse_count(args.issues),
+                   parse_count(args.comments), seed=args.seed)
+    fixture = Fixture(engine)
+
+    print(f"\nTarget: {args.target}, {args.concurrency} concurrent clients, {args.duration:g} s per scenario")
+    process = None
+    try:
+        if args.target == "uvicorn":
+            process, base_url = start_uvicorn(database_url)
+            client = httpx.AsyncClient(base_url=base_url, timeout=60,
+                                       limits=httpx.Limits(max_connections=args.concurrency))
+        else:
+            from app.main import app
+
+            client = httpx.AsyncClient(transport=httpx.ASGITransport(app=app), base_url="http://bench", timeout=60)
+
+        async def run():
+            async with client:
+                return await run_all(client, fixture, args)
+
+        results = asyncio.run(run())
+    finally:
+        if process is not None:
+            process.terminate()
+            process.wait()
+
+    report = {
+        "target": args.target,
+        "created_at": datetime.utcnow().isoformat(timespec="seconds") + "Z",
+        "config": {
+            "duration": args.duration,
+            "concurrency": args.concurrency,
+            "database": "seeded" if seeded else "external",
+            "size": {"users": args.users, "projects": args.projects, "issues": args.issues, "comments": args.comments}
+            if seeded else None,
+        },
+        "results": results,
+    }
+    if args.save:
+        with open(args.save, "w") as f:
+            json.dump(report, f, indent=2, sort_keys=True)
+        print(f"\nSaved results to {args.save}")
+
+    if args.baseline:
+        with open(args.baseline) as f:
+            baseline = json.load(f)
+        if baseline.get("target") != args.target:
+            print(f"\nWarning: the baseline was recorded against {baseline.get('target')}, not {args.target}")
+        regressions = compare(results, baseline, args.threshold)
+        if regressions:
+            print(f"\nRegressions beyond {args.threshold:.0%} of {args.baseline}:")
+            for line in regressions:
+                print(f"  {line}")
+            return 1
+        print(f"\nNo regressions beyond {args.threshold:.0%} of {args.baseline}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
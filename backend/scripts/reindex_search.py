@@ -0,0 +1,37 @@
+"""Rebuild the full-text search index from the issues and comments tables.
+
+Usage: python scripts/reindex_search.py
+
+On SQLite this repopulates the FTS5 table (creating it and its triggers if
+missing). On PostgreSQL the tsvector columns are generated by the database,
+so this only rebuilds their GIN indexes with REINDEX CONCURRENTLY.
+"""
+import sys
+import os
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import time
+
+from app.db.base import get_engine
+from app.db.search import install_search_index, rebuild_search_index
+
+
+def reindex(engine):
+    if engine.dialect.name == "postgresql":
+        with engine.connect().execution_options(isolation_level="AUTOCOMMIT") as conn:
+            install_search_index(conn, concurrently=True)
+            rebuild_search_index(conn)
+    else:
+        with engine.begin() as conn:
+            install_search_index(conn)
+            rebuild_search_index(conn)
+
+
+def main():
+    start = time.perf_counter()
+    reindex(get_engine())
+    print(f"Search index rebuilt in {time.perf_counter() - start:.1f}s")
+
+
+if __name__ == "__main__":
+    main()
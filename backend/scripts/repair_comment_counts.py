@@ -0,0 +1,70 @@
+"""Recompute issues.comment_count where it has drifted from the comments table.
+
+Usage: python scripts/repair_comment_counts.py [--batch-size 5000]
+
+Works through issues in primary-key ranges, committing after each batch so
+it can run against a live database without holding long locks. Repaired
+issues and their projects get their versions bumped like any other write, so
+ETags and delta sync pick up the corrected counts.
+"""
+import sys
+import os
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import argparse
+
+from sqlalchemy import func, select, update
+from sqlalchemy.orm import Session
+
+from app.db.base import get_engine
+from app.db.versions import bump_project_version
+from app.models import Issue, Comment
+
+
+def repair_comment_counts(engine, batch_size: int = 5000) -> int:
+    issues = Issue.__table__
+    comments = Comment.__table__
+    actual = (
+        select(func.count())
+        .select_from(comments)
+        .where(comments.c.issue_id == issues.c.id)
+        .scalar_subquery()
+    )
+
+    with engine.connect() as conn:
+        max_id = conn.execute(select(func.max(issues.c.id))).scalar() or 0
+
+    repaired = 0
+    for start in range(0, max_id + 1, batch_size):
+        needs_repair = (issues.c.id >= start, issues.c.id < start + batch_size, issues.c.comment_count != actual)
+        with Session(engine) as db, db.begin():
+            drifted = {}
+            for issue_id, project_id in db.execute(select(issues.c.id, issues.c.project_id).where(*needs_repair)):
+                drifted.setdefault(project_id, []).append(issue_id)
+            for project_id, issue_ids in drifted.items():
+                result = db.execute(
+                    update(issues)
+                    .where(issues.c.id.in_(issue_ids), *needs_repair)
+                    # As bump_issue_version does, one statement for the project's issues in the batch
+                    .values(
+                        comment_count=actual,
+                        version=issues.c.version + 1,
+                        changed_version=bump_project_version(db, project_id),
+                        updated_at=issues.c.updated_at
+                    )
+                )
+                repaired += result.rowcount
+    return repaired
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Recompute drifted issue comment counts")
+    parser.add_argument("--batch-size", type=int, default=5000)
+    args = parser.parse_args()
+
+    repaired = repair_comment_counts(get_engine(), batch_size=args.batch_size)
+    print(f"Repaired comment_count on {repaired} issue(s)")
+
+
+if __name__ == "__main__":
+    main()
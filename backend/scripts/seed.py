@@ -1,9 +1,24 @@
+"""Seed the database.
+
+    python scripts/seed.py                      # demo accounts and a few issues
+    python scripts/seed.py --users 50k --projects 2k --issues 5M --comments 20M
+
+The second form is the scale mode: deterministic synthetic data with hot
+projects and long comment threads, loaded with Core bulk inserts.
+"""
+import argparse
+import random
 import sys
 import os
+import time
+from datetime import datetime, timedelta
+from typing import Optional
 sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 
+from sqlalchemy import func, insert, select
 from sqlalchemy.orm import Session
 from app.db.base import Base, get_engine, get_session_local
+from app.db.search import install_search_index, uninstall_search_index
 from app.models import User, Project, ProjectMember, Issue, Comment, MemberRole, IssueStatus, IssuePriority
 from app.core.security import get_password_hash
 
@@ -250,5 +265,281 @@ def seed_database():
     finally:
         db.close()
 
+# Scale mode
+
+# Fixed so that the same seed produces identical rows on every run
+SCALE_END = datetime(2025, 1, 1)
+SCALE_SPAN = timedelta(days=730)
+# Longest comment thread; the Pareto tail would otherwise occasionally produce tens of thousands
+MAX_THREAD = 1000
+
+FIRST_NAMES = ["Ada", "Ben", "Chloe", "Dev", "Elena", "Femi", "Grace", "Hiro", "Ines", "Jon", "Kira", "Luis",
+               "Maya", "Nils", "Omar", "Priya", "Quinn", "Rosa", "Sam", "Tara", "Uma", "Victor", "Wen", "Yusuf"]
+LAST_NAMES = ["Adams", "Becker", "Costa", "Diaz", "Evans", "Fischer", "Garcia", "Huang", "Ivanova", "Jones",
+              "Kumar", "Lopez", "Moreau", "Nakamura", "Okafor", "Park", "Rossi", "Silva", "Tanaka", "Weber"]
+COMPONENTS = ["login", "search", "checkout", "dashboard", "export", "notifications", "settings", "billing",
+              "upload", "sync", "API", "mobile app", "reports", "permissions", "onboarding", "editor"]
+PROBLEMS = ["crashes when", "is slow when", "shows wrong data after", "times out during", "breaks layout on",
+            "loses changes after", "returns 500 for", "ignores filters on", "double-submits on", "hangs after"]
+TRIGGERS = ["a page reload", "switching projects", "a large import", "logging out", "resizing the window",
+            "an expired session", "pasting long text", "a slow network", "sorting by date", "a timezone change"]
+SENTENCES = ["I can reproduce this on staging.", "Looks related to the last deploy.", "Adding logs from production.",
+             "This blocks the release.", "Could not reproduce locally.", "Workaround: refresh the page.",
+             "Fix is in review.", "Same here on Firefox.", "Raising priority, customers are affected.",
+             "Root cause is a missing index.", "Closing as duplicate?", "Verified the fix on staging."]
+
+STATUSES = [s.name for s in IssueStatus]
+STATUS_WEIGHTS = [35, 15, 20, 30]
+PRIORITIES = [p.name for p in IssuePriority]
+PRIORITY_WEIGHTS = [25, 45, 22, 8]
+
+
+def parse_count(value: str) -> int:
+    """``"50k"`` -> 50000, ``"5M"`` -> 5000000."""
+    value = value.strip().lower().replace("_", "")
+    multiplier = {"k": 10 ** 3, "m": 10 ** 6, "b": 10 ** 9}.get(value[-1:], 1)
+    if multiplier != 1:
+        value = value[:-1]
+    return int(float(value) * multiplier)
+
+
+def split_skewed(total: int, parts: int, exponent: float = 1.1):
+    """Split ``total`` into ``parts`` Zipf-distributed shares, largest first."""
+    weights = [1.0 / (rank ** exponent) for rank in range(1, parts + 1)]
+    scale = total / sum(weights)
+    shares = [int(w * scale) for w in weights]
+    for i in range(total - sum(shares)):
+        shares[i % parts] += 1
+    return shares, weights
+
+
+class Progress:
+    def __init__(self, label: str, total: Optional[int]):
+        self.label = label
+        self.total = total
+        self.done = 0
+        self.start = time.perf_counter()
+        self.last_report = self.start
+
+    def advance(self, n: int):
+        self.done += n
+        now = time.perf_counter()
+        if now - self.last_report >= 5.0:
+            self.last_report = now
+            self._print(now)
+
+    def finish(self) -> float:
+        now = time.perf_counter()
+        self._print(now)
+        return now - self.start
+
+    def _print(self, now: float):
+        elapsed = now - self.start
+        rate = self.done / elapsed if elapsed else 0.0
+        total = f" / {self.total:,}" if self.total is not None else ""
+        print(f"  {self.label:<16} {self.done:>12,}{total}  {rate:>10,.0f} rows/s  {elapsed:7.1f} s",
+              flush=True)
+
+
+def _next_id(conn, model) -> int:
+    return (conn.execute(select(func.max(model.id))).scalar() or 0) + 1
+
+
+def _reset_sequences(conn):
+    # Explicit ids bypass PostgreSQL sequences, so move them past the new rows
+    for table in ("users", "projects", "issues", "comments"):
+        conn.exec_driver_sql(
+            f"SELECT setval(pg_get_serial_sequence('{table}', 'id'), coalesce(max(id), 1)) FROM {table}"
+        )
+
+
+def seed_scale(engine, users: int, projects: int, issues: int, comments: int, seed: int = 42,
+               batch_size: int = 10000):
+    """Bulk-load synthetic users, projects, memberships, issues and comments.
+
+    Issues and comments are written in the same loop, so their two rates overlap.
+    Ids are assigned here rather than by the database so rows can be written in
+    large batches without reading keys back. Issues are spread over projects with
+    a Zipf skew and comments over issues with a Pareto tail, both from a seeded RNG.
+    """
+    rng = random.Random(seed)
+    dialect_name = engine.dialect.name
+    Base.metadata.create_all(bind=engine)
+    password_hash = get_password_hash("password123")
+    timings = []
+    started = time.perf_counter()
+
+    with engine.connect() as conn:
+        if dialect_name == "sqlite":
+            conn.exec_driver_sql("PRAGMA synchronous=OFF")
+            conn.exec_driver_sql("PRAGMA cache_size=-262144")
+        # Maintaining the search index row by row would dominate the load; rebuild it afterwards
+        uninstall_search_index(conn)
+        conn.commit()
+
+        def flush(model, rows, progress):
+            if rows:
+                conn.execute(insert(model), rows)
+                conn.commit()
+                progress.advance(len(rows))
+                rows.clear()
+
+        # Users
+        first_user = _next_id(conn, User)
+        progress = Progress("users", users)
+        rows = []
+        for i in range(users):
+            user_id = first_user + i
+            rows.append({
+                "id": user_id,
+                "name": f"{rng.choice(FIRST_NAMES)} {rng.choice(LAST_NAMES)}",
+                "email": f"user{user_id}@example.com",
+                "password_hash": password_hash,
+                "created_at": SCALE_END - SCALE_SPAN - timedelta(days=rng.random() * 365),
+            })
+            if len(rows) >= batch_size:
+                flush(User, rows, progress)
+        flush(User, rows, progress)
+        timings.append(("users", users, progress.finish()))
+        user_ids = range(first_user, first_user + users)
+
+        # Projects, hottest first, with membership growing with their share of issues
+        first_project = _next_id(conn, Project)
+        issue_shares, weights = split_skewed(issues, projects)
+        progress = Progress("projects", projects)
+        rows = []
+        for i in range(projects):
+            project_id = first_project + i
+            rows.append({
+                "id": project_id,
+                "name": f"{rng.choice(COMPONENTS).title()} {project_id}",
+                "key": f"P{project_id}",
+                "description": f"Synthetic project {project_id}",
+                "created_at": SCALE_END - SCALE_SPAN - timedelta(days=rng.random() * 30),
+            })
+        flush(Project, rows, progress)
+        timings.append(("projects", projects, progress.finish()))
+
+        project_members = []
+        progress = Progress("memberships", 0)
+        for i in range(projects):
+            size = min(users, 3 + int(500 * (weights[i] / weights[0]) ** 0.5))
+            members = rng.sample(user_ids, size)
+            project_members.append(members)
+            rows.extend(
+                {
+                    "project_id": first_project + i,
+                    "user_id": user_id,
+                    "role": MemberRole.maintainer.name if n == 0 else MemberRole.member.name,
+                }
+                for n, user_id in enumerate(members)
+            )
+            progress.total += size
+            if len(rows) >= batch_size:
+                flush(ProjectMember, rows, progress)
+        flush(ProjectMember, rows, progress)
+        timings.append(("memberships", progress.total, progress.finish()))
+
+        # Issues and their comments, written together so every comment's issue exists first
+        issue_id = _next_id(conn, Issue)
+        comment_id = _next_id(conn, Comment)
+        issue_progress = Progress("issues", issues)
+        comment_progress = Progress("comments", comments)
+        issue_rows, comment_rows = [], []
+        remaining_issues, remaining_comments = issues, comments
+
+        for i in range(projects):
+            members = project_members[i]
+            count = issue_shares[i]
+            step = SCALE_SPAN / max(count, 1)
+            for n in range(count):
+                created = SCALE_END - SCALE_SPAN + step * n
+                # Pareto-tailed thread length whose mean tracks the comments still to place
+                mean = remaining_comments / remaining_issues
+                if remaining_issues == 1:
+                    thread = remaining_comments
+                else:
+                    thread = int(mean * 0.5 * (rng.paretovariate(1.5) - 1) + 0.5)
+                    thread = min(remaining_comments, thread, MAX_THREAD)
+                remaining_issues -= 1
+                remaining_comments -= thread
+
+                updated = min(SCALE_END, created + timedelta(hours=rng.random() * 720))
+                issue_rows.append({
+                    "id": issue_id,
+                    "project_id": first_project + i,
+                    "title": f"{rng.choice(COMPONENTS).capitalize()} {rng.choice(PROBLEMS)} {rng.choice(TRIGGERS)}",
+                    "description": " ".join(rng.choices(SENTENCES, k=3)),
+                    "status": rng.choices(STATUSES, STATUS_WEIGHTS)[0],
+                    "priority": rng.choices(PRIORITIES, PRIORITY_WEIGHTS)[0],
+                    "reporter_id": rng.choice(members),
+                    "assignee_id": rng.choice(members) if rng.random() < 0.7 else None,
+                    "expected_completion_date": created + timedelta(days=rng.randint(1, 60)) if rng.random() < 0.4 else None,
+                    "created_at": created,
+                    "updated_at": updated,
+                    "comment_count": thread,
+                })
+                for c in range(thread):
+                    comment_rows.append({
+                        "id": comment_id,
+                        "issue_id": issue_id,
+                        "author_id": rng.choice(members),
+                        "body": rng.choice(SENTENCES),
+                        "created_at": created + timedelta(minutes=10 * (c + 1)),
+                    })
+                    comment_id += 1
+                issue_id += 1
+
+                if len(issue_rows) >= batch_size or len(comment_rows) >= batch_size:
+                    flush(Issue, issue_rows, issue_progress)
+                    flush(Comment, comment_rows, comment_progress)
+        flush(Issue, issue_rows, issue_progress)
+        flush(Comment, comment_rows, comment_progress)
+        timings.append(("issues", issues, issue_progress.finish()))
+        timings.append(("comments", comments, comment_progress.finish()))
+
+        start = time.perf_counter()
+        if dialect_name == "postgresql":
+            _reset_sequences(conn)
+        install_search_index(conn)
+        conn.commit()
+        timings.append(("search index", issues, time.perf_counter() - start))
+
+        start = time.perf_counter()
+        conn.exec_driver_sql("ANALYZE")
+        conn.commit()
+        timings.append(("analyze", 0, time.perf_counter() - start))
+
+    print("\nSummary")
+    for label, rows_written, seconds in timings:
+        rate = f"{rows_written / seconds:>10,.0f} rows/s" if rows_written and seconds else ""
+        print(f"  {label:<16} {rows_written:>12,} rows  {seconds:8.1f} s  {rate}")
+    print(f"  total            {time.perf_counter() - started:>29.1f} s")
+    print("All synthetic users log in with password123 (emails user<id>@example.com).")
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Seed the database with demo or synthetic data.")
+    parser.add_argument("--users", type=parse_count, help="scale mode: number of users, e.g. 50k")
+    parser.add_argument("--projects", type=parse_count, default=None)
+    parser.add_argument("--issues", type=parse_count, default=None)
+    parser.add_argument("--comments", type=parse_count, default=None)
+    parser.add_argument("--seed", type=int, default=42, help="RNG seed; the same seed gives the same data")
+    parser.add_argument("--batch-size", type=int, default=10000)
+    args = parser.parse_args()
+
+    scale = [args.users, args.projects, args.issues, args.comments]
+    if all(value is None for value in scale):
+        seed_database()
+        return
+    if any(value is None for value in scale):
+        parser.error("scale mode needs --users, --projects, --issues and --comments")
+    if args.users < 1 or args.projects < 1:
+        parser.error("scale mode needs at least one user and one project")
+
+    seed_scale(get_engine(), args.users, args.projects, args.issues, args.comments,
+               seed=args.seed, batch_size=args.batch_size)
+
+
 if __name__ == "__main__":
-    seed_database()
+    main()
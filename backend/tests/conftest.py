@@ -1,4 +1,5 @@
 import sys
+from contextlib import contextmanager
 from pathlib import Path
 
 # Add the backend directory to Python path
@@ -12,12 +13,27 @@ from sqlalchemy.orm import sessionmaker
 
 from app.main import app
 from app.db.base import Base, get_db
+from app.db.session import get_session, get_sync_engine
+from app.core.authz import membership_cache
+from app.core.config import settings
+from app.core.list_cache import issue_list_cache
 from app.core.security import get_password_hash
+from app.db import instrumentation
 
 # Create test database
 SQLALCHEMY_DATABASE_URL = "sqlite:///./test.db"
 engine = create_engine(SQLALCHEMY_DATABASE_URL, connect_args={"check_same_thread": False})
 TestingSessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
+instrumentation.install(engine)
+
+# DB_ASYNC=true runs the suite against the async stack, on the same database file
+async_engine = None
+if settings.DB_ASYNC:
+    from sqlalchemy.ext.asyncio import async_sessionmaker, create_async_engine
+
+    async_engine = create_async_engine("sqlite+aiosqlite:///./test.db")
+    AsyncTestingSessionLocal = async_sessionmaker(bind=async_engine, autoflush=False)
+    instrumentation.install(async_engine.sync_engine)
 
 def override_get_db():
     try:
@@ -26,14 +42,63 @@ def override_get_db():
     finally:
         db.close()
 
+async def override_get_session():
+    if async_engine is not None:
+        async with AsyncTestingSessionLocal() as session:
+            yield session
+        return
+    db = TestingSessionLocal()
+    try:
+        yield db
+    finally:
+        db.close()
+
 app.dependency_overrides[get_db] = override_get_db
+app.dependency_overrides[get_session] = override_get_session
+app.dependency_overrides[get_sync_engine] = lambda: engine
 
 @pytest.fixture(scope="module")
 def client():
+    # Ids and versions are reused once the tables are recreated, so cached roles and pages must go too
+    membership_cache.clear()
+    issue_list_cache.clear()
     Base.metadata.create_all(bind=engine)
     yield TestClient(app)
     Base.metadata.drop_all(bind=engine)
 
+@pytest.fixture
+def db_session(client):
+    db = TestingSessionLocal()
+    try:
+        yield db
+    finally:
+        db.close()
+
+@pytest.fixture
+def db_engines(client):
+    """The sync engines the app's statements run on: the test engine, and the async one's when DB_ASYNC is on."""
+    return [engine] + ([async_engine.sync_engine] if async_engine is not None else [])
+
+@pytest.fixture
+def query_budget():
+    """``with query_budget(3): client.get(...)`` fails if the block runs more than 3 statements."""
+    @contextmanager
+    def budget(max_queries):
+        with instrumentation.capture_queries(engine) as stats:
+            if async_engine is not None:
+                # Same counter for the statements of the async engine
+                with instrumentation.capture_queries(async_engine.sync_engine) as async_stats:
+                    yield stats
+                stats.count += async_stats.count
+                stats.statements.update(async_stats.statements)
+            else:
+                yield stats
+        assert stats.count <= max_queries, (
+            f"{stats.count} statements exceed the budget of {max_queries}:\n"
+            + "\n".join(f"{n}x {sql}" for sql, n in stats.statements.most_common())
+        )
+    return budget
+
 @pytest.fixture(scope="module")
 def test_user():
     return {
@@ -57,3 +122,26 @@ def auth_headers(client, test_user):
     token = response.json()["access_token"]
     
     return {"Authorization": f"Bearer {token}"}
+
+@pytest.fixture
+def make_project(client, auth_headers):
+    def make(key, headers=None):
+        response = client.post("/api/projects", headers=headers or auth_headers, json={
+            "name": f"Project {key}",
+            "key": key,
+        })
+        assert response.status_code == 200
+        return response.json()["id"]
+    return make
+
+@pytest.fixture
+def make_issue(client, auth_headers):
+    def make(project_id, title="Broken build", headers=None, **fields):
+        response = client.post(f"/api/projects/{project_id}/issues", headers=headers or auth_headers, json={
+            "title": title,
+            "description": "It fails",
+            **fields,
+        })
+        assert response.status_code == 200
+        return response.json()["id"]
+    return make
@@ -0,0 +1,101 @@
+"""The API on the async database stack (DB_ASYNC); `DB_ASYNC=true pytest` runs the whole suite on it."""
+import asyncio
+
+import pytest
+from sqlalchemy.ext.asyncio import async_sessionmaker, create_async_engine
+from sqlalchemy.util import await_only, greenlet_spawn
+
+from app.core.singleflight import CoalescingTimeout, SingleFlight
+from app.db import session as db_session_module
+from app.db.base import async_database_url
+from app.db.instrumentation import install
+from app.db.session import get_session
+from app.main import app
+
+
+def test_async_database_url():
+    assert async_database_url("sqlite:///./issuehub.db") == "sqlite+aiosqlite:///./issuehub.db"
+    assert async_database_url("postgresql://u:p@db/issuehub") == "postgresql+asyncpg://u:p@db/issuehub"
+    assert async_database_url("postgresql+psycopg2://u:p@db/x") == "postgresql+asyncpg://u:p@db/x"
+    assert async_database_url("postgresql+asyncpg://u:p@db/x") == "postgresql+asyncpg://u:p@db/x"
+    with pytest.raises(ValueError):
+        async_database_url("mysql://u:p@db/x")
+
+
+@pytest.fixture
+def async_stack(client, monkeypatch):
+    """Serve requests from an AsyncSession on the test database, and fail if anything uses the threadpool."""
+    engine = create_async_engine("sqlite+aiosqlite:///./test.db")
+    install(engine.sync_engine)
+    SessionLocal = async_sessionmaker(bind=engine, autoflush=False)
+
+    async def async_session():
+        async with SessionLocal() as session:
+            yield session
+
+    async def no_threadpool(*args, **kwargs):
+        raise AssertionError("database work went to the threadpool")
+
+    monkeypatch.setattr(db_session_module, "run_in_threadpool", no_threadpool)
+    previous = app.dependency_overrides[get_session]
+    app.dependency_overrides[get_session] = async_session
+    yield
+    app.dependency_overrides[get_session] = previous
+    asyncio.run(engine.dispose())
+
+
+def test_endpoints_run_on_the_async_stack(client, async_stack):
+    client.post("/api/auth/signup", json={"name": "Async", "email": "async@example.com", "password": "password123"})
+    token = client.post("/api/auth/login", json={"email": "async@example.com", "password": "password123"}).json()
+    headers = {"Authorization": f"Bearer {token['access_token']}"}
+
+    project = client.post("/api/projects", headers=headers, json={"name": "Async", "key": "ASY"}).json()
+    response = client.post(f"/api/projects/{project['id']}/issues", headers=headers, json={"title": "On the loop"})
+    assert response.status_code == 200
+    issue = response.json()
+    assert issue["reporter"]["email"] == "async@example.com"
+    comment = client.post(f"/api/issues/{issue['id']}/comments", headers=headers, json={"body": "Awaited"})
+    assert comment.json()["author"]["name"] == "Async"
+    update = client.patch(f"/api/issues/{issue['id']}", headers=headers, json={"status": "resolved"})
+    assert update.json()["status"] == "resolved"
+
+    listing = client.get(f"/api/projects/{project['id']}/issues", headers=headers)
+    assert [item["comment_count"] for item in listing.json()] == [1]
+    # Statements run in SQLAlchemy's greenlets are still attributed to the request
+    assert 'desc="0 queries"' not in listing.headers["Server-Timing"]
+    assert client.get(f"/api/projects/{project['id']}", headers=headers).json()["members"][0]["role"] == "maintainer"
+    assert client.get("/api/projects", headers=headers).json()[0]["issue_count"] == 1
+    assert client.get(f"/api/issues/{issue['id']}/comments", headers=headers).json()[0]["body"] == "Awaited"
+    assert client.delete(f"/api/issues/{issue['id']}", headers=headers).status_code == 204
+
+
+def test_coalesced_waiters_in_greenlets_do_not_block_the_loop():
+    flight = SingleFlight(timeout=5)
+    calls = []
+
+    def compute():
+        calls.append(1)
+        # The leader's "query" needs the loop to keep running while the others wait
+        await_only(asyncio.sleep(0.1))
+        return object()
+
+    async def main():
+        return await asyncio.gather(*(greenlet_spawn(flight.do, "key", compute) for _ in range(5)))
+
+    results = asyncio.run(main())
+    assert len(calls) == 1
+    assert all(result is results[0] for result in results)
+    assert (flight.executions, flight.shared) == (1, 4)
+
+
+def test_greenlet_waiters_time_out():
+    flight = SingleFlight(timeout=0.05)
+
+    async def main():
+        leader = greenlet_spawn(flight.do, "key", lambda: await_only(asyncio.sleep(0.3)))
+        follower = greenlet_spawn(flight.do, "key", lambda: "not run")
+        return await asyncio.gather(leader, follower, return_exceptions=True)
+
+    leader, follower = asyncio.run(main())
+    assert isinstance(follower, CoalescingTimeout)
+    assert flight.timeouts == 1
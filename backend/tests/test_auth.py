@@ -46,3 +46,105 @@ def test_get_me(client, auth_headers, test_user):
 def test_get_me_unauthorized(client):
     response = client.get("/api/me")
     assert response.status_code == 403  # No auth header provided
+
+def test_principal_comes_from_token_claims(client, auth_headers, test_user, monkeypatch):
+    from app.core import deps
+    from app.core.deps import get_current_principal, verify_token_cached
+    from fastapi.security import HTTPAuthorizationCredentials
+
+    token = auth_headers["Authorization"].split()[1]
+    credentials = HTTPAuthorizationCredentials(scheme="Bearer", credentials=token)
+
+    class NoDatabase:
+        def get(self, *args):
+            raise AssertionError("principal should not need the database")
+
+    # The undecorated dependency, called with the session it would be given
+    principal = get_current_principal.__wrapped__(credentials, NoDatabase())
+    assert principal.email == test_user["email"]
+    assert principal.name == test_user["name"]
+
+    # A verified token is not decoded again
+    monkeypatch.setattr(deps, "verify_token", lambda token: None)
+    assert verify_token_cached(token)["email"] == test_user["email"]
+
+def test_tokens_without_identity_claims_still_work(client, auth_headers, test_user):
+    from app.core.security import create_access_token
+
+    me = client.get("/api/me", headers=auth_headers).json()
+    legacy = create_access_token(data={"sub": str(me["id"])})
+    response = client.get("/api/projects", headers={"Authorization": f"Bearer {legacy}"})
+    assert response.status_code == 200
+
+def test_expired_token_rejected(client, auth_headers):
+    from datetime import timedelta
+    from app.core.security import create_access_token
+
+    me = client.get("/api/me", headers=auth_headers).json()
+    expired = create_access_token(data={"sub": str(me["id"])}, expires_delta=timedelta(seconds=-1))
+    response = client.get("/api/projects", headers={"Authorization": f"Bearer {expired}"})
+    assert response.status_code == 401
+
+def test_login_rehashes_outdated_password_hash(client, db_session):
+    from passlib.hash import pbkdf2_sha256
+    from app.core.config import settings
+    from app.models import User
+
+    old_hash = pbkdf2_sha256.using(rounds=1000).hash("password123")
+    user = User(name="Old Hash", email="oldhash@example.com", password_hash=old_hash)
+    db_session.add(user)
+    db_session.commit()
+
+    response = client.post("/api/auth/login", json={"email": "oldhash@example.com", "password": "password123"})
+    assert response.status_code == 200
+
+    db_session.refresh(user)
+    assert user.password_hash != old_hash
+    assert f"${settings.PASSWORD_HASH_ROUNDS}$" in user.password_hash
+
+    # The new hash still verifies
+    response = client.post("/api/auth/login", json={"email": "oldhash@example.com", "password": "password123"})
+    assert response.status_code == 200
+
+def test_password_hasher_rejects_when_saturated():
+    import threading
+    import pytest
+    from app.core.security import PasswordHasher, PasswordHasherBusy
+
+    hasher = PasswordHasher(workers=1, queue_depth=1)
+    release = threading.Event()
+    try:
+        running = hasher.submit(release.wait)
+        queued = hasher.submit(release.wait)
+        with pytest.raises(PasswordHasherBusy):
+            hasher.submit(release.wait)
+        assert hasher.rejected == 1
+
+        release.set()
+        running.result(timeout=5)
+        queued.result(timeout=5)
+        # Slots are returned once jobs finish
+        assert hasher.submit(lambda: "ok").result(timeout=5) == "ok"
+    finally:
+        release.set()
+        hasher.shutdown()
+
+def test_login_returns_503_when_hasher_saturated(client, test_user, auth_headers, monkeypatch):
+    import threading
+    from app.api.endpoints import auth
+    from app.core.security import PasswordHasher
+
+    hasher = PasswordHasher(workers=1, queue_depth=0)
+    release = threading.Event()
+    hasher.submit(release.wait)
+    monkeypatch.setattr(auth, "password_hasher", hasher)
+    try:
+        response = client.post("/api/auth/login", json={
+            "email": test_user["email"],
+            "password": test_user["password"]
+        })
+        assert response.status_code == 503
+        assert response.headers["Retry-After"] == "1"
+    finally:
+        release.set()
+        hasher.shutdown()
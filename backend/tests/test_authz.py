@@ -0,0 +1,61 @@
+from app.core.authz import membership_cache
+from app.core.cache import MISSING, TTLCache
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self):
+        return self.now
+
+
+def test_ttl_cache_expires_and_evicts():
+    clock = FakeClock()
+    cache = TTLCache(maxsize=2, ttl=10, clock=clock)
+    cache.set("a", 1)
+    cache.set("b", None)
+    assert cache.get("b") is None
+    assert cache.get("a") == 1
+
+    cache.set("c", 3)  # "b" is least recently used
+    assert cache.get("b") is MISSING
+    assert cache.get("a") == 1
+
+    clock.now = 11
+    assert cache.get("a") is MISSING
+    assert cache.stats() == {"hits": 3, "misses": 2, "size": 1, "maxsize": 2}
+
+
+def test_load_racing_an_invalidation_is_not_stored():
+    cache = TTLCache(maxsize=10, ttl=60)
+
+    def stale_load():
+        cache.pop("key")  # a write commits while the load is in flight
+        return "stale"
+
+    assert cache.get_or_load("key", stale_load) == "stale"
+    assert cache.get("key") is MISSING
+
+
+def test_membership_lookups_are_cached(client, auth_headers, make_project, make_issue):
+    project_id = make_project("AUTHC")
+    issue_id = make_issue(project_id)
+    membership_cache.clear()
+
+    for _ in range(3):
+        assert client.get(f"/api/issues/{issue_id}", headers=auth_headers).status_code == 200
+    assert membership_cache.stats()["misses"] == 1
+    assert membership_cache.stats()["hits"] == 2
+
+
+def test_adding_member_invalidates_cached_denial(client, auth_headers, make_project):
+    project_id = make_project("AUTHI")
+    client.post("/api/auth/signup", json={"name": "Late Joiner", "email": "late@example.com", "password": "password123"})
+    token = client.post("/api/auth/login", json={"email": "late@example.com", "password": "password123"}).json()["access_token"]
+    joiner_headers = {"Authorization": f"Bearer {token}"}
+
+    assert client.get(f"/api/projects/{project_id}", headers=joiner_headers).status_code == 403
+    response = client.post(f"/api/projects/{project_id}/members", headers=auth_headers, json={"email": "late@example.com"})
+    assert response.status_code == 200
+    assert client.get(f"/api/projects/{project_id}", headers=joiner_headers).status_code == 200
@@ -0,0 +1,76 @@
+from app.core.config import settings
+from app.db import base
+from app.db.base import create_db_engine, dispose_engine, get_engine, get_session_local
+
+
+def test_engine_is_shared():
+    assert get_engine() is get_engine()
+    assert get_session_local() is get_session_local()
+    assert get_session_local().kw["bind"] is get_engine()
+
+
+def test_pool_uses_settings(monkeypatch, tmp_path):
+    monkeypatch.setattr(settings, "DB_POOL_SIZE", 7)
+    monkeypatch.setattr(settings, "DB_MAX_OVERFLOW", 3)
+    monkeypatch.setattr(settings, "DB_POOL_TIMEOUT", 2.5)
+    engine = create_db_engine(f"sqlite:///{tmp_path / 'pool.db'}")
+    try:
+        assert engine.pool.size() == 7
+        assert engine.pool._max_overflow == 3
+        assert engine.pool._timeout == 2.5
+    finally:
+        engine.dispose()
+
+
+def test_memory_sqlite_skips_pool_sizing():
+    engine = create_db_engine("sqlite://")
+    try:
+        with engine.connect():
+            pass
+    finally:
+        engine.dispose()
+
+
+def test_dispose_engine_recreates_on_next_use():
+    engine = get_engine()
+    dispose_engine()
+    assert base._engine is None
+    assert get_engine() is not engine
+
+
+def test_fork_handler_resets_pool():
+    engine = get_engine()
+    with engine.connect():
+        pass
+    pool = engine.pool
+    base._reset_engine_after_fork()
+    assert get_engine() is engine
+    assert engine.pool is not pool
+
+
+def test_sqlite_performance_profile(monkeypatch, tmp_path):
+    monkeypatch.setattr(settings, "SQLITE_PERFORMANCE_PROFILE", True)
+    monkeypatch.setattr(settings, "SQLITE_MMAP_SIZE", 1048576)
+    monkeypatch.setattr(settings, "SQLITE_CACHE_SIZE", -2048)
+    monkeypatch.setattr(settings, "SQLITE_BUSY_TIMEOUT_MS", 1234)
+    engine = create_db_engine(f"sqlite:///{tmp_path / 'wal.db'}")
+    try:
+        with engine.connect() as conn:
+            pragma = lambda name: conn.exec_driver_sql(f"PRAGMA {name}").scalar()
+            assert pragma("journal_mode") == "wal"
+            assert pragma("synchronous") == 1  # NORMAL
+            assert pragma("mmap_size") == 1048576
+            assert pragma("cache_size") == -2048
+            assert pragma("busy_timeout") == 1234
+            assert pragma("foreign_keys") == 1
+    finally:
+        engine.dispose()
+
+
+def test_sqlite_profile_is_opt_in(tmp_path):
+    engine = create_db_engine(f"sqlite:///{tmp_path / 'plain.db'}")
+    try:
+        with engine.connect() as conn:
+            assert conn.exec_driver_sql("PRAGMA journal_mode").scalar() == "delete"
+    finally:
+        engine.dispose()
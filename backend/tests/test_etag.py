@@ -0,0 +1,98 @@
+"""Conditional GETs driven by the project and issue version counters."""
+from app.core.etag import etag_matches, weak_etag
+
+
+def test_etag_matching():
+    etag = weak_etag("issue", 1, 3)
+    assert etag == 'W/"issue-1-v3"'
+    assert etag_matches(etag, etag)
+    assert etag_matches('"issue-1-v3"', etag)
+    assert etag_matches('W/"issue-1-v2", W/"issue-1-v3"', etag)
+    assert etag_matches("*", etag)
+    assert not etag_matches('W/"issue-1-v2"', etag)
+    assert not etag_matches(None, etag)
+
+
+def test_list_issues_not_modified(client, auth_headers, make_project, make_issue, query_budget):
+    project_id = make_project("ET1")
+    make_issue(project_id)
+    url = f"/api/projects/{project_id}/issues"
+
+    response = client.get(url, headers=auth_headers)
+    etag = response.headers["ETag"]
+    assert response.headers["Cache-Control"] == "private, no-cache"
+
+    # Only the version lookup runs; the list query is skipped
+    with query_budget(1):
+        response = client.get(url, headers={**auth_headers, "If-None-Match": etag})
+    assert response.status_code == 304
+    assert response.headers["ETag"] == etag
+    assert response.content == b""
+
+
+def test_issue_writes_change_list_etag(client, auth_headers, make_project, make_issue):
+    project_id = make_project("ET2")
+    url = f"/api/projects/{project_id}/issues"
+    seen = {client.get(url, headers=auth_headers).headers["ETag"]}
+
+    issue_id = make_issue(project_id)
+    seen.add(client.get(url, headers=auth_headers).headers["ETag"])
+    client.patch(f"/api/issues/{issue_id}", headers=auth_headers, json={"status": "in_progress"})
+    seen.add(client.get(url, headers=auth_headers).headers["ETag"])
+    client.post(f"/api/issues/{issue_id}/comments", headers=auth_headers, json={"body": "Looking"})
+    seen.add(client.get(url, headers=auth_headers).headers["ETag"])
+    client.delete(f"/api/issues/{issue_id}", headers=auth_headers)
+    seen.add(client.get(url, headers=auth_headers).headers["ETag"])
+    assert len(seen) == 5
+
+
+def test_get_issue_and_comments_etags(client, auth_headers, make_project, make_issue):
+    project_id = make_project("ET3")
+    issue_id = make_issue(project_id)
+    issue_etag = client.get(f"/api/issues/{issue_id}", headers=auth_headers).headers["ETag"]
+    comments_etag = client.get(f"/api/issues/{issue_id}/comments", headers=auth_headers).headers["ETag"]
+
+    response = client.get(f"/api/issues/{issue_id}", headers={**auth_headers, "If-None-Match": issue_etag})
+    assert response.status_code == 304
+    response = client.get(f"/api/issues/{issue_id}/comments", headers={**auth_headers, "If-None-Match": comments_etag})
+    assert response.status_code == 304
+
+    client.post(f"/api/issues/{issue_id}/comments", headers=auth_headers, json={"body": "New"})
+    response = client.get(f"/api/issues/{issue_id}", headers={**auth_headers, "If-None-Match": issue_etag})
+    assert response.status_code == 200
+    assert response.headers["ETag"] != issue_etag
+    response = client.get(f"/api/issues/{issue_id}/comments", headers={**auth_headers, "If-None-Match": comments_etag})
+    assert response.status_code == 200
+    assert len(response.json()) == 1
+
+
+def test_version_bump_keeps_updated_at(client, auth_headers, make_project, make_issue):
+    project_id = make_project("ET4")
+    issue_id = make_issue(project_id)
+    before = client.get(f"/api/issues/{issue_id}", headers=auth_headers).json()["updated_at"]
+    client.post(f"/api/issues/{issue_id}/comments", headers=auth_headers, json={"body": "Ping"})
+    assert client.get(f"/api/issues/{issue_id}", headers=auth_headers).json()["updated_at"] == before
+
+
+def test_project_etag_changes_with_members(client, auth_headers, make_project):
+    project_id = make_project("ET5")
+    url = f"/api/projects/{project_id}"
+    etag = client.get(url, headers=auth_headers).headers["ETag"]
+    assert client.get(url, headers={**auth_headers, "If-None-Match": etag}).status_code == 304
+
+    client.post("/api/auth/signup", json={"name": "Other", "email": "etag-other@example.com", "password": "password123"})
+    response = client.post(f"{url}/members", headers=auth_headers, json={"email": "etag-other@example.com", "role": "member"})
+    assert response.status_code == 200
+    response = client.get(url, headers={**auth_headers, "If-None-Match": etag})
+    assert response.status_code == 200
+    assert len(response.json()["members"]) == 2
+
+
+def test_not_member_gets_403_not_304(client, auth_headers, make_project):
+    project_id = make_project("ET6")
+    etag = client.get(f"/api/projects/{project_id}/issues", headers=auth_headers).headers["ETag"]
+    client.post("/api/auth/signup", json={"name": "Stranger", "email": "etag-stranger@example.com", "password": "password123"})
+    token = client.post("/api/auth/login", json={"email": "etag-stranger@example.com", "password": "password123"}).json()["access_token"]
+    response = client.get(f"/api/projects/{project_id}/issues",
+                          headers={"Authorization": f"Bearer {token}", "If-None-Match": etag})
+    assert response.status_code == 403
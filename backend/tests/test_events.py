@@ -0,0 +1,217 @@
+"""Project event streams: broker fan-out, slow consumers, Last-Event-ID replay, and the SSE endpoint."""
+import asyncio
+import time
+
+from app.core.events import KEEPALIVE, EventBroker, event_broker
+from app.main import app
+
+
+def parse(body: bytes):
+    """``[(id, event, data)]`` of the events in an SSE body, skipping comments and the retry line."""
+    events = []
+    for block in body.split(b"\n\n"):
+        fields = dict(line.split(b": ", 1) for line in block.split(b"\n") if b": " in line and not line.startswith(b":"))
+        if b"event" in fields:
+            events.append((fields[b"id"].decode(), fields[b"event"].decode(), fields[b"data"].decode()))
+    return events
+
+
+def test_five_thousand_idle_subscribers():
+    broker = EventBroker(queue_size=8, history_size=100)
+
+    async def main():
+        subscriptions = [broker.subscribe(1) for _ in range(5000)]
+        elsewhere = broker.subscribe(2)
+        readers = [asyncio.create_task(subscription.next_frames(10)) for subscription in subscriptions]
+        await asyncio.sleep(0.1)
+        assert broker.subscribers() == 5001
+
+        # Published from a worker thread, as the sync endpoints do
+        start = time.perf_counter()
+        await asyncio.to_thread(broker.publish, 1, "issue.deleted", {"id": 7})
+        delivered = await asyncio.gather(*readers)
+        elapsed = time.perf_counter() - start
+
+        for subscription in subscriptions + [elsewhere]:
+            broker.unsubscribe(subscription)
+        return delivered, elsewhere, elapsed
+
+    delivered, elsewhere, elapsed = asyncio.run(main())
+    # One frame, encoded once and shared by every subscriber
+    assert all(len(frames) == 1 and frames[0] is delivered[0][0] for frames in delivered)
+    assert parse(delivered[0][0]) == [(f"{broker.epoch}-1", "issue.deleted", '{"id":7}')]
+    assert not elsewhere.frames
+    assert broker.subscribers() == 0
+    assert elapsed < 2, elapsed
+
+
+def test_slow_subscribers_are_dropped():
+    broker = EventBroker(queue_size=3, history_size=100)
+
+    async def main():
+        slow = broker.subscribe(1)
+        fast = broker.subscribe(1)
+        received = []
+        for n in range(5):
+            broker.publish(1, "issue.deleted", {"id": n})
+            received += await fast.next_frames(1)
+        return slow, fast, received
+
+    slow, fast, received = asyncio.run(main())
+    assert len(received) == 5
+    assert slow.dropped and not slow.frames
+    assert not fast.dropped
+    assert (broker.dropped, broker.subscribers()) == (1, 1)
+
+
+def test_last_event_id_replay():
+    broker = EventBroker(queue_size=10, history_size=4)
+
+    async def main():
+        for n in range(3):
+            broker.publish(1, "issue.deleted", {"id": n})
+        broker.publish(2, "issue.deleted", {"id": 99})
+        resumed = broker.subscribe(1, f"{broker.epoch}-1")
+        current = broker.subscribe(1, f"{broker.epoch}-3")
+        restarted = broker.subscribe(1, "0badcafe-2")
+        garbage = broker.subscribe(1, "yesterday")
+
+        # Event 2 of project 1 falls out of the four-event ring
+        for n in range(3, 6):
+            broker.publish(2, "issue.deleted", {"id": n})
+        too_old = broker.subscribe(1, f"{broker.epoch}-1")
+        return [list(subscription.frames) for subscription in (resumed, current, restarted, garbage, too_old)]
+
+    resumed, current, restarted, garbage, too_old = asyncio.run(main())
+    assert [(event_id, data) for event_id, _, data in parse(b"".join(resumed))] == [
+        (f"{broker.epoch}-2", '{"id":1}'), (f"{broker.epoch}-3", '{"id":2}')
+    ]
+    assert current == []
+    # A resync carries the current id, so the next reconnect can resume from it
+    for frames in (restarted, garbage, too_old):
+        assert parse(b"".join(frames)) == [(f"{broker.epoch}-3", "resync", "{}")]
+
+
+def test_stream_sends_keepalives_and_unsubscribes():
+    broker = EventBroker(queue_size=10, history_size=10)
+
+    async def main():
+        subscription = broker.subscribe(1)
+        stream = broker.stream(subscription, heartbeat=0.01)
+        chunks = [await stream.__anext__() for _ in range(2)]
+        broker.publish(1, "issue.deleted", {"id": 1})
+        chunks.append(await stream.__anext__())
+        await stream.aclose()
+        return chunks
+
+    chunks = asyncio.run(main())
+    assert chunks[:2] == [b"retry: 3000\n\n", KEEPALIVE]
+    assert parse(chunks[2])[0][1] == "issue.deleted"
+    assert broker.subscribers() == 0
+
+
+class Stream:
+    """A streaming GET against the app on the running loop; TestClient would wait for the body to end."""
+
+    def __init__(self, path: str, headers: dict):
+        self.chunks = asyncio.Queue()
+        self.buffer = b""
+        self.status = None
+        self._requested = False
+        self._disconnect = asyncio.Event()
+        scope = {
+            "type": "http",
+            "asgi": {"version": "3.0", "spec_version": "2.3"},
+            "http_version": "1.1",
+            "method": "GET",
+            "scheme": "http",
+            "path": path,
+            "raw_path": path.encode(),
+            "query_string": b"",
+            "root_path": "",
+            "headers": [(b"host", b"testserver")] + [
+                (name.lower().encode(), value.encode()) for name, value in headers.items()
+            ],
+            "client": ("testclient", 50000),
+            "server": ("testserver", 80),
+        }
+        self.task = asyncio.create_task(app(scope, self._receive, self._send))
+
+    async def _receive(self):
+        if not self._requested:
+            self._requested = True
+            return {"type": "http.request", "body": b"", "more_body": False}
+        await self._disconnect.wait()
+        return {"type": "http.disconnect"}
+
+    async def _send(self, message):
+        if message["type"] == "http.response.start":
+            self.status = message["status"]
+        elif message.get("body"):
+            await self.chunks.put(message["body"])
+
+    async def read_until(self, marker: bytes) -> bytes:
+        while marker not in self.buffer:
+            self.buffer += await asyncio.wait_for(self.chunks.get(), 10)
+        return self.buffer
+
+    async def close(self):
+        self._disconnect.set()
+        await asyncio.wait_for(self.task, 10)
+
+
+def test_project_event_stream(client, auth_headers, make_project, make_issue, db_engines):
+    project_id = make_project("EV1")
+    other_project = make_project("EV2")
+    path = f"/api/projects/{project_id}/events"
+    subscribers = event_broker.subscribers()
+
+    async def main():
+        stream = Stream(path, auth_headers)
+        await stream.read_until(b"retry: 3000")
+        assert stream.status == 200
+        assert event_broker.subscribers() == subscribers + 1
+        # The open stream holds no database connection
+        assert [engine.pool.checkedout() for engine in db_engines] == [0] * len(db_engines)
+
+        # Writes go through the regular endpoints, on the test client's own thread and loop
+        await asyncio.to_thread(make_issue, other_project, title="Elsewhere")
+        issue_id = await asyncio.to_thread(make_issue, project_id, title="Pushed")
+        await asyncio.to_thread(client.post, f"/api/issues/{issue_id}/comments", headers=auth_headers,
+                                json={"body": "Live"})
+        await asyncio.to_thread(client.patch, f"/api/issues/{issue_id}", headers=auth_headers,
+                                json={"status": "resolved"})
+        await asyncio.to_thread(client.post, f"/api/projects/{project_id}/issues:batch", headers=auth_headers,
+                                json={"issues": [{"title": "One"}, {"title": "Two"}]})
+        await asyncio.to_thread(client.delete, f"/api/issues/{issue_id}", headers=auth_headers)
+        body = await stream.read_until(b"event: issue.deleted")
+        await stream.close()
+        assert event_broker.subscribers() == subscribers
+
+        # Reconnect after the first event: the rest is replayed
+        events = parse(body)
+        resumed = Stream(path, {**auth_headers, "Last-Event-ID": events[0][0]})
+        replay = await resumed.read_until(b"event: issue.deleted")
+        await resumed.close()
+        return issue_id, events, parse(replay)
+
+    issue_id, events, replayed = asyncio.run(main())
+    assert [event for _, event, _ in events] == [
+        "issue.created", "comment.created", "issue.updated", "issues.created", "issue.deleted"
+    ]
+    created, comment, updated, batch, deleted = (data for _, _, data in events)
+    assert '"title":"Pushed"' in created and '"reporter":{' in created
+    assert '"body":"Live"' in comment
+    assert '"status":"resolved"' in updated
+    assert batch.startswith('{"ids":[') and batch.count(",") == 1
+    assert deleted == f'{{"id":{issue_id}}}'
+    assert replayed == events[1:]
+
+
+def test_event_stream_requires_membership(client, auth_headers, make_project):
+    project_id = make_project("EV3")
+    client.post("/api/auth/signup", json={"name": "Lurker", "email": "lurker@example.com", "password": "password123"})
+    token = client.post("/api/auth/login", json={"email": "lurker@example.com", "password": "password123"}).json()
+    response = client.get(f"/api/projects/{project_id}/events",
+                          headers={"Authorization": f"Bearer {token['access_token']}"})
+    assert response.status_code == 403
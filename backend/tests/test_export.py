@@ -0,0 +1,201 @@
+"""Streaming NDJSON/CSV export."""
+import asyncio
+import csv
+import io
+import json
+import os
+
+from sqlalchemy import create_engine, insert, text
+from sqlalchemy.orm import sessionmaker
+
+from app.core.authz import membership_cache
+from app.core.export import stream_export
+from app.core.security import create_access_token
+from app.db.base import Base
+from app.db.search import uninstall_search_index
+from app.db.session import get_session, get_sync_engine
+from app.main import app
+from app.models import MemberRole, Project, ProjectMember, User
+from scripts.seed import parse_count
+
+# Override with EXPORT_TEST_ISSUES=5M etc. for a bigger run
+SCALE_ISSUES = parse_count(os.environ.get("EXPORT_TEST_ISSUES", "1M"))
+
+
+def test_ndjson_export(client, auth_headers, make_project, make_issue):
+    project_id = make_project("EX1")
+    first = make_issue(project_id, title="First")
+    make_issue(project_id, title="Second", priority="high")
+    client.post(f"/api/issues/{first}/comments", headers=auth_headers, json={"body": "One"})
+    client.post(f"/api/issues/{first}/comments", headers=auth_headers, json={"body": "Two"})
+
+    response = client.get(f"/api/projects/{project_id}/export", headers=auth_headers)
+    assert response.status_code == 200
+    assert response.headers["Content-Type"] == "application/x-ndjson"
+    assert response.headers["Content-Disposition"] == 'attachment; filename="EX1-issues.ndjson"'
+    records = [json.loads(line) for line in response.text.splitlines()]
+    assert [record["title"] for record in records] == ["First", "Second"]
+    assert records[1]["priority"] == "high"
+    assert records[0]["reporter_email"] == "test@example.com"
+    assert records[0]["assignee_email"] is None
+    assert records[0]["comment_count"] == 2
+    assert "comments" not in records[0]
+
+    response = client.get(f"/api/projects/{project_id}/export?comments=true", headers=auth_headers)
+    records = [json.loads(line) for line in response.text.splitlines()]
+    assert [comment["body"] for comment in records[0]["comments"]] == ["One", "Two"]
+    assert records[0]["comments"][0]["author_email"] == "test@example.com"
+    assert records[1]["comments"] == []
+
+
+def test_csv_export(client, auth_headers, make_project, make_issue):
+    project_id = make_project("EX2")
+    issue_id = make_issue(project_id, title='Quotes "and", commas')
+    client.post(f"/api/issues/{issue_id}/comments", headers=auth_headers, json={"body": "Line one\nline two"})
+
+    response = client.get(f"/api/projects/{project_id}/export?format=csv&comments=true", headers=auth_headers)
+    assert response.headers["Content-Type"] == "text/csv; charset=utf-8"
+    rows = list(csv.DictReader(io.StringIO(response.text)))
+    assert len(rows) == 1
+    assert rows[0]["title"] == 'Quotes "and", commas'
+    assert rows[0]["status"] == "open"
+    assert json.loads(rows[0]["comments"])[0]["body"] == "Line one\nline two"
+
+    empty_project_id = make_project("EX3")
+    response = client.get(f"/api/projects/{empty_project_id}/export?format=csv", headers=auth_headers)
+    assert response.text.splitlines() == [
+        "id,title,description,status,priority,reporter_email,assignee_email,"
+        "expected_completion_date,created_at,updated_at,comment_count"
+    ]
+
+
+def test_export_requires_membership(client, auth_headers, make_project):
+    project_id = make_project("EX4")
+    client.post("/api/auth/signup", json={"name": "Nosy", "email": "export-nosy@example.com", "password": "password123"})
+    token = client.post("/api/auth/login", json={"email": "export-nosy@example.com", "password": "password123"}).json()["access_token"]
+    response = client.get(f"/api/projects/{project_id}/export", headers={"Authorization": f"Bearer {token}"})
+    assert response.status_code == 403
+    response = client.get(f"/api/projects/{project_id}/export?format=xml", headers=auth_headers)
+    assert response.status_code == 422
+
+
+def test_export_holds_one_connection(client, auth_headers, make_project, make_issue, db_engines, monkeypatch):
+    from app.api.endpoints import exports
+
+    project_id = make_project("EX5")
+    for i in range(3):
+        make_issue(project_id, title=f"Issue {i}")
+    checked_out = []
+
+    def recording_export(*args, **kwargs):
+        for chunk in stream_export(*args, **kwargs):
+            checked_out.append(sum(engine.pool.checkedout() for engine in db_engines))
+            yield chunk
+
+    monkeypatch.setattr(exports, "stream_export", recording_export)
+    membership_cache.clear()
+    response = client.get(f"/api/projects/{project_id}/export?format=ndjson", headers=auth_headers)
+    assert len(response.content.splitlines()) == 3
+    # Only the export's own connection, not the request session's
+    assert checked_out and set(checked_out) == {1}
+
+
+def rss_bytes() -> int:
+    with open("/proc/self/statm") as f:
+        return int(f.read().split()[1]) * os.sysconf("SC_PAGE_SIZE")
+
+
+async def stream_through_app(path: str, headers: dict):
+    """Drive the ASGI app directly, discarding the body as it arrives (test clients buffer it)."""
+    sent = {"status": None, "bytes": 0, "lines": 0, "peak_rss": rss_bytes()}
+    request_sent = False
+
+    async def receive():
+        nonlocal request_sent
+        if request_sent:
+            await asyncio.Event().wait()
+        request_sent = True
+        return {"type": "http.request", "body": b"", "more_body": False}
+
+    async def send(message):
+        if message["type"] == "http.response.start":
+            sent["status"] = message["status"]
+        elif message["type"] == "http.response.body":
+            sent["bytes"] += len(message.get("body", b""))
+            sent["lines"] += message.get("body", b"").count(b"\n")
+            sent["peak_rss"] = max(sent["peak_rss"], rss_bytes())
+
+    path, _, query = path.partition("?")
+    scope = {
+        "type": "http",
+        "asgi": {"version": "3.0"},
+        "http_version": "1.1",
+        "method": "GET",
+        "scheme": "http",
+        "path": path,
+        "raw_path": path.encode(),
+        "query_string": query.encode(),
+        "root_path": "",
+        "headers": [(name.lower().encode(), value.encode()) for name, value in headers.items()],
+        "client": ("127.0.0.1", 1234),
+        "server": ("test", 80),
+    }
+    await app(scope, receive, send)
+    return sent
+
+
+def fill_project(engine, issues: int, users: int = 50):
+    """One project with ``issues`` issues, generated inside SQLite so the test spends its time exporting."""
+    Base.metadata.create_all(bind=engine)
+    with engine.begin() as conn:
+        uninstall_search_index(conn)
+        conn.execute(insert(User), [
+            {"id": i, "name": f"User {i}", "email": f"user{i}@example.com", "password_hash": "x"}
+            for i in range(1, users + 1)
+        ])
+        conn.execute(insert(Project).values(id=1, name="Huge", key="HUGE"))
+        conn.execute(insert(ProjectMember), [
+            {"project_id": 1, "user_id": i, "role": MemberRole.member} for i in range(1, users + 1)
+        ])
+        conn.execute(text(
+            "WITH RECURSIVE n(i) AS (SELECT 1 UNION ALL SELECT i + 1 FROM n WHERE i < :issues) "
+            "INSERT INTO issues (project_id, title, description, status, priority, reporter_id, assignee_id, "
+            "created_at, updated_at, comment_count, version) "
+            "SELECT 1, 'Issue ' || i, 'Steps to reproduce: open the board, wait, scroll and reload the page', "
+            "'open', 'medium', 1 + i % :users, CASE WHEN i % 3 THEN 1 + i % 7 END, "
+            "datetime('2024-01-01', '+' || i || ' seconds'), datetime('2024-01-01', '+' || i || ' seconds'), 0, 0 "
+            "FROM n"
+        ), {"issues": issues, "users": users})
+
+
+def test_large_export_keeps_memory_flat(client, tmp_path):
+    engine = create_engine(f"sqlite:///{tmp_path / 'export.db'}")
+    fill_project(engine, SCALE_ISSUES)
+    user_id = 1
+    SessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
+
+    def scale_db():
+        db = SessionLocal()
+        try:
+            yield db
+        finally:
+            db.close()
+
+    previous = app.dependency_overrides[get_session], app.dependency_overrides[get_sync_engine]
+    app.dependency_overrides[get_session] = scale_db
+    app.dependency_overrides[get_sync_engine] = lambda: engine
+    membership_cache.clear()
+    try:
+        headers = {"Authorization": f"Bearer {create_access_token(data={'sub': str(user_id)})}"}
+        before = rss_bytes()
+        sent = asyncio.run(stream_through_app("/api/projects/1/export?format=ndjson", headers))
+    finally:
+        app.dependency_overrides[get_session], app.dependency_overrides[get_sync_engine] = previous
+        membership_cache.clear()
+        engine.dispose()
+
+    assert sent["status"] == 200
+    assert sent["lines"] == SCALE_ISSUES
+    # Hundreds of MB go out while the process grows by a small, size-independent amount
+    assert sent["bytes"] > SCALE_ISSUES * 200
+    assert sent["peak_rss"] - before < 64 * 1024 * 1024, (before, sent["peak_rss"])
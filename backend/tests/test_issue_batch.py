@@ -0,0 +1,83 @@
+"""Batch create/update of issues."""
+
+
+def test_batch_create(client, auth_headers, make_project, query_budget):
+    project_id = make_project("BT1")
+    items = [{"title": f"Imported {i}", "priority": "high" if i % 2 else "low"} for i in range(50)]
+    items.insert(3, {"title": "Bad assignee", "assignee_id": 987654})
+
+    etag = client.get(f"/api/projects/{project_id}/issues", headers=auth_headers).headers["ETag"]
+    with query_budget(6):
+        response = client.post(f"/api/projects/{project_id}/issues:batch", headers=auth_headers, json={"issues": items})
+    assert response.status_code == 200
+    body = response.json()
+    assert (body["succeeded"], body["failed"]) == (50, 1)
+    assert body["results"][3] == {
+        "index": 3, "id": None, "status_code": 400, "detail": "Assignee must be a project member",
+    }
+    created = [result for result in body["results"] if result["status_code"] == 201]
+    assert [result["index"] for result in created] == [i for i in range(51) if i != 3]
+
+    # Ids line up with the input order
+    issue = client.get(f"/api/issues/{created[10]['id']}", headers=auth_headers).json()
+    assert issue["title"] == items[created[10]["index"]]["title"]
+    assert issue["status"] == "open"
+
+    response = client.get(f"/api/projects/{project_id}/issues?per_page=100", headers={**auth_headers, "If-None-Match": etag})
+    assert response.status_code == 200
+    assert len(response.json()) == 50
+
+
+def test_batch_create_validates_each_item(client, auth_headers, make_project):
+    project_id = make_project("BT2")
+    response = client.post(f"/api/projects/{project_id}/issues:batch", headers=auth_headers,
+                           json={"issues": [{"title": ""}]})
+    assert response.status_code == 422
+    response = client.post(f"/api/projects/{project_id}/issues:batch", headers=auth_headers, json={"issues": []})
+    assert response.status_code == 422
+
+
+def test_batch_update(client, auth_headers, make_project, make_issue, query_budget):
+    project_id = make_project("BT3")
+    other_project_id = make_project("BT4")
+    ids = [make_issue(project_id, title=f"Issue {i}") for i in range(6)]
+    foreign_id = make_issue(other_project_id)
+
+    items = [{"id": issue_id, "status": "closed"} for issue_id in ids[:4]]
+    items += [
+        {"id": ids[4], "title": "Renamed A"},
+        {"id": ids[5], "title": "Renamed B"},
+        {"id": foreign_id, "status": "closed"},
+        {"id": ids[0], "status": "open"},
+    ]
+    with query_budget(7):
+        response = client.patch(f"/api/projects/{project_id}/issues:batch", headers=auth_headers, json={"issues": items})
+    body = response.json()
+    assert (body["succeeded"], body["failed"]) == (6, 2)
+    assert body["results"][6]["status_code"] == 404
+    assert body["results"][7]["status_code"] == 400
+
+    listed = {issue["id"]: issue for issue in client.get(f"/api/projects/{project_id}/issues", headers=auth_headers).json()}
+    assert [listed[issue_id]["status"] for issue_id in ids[:4]] == ["closed"] * 4
+    assert listed[ids[4]]["title"] == "Renamed A"
+    assert listed[ids[5]]["title"] == "Renamed B"
+    assert listed[ids[4]]["status"] == "open"
+    assert client.get(f"/api/issues/{foreign_id}", headers=auth_headers).json()["status"] == "open"
+
+
+def test_batch_update_checks_permissions(client, auth_headers, make_project, make_issue):
+    project_id = make_project("BT5")
+    issue_id = make_issue(project_id)
+    client.post("/api/auth/signup", json={"name": "Member", "email": "batch-member@example.com", "password": "password123"})
+    client.post(f"/api/projects/{project_id}/members", headers=auth_headers,
+                json={"email": "batch-member@example.com", "role": "member"})
+    token = client.post("/api/auth/login", json={"email": "batch-member@example.com", "password": "password123"}).json()["access_token"]
+    member_headers = {"Authorization": f"Bearer {token}"}
+
+    response = client.patch(f"/api/projects/{project_id}/issues:batch", headers=member_headers, json={"issues": [
+        {"id": issue_id, "status": "closed"},
+        {"id": issue_id, "title": "Members may retitle"},
+    ]})
+    results = response.json()["results"]
+    assert results[0]["status_code"] == 403
+    assert results[1]["status_code"] == 200
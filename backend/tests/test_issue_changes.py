@@ -0,0 +1,90 @@
+"""Delta sync of a project's issues from a watermark."""
+from app.core.pagination import decode_cursor, encode_cursor
+
+
+def changes(client, headers, project_id, since=None, **params):
+    if since:
+        params["since"] = since
+    response = client.get(f"/api/projects/{project_id}/issues/changes", headers=headers, params=params)
+    assert response.status_code == 200, response.text
+    return response.json()
+
+
+def test_changes_since_watermark(client, auth_headers, make_project, make_issue, query_budget):
+    project_id = make_project("DS1")
+    first = make_issue(project_id, title="First")
+    second = make_issue(project_id, title="Second")
+    third = make_issue(project_id, title="Third")
+    make_issue(make_project("DS2"), title="Other project")
+
+    snapshot = changes(client, auth_headers, project_id)
+    assert [issue["title"] for issue in snapshot["issues"]] == ["First", "Second", "Third"]
+    assert (snapshot["deleted"], snapshot["has_more"]) == ([], False)
+
+    # Nothing changed: nothing sent, same watermark
+    with query_budget(4):
+        unchanged = changes(client, auth_headers, project_id, snapshot["watermark"])
+    assert (unchanged["issues"], unchanged["deleted"]) == ([], [])
+    assert unchanged["watermark"] == snapshot["watermark"]
+
+    client.patch(f"/api/issues/{first}", headers=auth_headers, json={"status": "in_progress"})
+    # A comment changes the issue's comment_count without touching updated_at
+    client.post(f"/api/issues/{second}/comments", headers=auth_headers, json={"body": "Seen"})
+    client.delete(f"/api/issues/{third}", headers=auth_headers)
+    fourth = make_issue(project_id, title="Fourth")
+    client.patch(f"/api/issues/{first}", headers=auth_headers, json={"title": "First, renamed"})
+
+    delta = changes(client, auth_headers, project_id, snapshot["watermark"])
+    # In the order of the writes, each issue once, as of its latest write
+    assert [(issue["id"], issue["title"]) for issue in delta["issues"]] == [
+        (second, "Second"), (fourth, "Fourth"), (first, "First, renamed")
+    ]
+    assert delta["issues"][0]["comment_count"] == 1
+    assert delta["issues"][2]["status"] == "in_progress"
+    assert delta["deleted"] == [third]
+    assert changes(client, auth_headers, project_id, delta["watermark"])["issues"] == []
+
+
+def test_changes_are_paged(client, auth_headers, make_project, make_issue):
+    project_id = make_project("DS3")
+    issue_ids = [make_issue(project_id, title=f"Issue {i}") for i in range(5)]
+    watermark = changes(client, auth_headers, project_id)["watermark"]
+    client.delete(f"/api/issues/{issue_ids[0]}", headers=auth_headers)
+    client.patch(f"/api/projects/{project_id}/issues:batch", headers=auth_headers,
+                 json={"issues": [{"id": issue_id, "status": "closed"} for issue_id in issue_ids[1:]]})
+    client.delete(f"/api/issues/{issue_ids[1]}", headers=auth_headers)
+
+    seen, deleted, pages = [], [], 0
+    while True:
+        page = changes(client, auth_headers, project_id, watermark, limit=2)
+        pages += 1
+        seen += [issue["id"] for issue in page["issues"]]
+        deleted += page["deleted"]
+        watermark = page["watermark"]
+        if not page["has_more"]:
+            break
+    assert pages == 3
+    assert deleted == [issue_ids[0], issue_ids[1]]
+    assert seen == issue_ids[2:]
+
+
+def test_imported_issues_are_changes(client, auth_headers, make_project):
+    project_id = make_project("DS4")
+    watermark = changes(client, auth_headers, project_id)["watermark"]
+    # Imports keep the original timestamps, which are older than the watermark
+    body = b'{"title": "Old", "created_at": "2019-01-01T00:00:00+00:00"}\n'
+    client.post(f"/api/projects/{project_id}/import", headers=auth_headers, content=body)
+    client.post(f"/api/projects/{project_id}/issues:batch", headers=auth_headers, json={"issues": [{"title": "New"}]})
+    delta = changes(client, auth_headers, project_id, watermark)
+    assert [issue["title"] for issue in delta["issues"]] == ["Old", "New"]
+
+
+def test_invalid_watermarks(client, auth_headers, make_project):
+    project_id = make_project("DS5")
+    other = changes(client, auth_headers, make_project("DS6"))["watermark"]
+    watermark = decode_cursor(changes(client, auth_headers, project_id)["watermark"])
+    tampered = [encode_cursor({**watermark, **fields}) for fields in ({"v": {"a": 1}}, {"v": "x"}, {"i": "x"})]
+    for since in ("garbage", other, *tampered):
+        response = client.get(f"/api/projects/{project_id}/issues/changes", headers=auth_headers,
+                              params={"since": since})
+        assert response.status_code == 400
@@ -0,0 +1,153 @@
+from app.core.pagination import decode_cursor, encode_cursor
+from app.models import Comment, Issue
+from scripts.repair_comment_counts import repair_comment_counts
+
+from conftest import engine
+
+
+def test_comment_count_follows_comments(client, auth_headers, db_session, make_project, make_issue):
+    project_id = make_project("CNT")
+    issue_id = make_issue(project_id)
+
+    for body in ("first", "second", "third"):
+        response = client.post(f"/api/issues/{issue_id}/comments", headers=auth_headers, json={"body": body})
+        assert response.status_code == 200
+
+    assert client.get(f"/api/issues/{issue_id}", headers=auth_headers).json()["comment_count"] == 3
+    listed = client.get(f"/api/projects/{project_id}/issues", headers=auth_headers).json()
+    assert listed[0]["comment_count"] == 3
+
+    comment = db_session.query(Comment).filter(Comment.issue_id == issue_id).first()
+    db_session.delete(comment)
+    db_session.commit()
+    assert db_session.get(Issue, issue_id).comment_count == 2
+
+
+def test_delete_issue_with_comments(client, auth_headers, db_session, make_project, make_issue):
+    project_id = make_project("DEL")
+    issue_id = make_issue(project_id)
+    client.post(f"/api/issues/{issue_id}/comments", headers=auth_headers, json={"body": "bye"})
+
+    response = client.delete(f"/api/issues/{issue_id}", headers=auth_headers)
+    assert response.status_code == 204
+    assert db_session.query(Comment).filter(Comment.issue_id == issue_id).count() == 0
+
+
+def test_repair_comment_counts(client, auth_headers, db_session, make_project, make_issue):
+    project_id = make_project("FIX")
+    issue_ids = [make_issue(project_id, f"Issue {i}") for i in range(3)]
+    client.post(f"/api/issues/{issue_ids[0]}/comments", headers=auth_headers, json={"body": "one"})
+
+    # Simulate drift from writes that bypassed the ORM
+    db_session.query(Issue).filter(Issue.id.in_(issue_ids)).update(
+        {Issue.comment_count: 7}, synchronize_session=False
+    )
+    db_session.commit()
+
+    before = dict(db_session.query(Issue.id, Issue.version).filter(Issue.id.in_(issue_ids)))
+    etag = client.get(f"/api/projects/{project_id}/issues", headers=auth_headers).headers["ETag"]
+    watermark = client.get(f"/api/projects/{project_id}/issues/changes", headers=auth_headers).json()["watermark"]
+
+    assert repair_comment_counts(engine, batch_size=2) == 3
+    counts = dict(db_session.query(Issue.id, Issue.comment_count).filter(Issue.id.in_(issue_ids)))
+    assert counts == {issue_ids[0]: 1, issue_ids[1]: 0, issue_ids[2]: 0}
+    assert repair_comment_counts(engine, batch_size=2) == 0
+
+    # The repair is a write like any other: new ETags, and the issues come back in a delta sync
+    after = dict(db_session.query(Issue.id, Issue.version).filter(Issue.id.in_(issue_ids)))
+    assert after == {issue_id: version + 1 for issue_id, version in before.items()}
+    assert client.get(f"/api/projects/{project_id}/issues", headers=auth_headers).headers["ETag"] != etag
+    delta = client.get(f"/api/projects/{project_id}/issues/changes", headers=auth_headers,
+                       params={"since": watermark}).json()
+    assert sorted(issue["id"] for issue in delta["issues"]) == sorted(issue_ids)
+
+
+def test_cursor_pagination_matches_offset_pages(client, auth_headers, make_project, make_issue):
+    project_id = make_project("CUR")
+    for i in range(7):
+        make_issue(project_id, f"Issue {i}")
+    url = f"/api/projects/{project_id}/issues"
+
+    for sort in ("created_at", "priority", "status", "updated_at"):
+        for order in ("asc", "desc"):
+            params = {"sort": sort, "order": order, "per_page": 3}
+            by_page = []
+            for page in (1, 2, 3):
+                response = client.get(url, headers=auth_headers, params={**params, "page": page})
+                by_page += [issue["id"] for issue in response.json()]
+
+            by_cursor = []
+            response = client.get(url, headers=auth_headers, params=params)
+            while True:
+                by_cursor += [issue["id"] for issue in response.json()]
+                cursor = response.headers.get("X-Next-Cursor")
+                if not cursor:
+                    break
+                response = client.get(url, headers=auth_headers, params={**params, "cursor": cursor})
+                assert response.status_code == 200
+
+            assert by_cursor == by_page
+            assert sorted(by_cursor) == sorted(set(by_cursor))
+            assert len(by_cursor) == 7
+
+
+def test_cursor_is_stable_while_issues_are_created(client, auth_headers, make_project, make_issue):
+    project_id = make_project("STB")
+    for i in range(4):
+        make_issue(project_id, f"Issue {i}")
+    url = f"/api/projects/{project_id}/issues"
+
+    first = client.get(url, headers=auth_headers, params={"per_page": 2})
+    make_issue(project_id, "Newest")
+    second = client.get(url, headers=auth_headers, params={"per_page": 2, "cursor": first.headers["X-Next-Cursor"]})
+
+    seen = [issue["title"] for issue in first.json() + second.json()]
+    assert seen == ["Issue 3", "Issue 2", "Issue 1", "Issue 0"]
+
+
+def test_cursor_rejected_for_other_sort(client, auth_headers, make_project, make_issue):
+    project_id = make_project("BAD")
+    for i in range(2):
+        make_issue(project_id, f"Issue {i}")
+    url = f"/api/projects/{project_id}/issues"
+
+    cursor = client.get(url, headers=auth_headers, params={"per_page": 1}).headers["X-Next-Cursor"]
+    response = client.get(url, headers=auth_headers, params={"sort": "priority", "cursor": cursor})
+    assert response.status_code == 400
+    assert client.get(url, headers=auth_headers, params={"cursor": "not-a-cursor"}).status_code == 400
+
+
+def test_tampered_cursor_rejected(client, auth_headers, make_project, make_issue):
+    project_id = make_project("TMP")
+    for i in range(2):
+        make_issue(project_id, f"Issue {i}")
+    url = f"/api/projects/{project_id}/issues"
+
+    cursor = client.get(url, headers=auth_headers, params={"per_page": 1}).headers["X-Next-Cursor"]
+    payload = decode_cursor(cursor)
+    for tampered in ({"v": {"a": 1}}, {"v": [1, 2]}, {"i": "1"}, {"i": 1.5}, {"i": True}, {"i": None}):
+        response = client.get(url, headers=auth_headers, params={"cursor": encode_cursor({**payload, **tampered})})
+        assert response.status_code == 400, tampered
+
+
+def test_list_issues_json_matches_full_model_serialization(client, auth_headers, db_session, make_project, make_issue):
+    import json
+    from app.schemas.issue import IssueList
+
+    project_id = make_project("BYT")
+    me = client.get("/api/me", headers=auth_headers).json()
+    make_issue(project_id, "Ünïcode — title")
+    make_issue(project_id, "Assigned", assignee_id=me["id"], expected_completion_date="2030-01-02T03:04:05")
+    client.patch(f"/api/issues/{make_issue(project_id, 'Moved')}", headers=auth_headers, json={"status": "in_progress"})
+
+    response = client.get(f"/api/projects/{project_id}/issues", headers=auth_headers)
+    assert response.status_code == 200
+
+    # What the response_model pipeline produced from fully loaded ORM issues
+    issues = db_session.query(Issue).filter(Issue.project_id == project_id).order_by(Issue.created_at.desc(), Issue.id.desc()).all()
+    expected = json.dumps(
+        [IssueList.model_validate(issue).model_dump(mode="json") for issue in issues],
+        ensure_ascii=False, allow_nan=False, indent=None, separators=(",", ":"),
+    ).encode("utf-8")
+    assert response.content == expected
+    assert response.headers["content-type"] == "application/json"
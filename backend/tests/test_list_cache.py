@@ -0,0 +1,86 @@
+"""The shared cache of serialized list_issues pages."""
+from app.core.cache import MISSING, BytesLRUCache
+from app.core.list_cache import issue_list_cache
+
+
+def test_bytes_lru_cache_evicts_by_size():
+    cache = BytesLRUCache(maxbytes=4 * (100 + BytesLRUCache.ENTRY_OVERHEAD))
+    for key in "abcd":
+        cache.set(key, b"x" * 100)
+    assert cache.get("a") == (b"x" * 100, None)  # "b" is now least recently used
+    cache.set("e", b"y" * 100, "cursor")
+    assert cache.get("b") is MISSING
+    assert cache.get("e") == (b"y" * 100, "cursor")
+    assert cache.bytes == 4 * (100 + BytesLRUCache.ENTRY_OVERHEAD)
+
+    # Entries larger than a quarter of the cap are not stored at all
+    cache.set("big", b"z" * cache.maxbytes)
+    assert cache.get("big") is MISSING
+
+    cache.pop_where(lambda key: key in ("a", "c"))
+    assert len(cache) == 2
+    assert cache.bytes == 2 * (100 + BytesLRUCache.ENTRY_OVERHEAD)
+    assert cache.stats()["hit_ratio"] == 0.5
+
+
+def test_repeated_page_is_served_from_cache(client, auth_headers, make_project, make_issue, query_budget):
+    project_id = make_project("LC1")
+    for i in range(3):
+        make_issue(project_id, title=f"Issue {i}")
+    url = f"/api/projects/{project_id}/issues?per_page=2&status=open"
+
+    first = client.get(url, headers=auth_headers)
+    hits = issue_list_cache.hits
+    # Only the project version is read; membership is cached, the page is not queried
+    with query_budget(1):
+        second = client.get(f"/api/projects/{project_id}/issues?status=open&per_page=2&q=", headers=auth_headers)
+    assert issue_list_cache.hits == hits + 1
+    assert second.content == first.content
+    assert second.headers["X-Next-Cursor"] == first.headers["X-Next-Cursor"]
+    assert second.headers["ETag"] == first.headers["ETag"]
+    assert second.headers["Content-Type"] == "application/json"
+
+
+def test_writes_invalidate_cached_pages(client, auth_headers, make_project, make_issue):
+    project_id = make_project("LC2")
+    issue_id = make_issue(project_id)
+    other_project_id = make_project("LC3")
+    make_issue(other_project_id)
+    url = f"/api/projects/{project_id}/issues"
+    client.get(url, headers=auth_headers)
+    client.get(f"/api/projects/{other_project_id}/issues", headers=auth_headers)
+
+    client.post(f"/api/issues/{issue_id}/comments", headers=auth_headers, json={"body": "Seen it"})
+    assert not any(key[0] == project_id for key in issue_list_cache._data)
+    assert any(key[0] == other_project_id for key in issue_list_cache._data)
+    assert client.get(url, headers=auth_headers).json()[0]["comment_count"] == 1
+
+    client.patch(f"/api/issues/{issue_id}", headers=auth_headers, json={"title": "Renamed"})
+    assert client.get(url, headers=auth_headers).json()[0]["title"] == "Renamed"
+
+    make_issue(project_id, title="Second")
+    assert len(client.get(url, headers=auth_headers).json()) == 2
+
+    client.delete(f"/api/issues/{issue_id}", headers=auth_headers)
+    assert [issue["title"] for issue in client.get(url, headers=auth_headers).json()] == ["Second"]
+
+
+def test_cached_page_still_checks_membership(client, auth_headers, make_project, make_issue):
+    project_id = make_project("LC4")
+    make_issue(project_id)
+    url = f"/api/projects/{project_id}/issues"
+    client.get(url, headers=auth_headers)
+
+    client.post("/api/auth/signup", json={"name": "Outsider", "email": "cache-outsider@example.com", "password": "password123"})
+    token = client.post("/api/auth/login", json={"email": "cache-outsider@example.com", "password": "password123"}).json()["access_token"]
+    assert client.get(url, headers={"Authorization": f"Bearer {token}"}).status_code == 403
+
+
+def test_cache_metrics(client, auth_headers, make_project):
+    project_id = make_project("LC5")
+    client.get(f"/api/projects/{project_id}/issues", headers=auth_headers)
+    client.get(f"/api/projects/{project_id}/issues", headers=auth_headers)
+    body = client.get("/api/metrics").text
+    assert "issue_list_cache_hit_ratio " in body
+    bytes_line = next(line for line in body.splitlines() if line.startswith("issue_list_cache_bytes "))
+    assert int(bytes_line.split()[1]) > 0
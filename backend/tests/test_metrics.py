@@ -0,0 +1,46 @@
+def scrape(client):
+    response = client.get("/api/metrics")
+    assert response.status_code == 200
+    assert response.headers["content-type"].startswith("text/plain; version=0.0.4")
+    return response.text
+
+
+def sample(text, name, **labels):
+    wanted = ",".join(f'{key}="{value}"' for key, value in labels.items())
+    prefix = f"{name}{{{wanted}}} " if labels else f"{name} "
+    for line in text.splitlines():
+        if line.startswith(prefix):
+            return float(line[len(prefix):])
+    return None
+
+
+def test_route_latency_and_status_counters(client, auth_headers, make_project):
+    project_id = make_project("MET1")
+    route = "/api/projects/{project_id}/issues"
+    before = sample(scrape(client), "http_request_duration_seconds_count", method="GET", route=route) or 0
+
+    client.get(f"/api/projects/{project_id}/issues", headers=auth_headers)
+    client.get("/api/projects/999999/issues", headers=auth_headers)
+
+    text = scrape(client)
+    assert sample(text, "http_request_duration_seconds_count", method="GET", route=route) == before + 2
+    assert sample(text, "http_request_duration_seconds_bucket", method="GET", route=route, le="+Inf") == before + 2
+    assert sample(text, "http_requests_total", method="GET", route=route, status="4xx") >= 1
+    assert sample(text, "http_request_db_statements_total", method="GET", route=route) > 0
+
+
+def test_gauges_are_exported(client):
+    text = scrape(client)
+    # The scrape itself is in flight while the page is rendered
+    assert sample(text, "http_requests_in_flight") == 1
+    assert sample(text, "db_pool_checked_out") is not None
+    assert sample(text, "authz_cache_hits_total") is not None
+    assert "# TYPE http_request_duration_seconds histogram" in text
+
+
+def test_unknown_paths_share_one_label_set(client):
+    client.get("/api/does-not-exist")
+    client.get("/api/also-missing")
+    text = scrape(client)
+    assert "does-not-exist" not in text
+    assert sample(text, "http_requests_total", method="", route="unmatched", status="4xx") >= 2
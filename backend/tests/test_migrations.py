@@ -0,0 +1,115 @@
+from pathlib import Path
+
+import pytest
+from alembic import command
+from alembic.config import Config
+from sqlalchemy import create_engine, func, inspect, select
+
+from app.db.base import Base
+from app.models import Issue, IssueStatus, ProjectMember
+
+BACKEND_DIR = Path(__file__).parent.parent
+
+
+@pytest.fixture
+def migrated_engine(tmp_path):
+    engine = create_engine(f"sqlite:///{tmp_path / 'migrated.db'}")
+    config = Config(str(BACKEND_DIR / "alembic.ini"))
+    config.set_main_option("script_location", str(BACKEND_DIR / "alembic"))
+    with engine.begin() as connection:
+        config.attributes["connection"] = connection
+        command.upgrade(config, "head")
+    yield engine
+    with engine.begin() as connection:
+        config.attributes["connection"] = connection
+        command.downgrade(config, "base")
+    assert set(inspect(engine).get_table_names()) <= {"alembic_version"}
+    engine.dispose()
+
+
+def query_plan(engine, statement):
+    sql = str(statement.compile(engine, compile_kwargs={"literal_binds": True}))
+    with engine.connect() as conn:
+        return " | ".join(row[-1] for row in conn.exec_driver_sql(f"EXPLAIN QUERY PLAN {sql}"))
+
+
+def test_migrations_match_models(migrated_engine):
+    inspector = inspect(migrated_engine)
+    for table in Base.metadata.sorted_tables:
+        columns = {column["name"] for column in inspector.get_columns(table.name)}
+        assert columns == set(table.columns.keys()), table.name
+        indexes = {index["name"] for index in inspector.get_indexes(table.name)}
+        assert indexes == {index.name for index in table.indexes}, table.name
+
+
+def test_list_issues_uses_project_index(migrated_engine):
+    plan = query_plan(migrated_engine, (
+        select(Issue).where(Issue.project_id == 1)
+        .order_by(Issue.created_at.desc(), Issue.id.desc()).limit(20)
+    ))
+    assert "ix_issues_project_id_created_at" in plan
+    assert "TEMP B-TREE" not in plan
+
+    plan = query_plan(migrated_engine, (
+        select(Issue).where(Issue.project_id == 1)
+        .order_by(Issue.updated_at.asc(), Issue.id.asc()).limit(20)
+    ))
+    assert "ix_issues_project_id_updated_at" in plan
+    assert "TEMP B-TREE" not in plan
+
+
+def test_filtered_list_issues_uses_composite_index(migrated_engine):
+    plan = query_plan(migrated_engine, (
+        select(Issue).where(Issue.project_id == 1, Issue.status == IssueStatus.open)
+        .order_by(Issue.created_at.desc(), Issue.id.desc()).limit(20)
+    ))
+    assert "ix_issues_project_id_status_created_at" in plan
+    assert "TEMP B-TREE" not in plan
+
+
+def test_count_queries_use_covering_indexes(migrated_engine):
+    plan = query_plan(migrated_engine, select(func.count()).select_from(Issue).where(Issue.project_id == 1))
+    assert "COVERING INDEX ix_issues_project_id" in plan
+
+    plan = query_plan(migrated_engine, (
+        select(func.count()).select_from(ProjectMember).where(ProjectMember.user_id == 1)
+    ))
+    assert "COVERING INDEX ix_project_members_user_id" in plan
+
+
+def test_keyset_page_seeks_into_index(migrated_engine):
+    from app.core.pagination import keyset_after, keyset_column
+
+    column = keyset_column(Issue.created_at, "sqlite")
+    plan = query_plan(migrated_engine, (
+        select(Issue).where(Issue.project_id == 1)
+        .where(keyset_after(column, Issue.id, "2025-01-01 00:00:00", 10, descending=True, dialect_name="sqlite"))
+        .order_by(Issue.created_at.desc(), Issue.id.desc()).limit(20)
+    ))
+    assert "USING INDEX ix_issues_project_id_created_at (project_id=? AND created_at<?)" in plan
+
+
+def test_issue_changes_seek_into_index(migrated_engine):
+    from app.core.pagination import keyset_after
+
+    plan = query_plan(migrated_engine, (
+        select(Issue).where(Issue.project_id == 1)
+        .where(keyset_after(Issue.changed_version, Issue.id, 40, 7, descending=False, dialect_name="sqlite"))
+        .order_by(Issue.changed_version.asc(), Issue.id.asc()).limit(500)
+    ))
+    assert "USING INDEX ix_issues_project_id_changed_version (project_id=? AND changed_version>?)" in plan
+    assert "TEMP B-TREE" not in plan
+
+
+def test_project_state_counts_use_covering_index(migrated_engine):
+    from sqlalchemy import case
+
+    plan = query_plan(migrated_engine, (
+        select(
+            Issue.project_id,
+            func.count(),
+            func.sum(case((Issue.status == IssueStatus.open, 1), else_=0)),
+            func.sum(case((Issue.expected_completion_date < "2026-01-01", 1), else_=0)),
+        ).where(Issue.project_id.in_([1, 2])).group_by(Issue.project_id)
+    ))
+    assert "COVERING INDEX ix_issues_project_id_status_expected_completion_date" in plan
@@ -27,6 +27,25 @@ def test_list_projects(client, auth_headers):
     assert "issue_count" in data[0]
     assert "member_count" in data[0]
 
+def test_list_projects_counts(client, auth_headers, make_project, make_issue):
+    project_id = make_project("CNT")
+    client.post("/api/auth/signup", json={"name": "Counter", "email": "counter@example.com", "password": "password123"})
+    client.post(f"/api/projects/{project_id}/members", headers=auth_headers,
+                json={"email": "counter@example.com", "role": "member"})
+    make_issue(project_id, title="Open")
+    make_issue(project_id, title="Late", expected_completion_date="2020-01-01T00:00:00Z")
+    started = make_issue(project_id, title="Started", expected_completion_date="2020-01-01T00:00:00Z")
+    client.patch(f"/api/issues/{started}", headers=auth_headers, json={"status": "in_progress"})
+    done = make_issue(project_id, title="Done late", expected_completion_date="2020-01-01T00:00:00Z")
+    client.patch(f"/api/issues/{done}", headers=auth_headers, json={"status": "resolved"})
+    make_issue(project_id, title="Not due", expected_completion_date="2999-01-01T00:00:00Z")
+    empty_id = make_project("CNT2")
+    
+    projects = {project["id"]: project for project in client.get("/api/projects", headers=auth_headers).json()}
+    counts = ("issue_count", "member_count", "open_count", "in_progress_count", "overdue_count")
+    assert tuple(projects[project_id][name] for name in counts) == (5, 2, 3, 1, 2)
+    assert tuple(projects[empty_id][name] for name in counts) == (0, 1, 0, 0, 0)
+
 def test_get_project(client, auth_headers):
     # Create project
     create_response = client.post("/api/projects", headers=auth_headers, json={
@@ -0,0 +1,124 @@
+"""Statement budgets per endpoint; a new query in a loop should fail here first."""
+import logging
+
+from app.core.authz import membership_cache
+from app.core.deps import token_cache
+
+
+def cold_caches():
+    membership_cache.clear()
+    token_cache.clear()
+
+
+def test_list_issues_budget(client, auth_headers, make_project, make_issue, query_budget):
+    project_id = make_project("QB1")
+    for i in range(20):
+        make_issue(project_id, title=f"Issue {i}")
+
+    cold_caches()
+    # Membership, the project version for the ETag, and the page
+    with query_budget(3):
+        response = client.get(f"/api/projects/{project_id}/issues", headers=auth_headers)
+    assert len(response.json()) == 20
+
+
+def test_list_issues_budget_does_not_grow_with_page_size(client, auth_headers, make_project, make_issue, query_budget):
+    project_id = make_project("QB2")
+    make_issue(project_id)
+    with query_budget(3) as small:
+        client.get(f"/api/projects/{project_id}/issues", headers=auth_headers)
+    for i in range(10):
+        make_issue(project_id, title=f"Issue {i}")
+    with query_budget(small.count) as large:
+        client.get(f"/api/projects/{project_id}/issues", headers=auth_headers)
+    assert large.count == small.count
+
+
+def test_get_issue_budget(client, auth_headers, make_project, make_issue, query_budget):
+    project_id = make_project("QB3")
+    issue_id = make_issue(project_id)
+    client.post(f"/api/issues/{issue_id}/comments", headers=auth_headers, json={"body": "First"})
+
+    cold_caches()
+    # Issue version, membership and the issue with its users
+    with query_budget(3):
+        response = client.get(f"/api/issues/{issue_id}", headers=auth_headers)
+    assert response.status_code == 200
+
+    # A revalidation stops before loading the issue
+    cold_caches()
+    with query_budget(2) as stats:
+        response = client.get(f"/api/issues/{issue_id}", headers={**auth_headers, "If-None-Match": response.headers["ETag"]})
+    assert response.status_code == 304
+    assert not any("JOIN users" in sql for sql in stats.statements)
+
+
+def test_list_comments_budget(client, auth_headers, make_project, make_issue, query_budget):
+    project_id = make_project("QB4")
+    issue_id = make_issue(project_id)
+    for i in range(10):
+        client.post(f"/api/issues/{issue_id}/comments", headers=auth_headers, json={"body": f"Comment {i}"})
+
+    cold_caches()
+    with query_budget(3):
+        response = client.get(f"/api/issues/{issue_id}/comments", headers=auth_headers)
+    assert len(response.json()) == 10
+
+
+def test_create_and_update_issue_budget(client, auth_headers, make_project, make_issue, query_budget):
+    project_id = make_project("QB5")
+    # Each write also bumps the version counters behind the ETags
+    with query_budget(5):
+        issue_id = make_issue(project_id)
+    with query_budget(6):
+        response = client.patch(f"/api/issues/{issue_id}", headers=auth_headers, json={"status": "in_progress"})
+    assert response.status_code == 200
+
+
+def test_list_projects_budget(client, auth_headers, make_project, make_issue, query_budget):
+    seen = []
+    for key in ("QB7", "QB8", "QB9"):
+        make_issue(make_project(key))
+        with query_budget(1) as stats:
+            response = client.get("/api/projects", headers=auth_headers)
+        seen.append((len(response.json()), stats.count))
+    # One grouped query for the projects and all their counts, however many projects there are
+    assert [count for _, count in seen] == [1, 1, 1]
+    assert seen[2][0] == seen[0][0] + 2
+
+
+def test_server_timing_header(client, auth_headers, make_project):
+    project_id = make_project("QB6")
+    response = client.get(f"/api/projects/{project_id}/issues", headers=auth_headers)
+    timing = response.headers["Server-Timing"]
+    assert timing.startswith("db;dur=")
+    assert 'desc="' in timing and 'queries"' in timing
+
+
+def test_repeated_statements_are_fingerprinted():
+    from app.db.instrumentation import QueryStats, fingerprint
+
+    assert fingerprint("SELECT * FROM t WHERE id IN (?, ?, ?)") == fingerprint("SELECT *\n FROM t WHERE id IN (?)")
+    stats = QueryStats()
+    for _ in range(3):
+        stats.record("SELECT count(*) FROM issues WHERE project_id = ?", 0.001)
+    stats.record("SELECT * FROM projects", 0.001)
+    assert stats.count == 4
+    assert stats.repeated(2) == [("SELECT count(*) FROM issues WHERE project_id = ?", 3)]
+    # Pages of one batch write aren't a query in a loop
+    for _ in range(3):
+        stats.record("INSERT INTO issues (title) VALUES (?), (?) RETURNING id", 0.001)
+    assert stats.repeated(2) == [("SELECT count(*) FROM issues WHERE project_id = ?", 3)]
+
+
+def test_batch_create_is_not_reported_as_repeated(client, auth_headers, make_project, caplog):
+    from app.schemas.issue import BATCH_MAX_ISSUES
+
+    project_id = make_project("QB10")
+    # Enough rows for the INSERT to go out in several pages
+    items = [{"title": f"Issue {i}"} for i in range(BATCH_MAX_ISSUES)]
+    with caplog.at_level(logging.WARNING, logger="app.db.instrumentation"):
+        response = client.post(f"/api/projects/{project_id}/issues:batch", headers=auth_headers, json={"issues": items})
+    assert response.json()["succeeded"] == BATCH_MAX_ISSUES
+    assert "db-repeated" not in response.headers["Server-Timing"]
+    assert not caplog.records
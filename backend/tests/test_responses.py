@@ -0,0 +1,48 @@
+import json
+from datetime import datetime, timezone
+from typing import List
+
+from app.core import responses
+from app.core.responses import FastJSONResponse, json_adapter
+from app.models import Comment
+from app.schemas.comment import Comment as CommentSchema
+
+
+def stdlib_json(content) -> bytes:
+    # What FastAPI's JSONResponse writes
+    return json.dumps(content, ensure_ascii=False, allow_nan=False, indent=None, separators=(",", ":")).encode("utf-8")
+
+
+def test_adapter_output_matches_response_model_pipeline():
+    adapter = json_adapter(List[CommentSchema])
+    assert json_adapter(List[CommentSchema]) is adapter
+
+    comments = adapter.validate_python([
+        {"id": 1, "issue_id": 2, "author_id": 3, "body": "Grüße ✓", "created_at": datetime(2024, 5, 6, 7, 8, 9, 123)},
+        {"id": 2, "issue_id": 2, "author_id": 3, "body": "tz", "created_at": datetime(2024, 5, 6, tzinfo=timezone.utc),
+         "author": {"id": 3, "name": "A", "email": "a@example.com", "created_at": datetime(2024, 1, 1)}},
+    ])
+    expected = stdlib_json(adapter.dump_python(comments, mode="json"))
+    assert FastJSONResponse(comments, adapter=adapter).body == expected
+
+
+def test_render_without_adapter(monkeypatch):
+    content = {"name": "Ünïcode", "items": [1, 2, None], "ok": True}
+    assert FastJSONResponse(content).body == stdlib_json(content)
+    monkeypatch.setattr(responses, "orjson", None)
+    assert FastJSONResponse(content).body == stdlib_json(content)
+
+
+def test_list_comments_json_unchanged(client, auth_headers, db_session, make_project, make_issue):
+    project_id = make_project("FJS")
+    issue_id = make_issue(project_id)
+    for body in ("first", "sécond", "third"):
+        client.post(f"/api/issues/{issue_id}/comments", headers=auth_headers, json={"body": body})
+
+    response = client.get(f"/api/issues/{issue_id}/comments", headers=auth_headers)
+    assert response.status_code == 200
+    assert response.headers["content-type"] == "application/json"
+
+    comments = db_session.query(Comment).filter(Comment.issue_id == issue_id).order_by(Comment.created_at).all()
+    expected = stdlib_json([CommentSchema.model_validate(comment).model_dump(mode="json") for comment in comments])
+    assert response.content == expected
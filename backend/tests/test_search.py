@@ -0,0 +1,69 @@
+from scripts.reindex_search import reindex
+
+from conftest import engine
+
+
+def search(client, auth_headers, project_id, q):
+    response = client.get(f"/api/projects/{project_id}/issues/search", headers=auth_headers, params={"q": q})
+    assert response.status_code == 200
+    return response.json()
+
+
+def test_search_ranks_titles_over_descriptions(client, auth_headers, make_project, make_issue):
+    project_id = make_project("SRCH")
+    in_description = make_issue(project_id, "Checkout page", description="Crashes with a timeout on submit")
+    in_title = make_issue(project_id, "Timeout when saving drafts", description="Happens every time")
+    make_issue(project_id, "Unrelated", description="Nothing to see")
+
+    results = search(client, auth_headers, project_id, "timeout")
+    assert [result["id"] for result in results] == [in_title, in_description]
+    assert results[0]["rank"] >= results[1]["rank"]
+    assert "**Timeout**" in results[0]["snippet"]
+    assert results[0]["reporter"]["email"]
+
+
+def test_search_covers_comments_and_stays_in_sync(client, auth_headers, make_project, make_issue):
+    project_id = make_project("SYNC")
+    issue_id = make_issue(project_id, "Login fails")
+
+    assert search(client, auth_headers, project_id, "kerberos") == []
+    client.post(f"/api/issues/{issue_id}/comments", headers=auth_headers, json={"body": "Only with Kerberos tickets"})
+    assert [result["id"] for result in search(client, auth_headers, project_id, "kerberos")] == [issue_id]
+
+    client.patch(f"/api/issues/{issue_id}", headers=auth_headers, json={"title": "SSO handshake fails"})
+    assert search(client, auth_headers, project_id, "login") == []
+    assert [result["id"] for result in search(client, auth_headers, project_id, "handshake")] == [issue_id]
+
+    client.delete(f"/api/issues/{issue_id}", headers=auth_headers)
+    assert search(client, auth_headers, project_id, "handshake") == []
+
+
+def test_search_is_scoped_to_project(client, auth_headers, make_project, make_issue):
+    first = make_project("SCPA")
+    second = make_project("SCPB")
+    make_issue(first, "Memory leak in worker")
+    leak = make_issue(second, "Memory leak in scheduler")
+
+    assert [result["id"] for result in search(client, auth_headers, second, "memory leak")] == [leak]
+
+
+def test_list_issues_q_uses_search_index(client, auth_headers, make_project, make_issue):
+    project_id = make_project("LSTQ")
+    match = make_issue(project_id, "Dark mode", description="Colours are inverted on settings pages")
+    make_issue(project_id, "Light mode")
+
+    response = client.get(f"/api/projects/{project_id}/issues", headers=auth_headers, params={"q": "invert"})
+    assert [issue["id"] for issue in response.json()] == [match]
+    response = client.get(f"/api/projects/{project_id}/issues", headers=auth_headers, params={"q": '"*'})
+    assert response.json() == []
+
+
+def test_reindex_restores_index(client, auth_headers, make_project, make_issue):
+    project_id = make_project("RIDX")
+    issue_id = make_issue(project_id, "Flaky integration test")
+    with engine.begin() as conn:
+        conn.exec_driver_sql("DELETE FROM issue_search")
+    assert search(client, auth_headers, project_id, "flaky") == []
+
+    reindex(engine)
+    assert [result["id"] for result in search(client, auth_headers, project_id, "flaky")] == [issue_id]
@@ -0,0 +1,49 @@
+from sqlalchemy import create_engine, func, select
+
+from app.models import Comment, Issue, Project, ProjectMember, User
+from scripts.seed import parse_count, seed_scale
+
+
+def test_parse_count():
+    assert parse_count("50k") == 50000
+    assert parse_count("5M") == 5000000
+    assert parse_count("1.5k") == 1500
+    assert parse_count("20") == 20
+
+
+def load(tmp_path, name):
+    engine = create_engine(f"sqlite:///{tmp_path / name}")
+    seed_scale(engine, users=30, projects=4, issues=200, comments=600, seed=7, batch_size=50)
+    return engine
+
+
+def test_seed_scale_counts_and_determinism(tmp_path):
+    first = load(tmp_path, "a.db")
+    second = load(tmp_path, "b.db")
+
+    with first.connect() as conn:
+        assert conn.scalar(select(func.count()).select_from(User)) == 30
+        assert conn.scalar(select(func.count()).select_from(Project)) == 4
+        assert conn.scalar(select(func.count()).select_from(Issue)) == 200
+        assert conn.scalar(select(func.count()).select_from(Comment)) == 600
+        assert conn.scalar(select(func.sum(Issue.comment_count))) == 600
+        # Hot projects get the most issues
+        per_project = conn.execute(
+            select(Issue.project_id, func.count()).group_by(Issue.project_id).order_by(Issue.project_id)
+        ).all()
+        assert per_project[0][1] > per_project[-1][1]
+        # Reporters are members of the issue's project
+        outsiders = conn.scalar(
+            select(func.count()).select_from(Issue).outerjoin(
+                ProjectMember,
+                (ProjectMember.project_id == Issue.project_id) & (ProjectMember.user_id == Issue.reporter_id),
+            ).where(ProjectMember.user_id.is_(None))
+        )
+        assert outsiders == 0
+        # The search index is rebuilt after the load
+        assert conn.exec_driver_sql("SELECT count(*) FROM issue_search").scalar() == 200
+        rows_a = conn.execute(select(Issue.title, Issue.status, Issue.comment_count).order_by(Issue.id)).all()
+
+    with second.connect() as conn:
+        rows_b = conn.execute(select(Issue.title, Issue.status, Issue.comment_count).order_by(Issue.id)).all()
+    assert rows_a == rows_b
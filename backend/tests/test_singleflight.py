@@ -0,0 +1,150 @@
+"""Identical concurrent reads share one computation."""
+import asyncio
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+from sqlalchemy import event
+from sqlalchemy.util import await_only
+from sqlalchemy.util.concurrency import in_greenlet
+
+from app.core.list_cache import issue_list_cache
+from app.core.singleflight import CoalescingTimeout, SingleFlight, read_coalescer
+
+CALLERS = 8
+
+
+def run_together(fn, callers=CALLERS):
+    """Call ``fn`` from ``callers`` threads released at the same moment; returns results or exceptions."""
+    barrier = threading.Barrier(callers)
+
+    def call():
+        barrier.wait()
+        try:
+            return fn()
+        except Exception as exc:
+            return exc
+
+    with ThreadPoolExecutor(callers) as pool:
+        return list(pool.map(lambda _: call(), range(callers)))
+
+
+def test_concurrent_calls_share_one_execution():
+    flight = SingleFlight(timeout=5)
+    calls = []
+
+    def compute():
+        calls.append(1)
+        time.sleep(0.2)
+        return object()
+
+    results = run_together(lambda: flight.do("key", compute))
+    assert len(calls) == 1
+    assert all(result is results[0] for result in results)
+    assert (flight.executions, flight.shared) == (1, CALLERS - 1)
+    assert flight.in_flight() == 0
+
+    # Finished computations are not reused
+    flight.do("key", compute)
+    assert len(calls) == 2
+
+
+def test_errors_reach_every_waiter():
+    flight = SingleFlight(timeout=5)
+
+    def fail():
+        time.sleep(0.2)
+        raise ValueError("boom")
+
+    results = run_together(lambda: flight.do("key", fail))
+    assert all(isinstance(result, ValueError) for result in results)
+    assert flight.executions == 1
+    assert flight.in_flight() == 0
+
+
+def test_waiters_give_up_after_timeout():
+    flight = SingleFlight(timeout=0.05)
+    release = threading.Event()
+    leader = threading.Thread(target=flight.do, args=("key", lambda: release.wait(5)))
+    leader.start()
+    while not flight.in_flight():
+        time.sleep(0.001)
+
+    with pytest.raises(CoalescingTimeout):
+        flight.do("key", lambda: "not run")
+    assert flight.timeouts == 1
+    release.set()
+    leader.join()
+
+
+@pytest.fixture
+def slow_statement(db_engines):
+    """Make statements containing a marker take 200 ms, and count them."""
+    seen = []
+
+    def slow(marker):
+        def before(conn, cursor, statement, parameters, context, executemany):
+            if marker in statement:
+                seen.append(statement)
+                if in_greenlet():
+                    # Async stack: wait the way the driver would, without blocking the event loop
+                    await_only(asyncio.sleep(0.2))
+                else:
+                    time.sleep(0.2)
+        for engine in db_engines:
+            event.listen(engine, "before_cursor_execute", before)
+            slow.listeners.append((engine, before))
+        return seen
+
+    slow.listeners = []
+    yield slow
+    for engine, before in slow.listeners:
+        event.remove(engine, "before_cursor_execute", before)
+
+
+def test_list_issues_runs_one_query_for_concurrent_requests(client, auth_headers, make_project, make_issue, slow_statement):
+    project_id = make_project("SF1")
+    for i in range(3):
+        make_issue(project_id, title=f"Issue {i}")
+    url = f"/api/projects/{project_id}/issues"
+    client.get(url, headers=auth_headers)  # warm the membership cache
+    issue_list_cache.clear()
+
+    executions = read_coalescer.executions
+    seen = slow_statement("JOIN users AS reporter")
+    responses = run_together(lambda: client.get(url, headers=auth_headers))
+    assert len(seen) == 1
+    assert read_coalescer.executions == executions + 1
+    assert {response.status_code for response in responses} == {200}
+    assert len({response.content for response in responses}) == 1
+
+
+def test_get_project_runs_one_load_for_concurrent_requests(client, auth_headers, make_project, slow_statement):
+    project_id = make_project("SF2")
+    url = f"/api/projects/{project_id}"
+    client.get(url, headers=auth_headers)
+
+    seen = slow_statement("FROM project_members")
+    responses = run_together(lambda: client.get(url, headers=auth_headers))
+    assert len(seen) == 1
+    assert [response.json()["key"] for response in responses] == ["SF2"] * CALLERS
+
+
+def test_errors_propagate_to_coalesced_requests(client, auth_headers, make_project, make_issue, slow_statement, monkeypatch):
+    from app.api.endpoints import issues
+
+    project_id = make_project("SF3")
+    make_issue(project_id)
+    url = f"/api/projects/{project_id}/issues"
+    client.get(url, headers=auth_headers)
+    issue_list_cache.clear()
+
+    def broken(row):
+        raise RuntimeError("serialization failed")
+
+    monkeypatch.setattr(issues, "_issue_list_item", broken)
+    seen = slow_statement("JOIN users AS reporter")
+    results = run_together(lambda: client.get(url, headers=auth_headers))
+    assert len(seen) == 1
+    assert all(isinstance(result, RuntimeError) for result in results)
@@ -14,6 +14,9 @@ export interface Project {
   members?: ProjectMember[];
   issue_count?: number;
   member_count?: number;
+  open_count?: number;
+  in_progress_count?: number;
+  overdue_count?: number;
 }
 
 export interface ProjectMember {